@@ -8,13 +8,11 @@ Vertex AI API 사용 (Google Cloud Platform)
 import os
 import json
 import re
-from typing import List, Dict, Optional, Tuple
-import httpx
+from typing import List, Dict, Tuple
 
 # Vertex AI 임포트
 import vertexai
-from vertexai.generative_models import GenerativeModel, Part, Tool
-from google.cloud import aiplatform
+from vertexai.generative_models import GenerativeModel
 
 # Vertex AI 초기화 함수
 def init_vertex_ai():
@@ -47,8 +45,6 @@ from .prompts import (
     get_content_planner_prompt,
     get_visual_designer_prompt,
     get_quality_assurance_prompt,
-    TONE_MAPPING,
-    STYLE_GUIDELINES,
     PAGE_STRUCTURE_GUIDE,
     HOW_TO_PAGE_STRUCTURE,
 )
@@ -5,12 +5,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 import os
-from dotenv import load_dotenv
 
 from . import models, schemas
 from .database import get_db
+from .env import load_env
 
-load_dotenv()
+load_env()
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
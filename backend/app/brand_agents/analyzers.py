@@ -38,7 +38,8 @@ class TextAnalyzerAgent:
                 "enthusiasm_score": int,
                 "signature_phrases": List[str],
                 "emoji_usage": Dict[str, Any],
-                "keyword_frequency": Dict[str, int]
+                "keyword_frequency": Dict[str, int],
+                "brand_identity": Dict[str, Any]  # Synthesizer가 재사용
             }
         """
         try:
@@ -93,10 +94,30 @@ class TextAnalyzerAgent:
   "keyword_frequency": {{
     "키워드1": 빈도수,
     "키워드2": 빈도수
+  }},
+  "brand_identity": {{
+    "brand_name": "브랜드명 (콘텐츠에서 반복 언급되는 이름, 없으면 null)",
+    "business_type": "업종 - 반드시 다음 중 하나만 선택: food, fashion, health, education, tech, retail, service",
+    "brand_personality": "브랜드 성격을 2-3문장으로 설명",
+    "brand_values": ["브랜드 가치 1", "가치 2", "가치 3"],
+    "target_audience": "타겟 고객 - 반드시 구체적으로 (예: 20-30대 직장인 여성)",
+    "emotional_tone": "감정적 톤 (예: 따뜻한, 유머러스한, 진지한)"
   }}
 }}
 
-**중요**: 반드시 위 JSON 형식으로만 응답하세요. 추가 설명은 포함하지 마세요.
+**brand_identity.business_type 분류 기준:**
+- food: 음식점, 카페, 베이커리, 식음료 관련
+- fashion: 패션, 뷰티, 화장품, 의류 관련
+- health: 헬스, 피트니스, 요가, 운동, 건강 관련
+- education: 학원, 교육, 강의, 학습 관련
+- tech: IT, 소프트웨어, 기술, 개발 관련
+- retail: 소매, 유통, 쇼핑몰, 제품 판매 관련
+- service: 서비스업 전반 (위 카테고리에 해당하지 않는 모든 서비스)
+
+**중요**:
+1. 반드시 위 JSON 형식으로만 응답하세요. 추가 설명은 포함하지 마세요.
+2. business_type은 반드시 위 7개 중 하나의 영문 코드만 사용하세요.
+3. target_audience는 '전체', '모든 연령' 같은 모호한 답변 금지. 반드시 연령대나 특성을 포함하세요.
 """
 
             analysis_result = await self.vertex_client.generate_json(prompt, temperature=0.3)
@@ -8,7 +8,6 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
-from datetime import datetime
 
 from ..services.youtube_service import YouTubeService
 from ..services.instagram_service import InstagramService
@@ -159,9 +158,7 @@ class InstagramCollectorAgent(PlatformCollectorAgent):
             return collected_posts
 
         except Exception as e:
-            logger.error(f"❌ [Instagram Collector] 수집 실패: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ [Instagram Collector] 수집 실패: {e}", exc_info=True)
             return []
 
 
@@ -280,9 +277,7 @@ class YouTubeCollectorAgent(PlatformCollectorAgent):
             return collected_videos
 
         except Exception as e:
-            logger.error(f"❌ [YouTube Collector] 수집 실패: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ [YouTube Collector] 수집 실패: {e}", exc_info=True)
             return []
 
 
@@ -421,7 +416,5 @@ class ThreadsCollectorAgent(PlatformCollectorAgent):
             return collected_posts
 
         except Exception as e:
-            logger.error(f"❌ [Threads Collector] 수집 실패: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"❌ [Threads Collector] 수집 실패: {e}", exc_info=True)
             return []
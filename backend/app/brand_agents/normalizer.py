@@ -5,7 +5,7 @@ Data Normalizer
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 from .schemas import UnifiedContent, MediaInfo, EngagementMetrics
 
@@ -17,6 +17,14 @@ logger = logging.getLogger(__name__)
 class DataNormalizer:
     """플랫폼별 데이터를 통합 형식으로 정규화"""
 
+    def __init__(self):
+        # 플랫폼별 정규화 함수 (if/elif 분기 대신 dict 조회)
+        self._handlers = {
+            'instagram': self._normalize_instagram,
+            'youtube': self._normalize_youtube,
+            'threads': self._normalize_threads
+        }
+
     def normalize(self, raw_data: Dict[str, Any]) -> UnifiedContent:
         """
         원시 데이터를 UnifiedContent로 변환
@@ -29,15 +37,23 @@ class DataNormalizer:
         """
         platform = raw_data.get('platform', 'unknown')
 
-        if platform == 'instagram':
-            return self._normalize_instagram(raw_data)
-        elif platform == 'youtube':
-            return self._normalize_youtube(raw_data)
-        elif platform == 'threads':
-            return self._normalize_threads(raw_data)
-        else:
+        handler = self._handlers.get(platform)
+        if handler is None:
             logger.warning(f"⚠️ 알 수 없는 플랫폼: {platform}")
             return self._normalize_generic(raw_data)
+        return handler(raw_data)
+
+    def normalize_batch(self, raw_list: List[Dict[str, Any]]) -> List[UnifiedContent]:
+        """
+        원시 데이터 리스트를 한 번에 UnifiedContent 리스트로 변환
+
+        Args:
+            raw_list: 플랫폼별 원시 데이터 리스트
+
+        Returns:
+            UnifiedContent 리스트 (입력 순서 유지)
+        """
+        return list(map(self.normalize, raw_list))
 
     def _normalize_instagram(self, data: Dict[str, Any]) -> UnifiedContent:
         """인스타그램 데이터 정규화"""
@@ -6,16 +6,72 @@ Multi-Agent Pipeline의 메인 조율자
 
 import logging
 import asyncio
-from typing import Dict, Optional, List
-from datetime import datetime
+import functools
+import itertools
+from typing import Any, Coroutine, Dict, Optional, List, Tuple
+from datetime import datetime, timezone
 from .collectors import InstagramCollectorAgent, YouTubeCollectorAgent, ThreadsCollectorAgent
 from .normalizer import DataNormalizer
 from .analyzers import TextAnalyzerAgent, VisualAnalyzerAgent, EngagementAnalyzerAgent
-from .synthesizer import BrandProfileSynthesizer
-from .schemas import BrandProfile, UnifiedContent, MediaInfo, BrandProfileSource, ConfidenceLevel
+from .synthesizer import get_brand_profile_synthesizer
+from .schemas import BrandProfile, UnifiedContent, MediaInfo, ManualSampleMeta, BrandProfileSource, ConfidenceLevel
 
 logger = logging.getLogger(__name__)
 
+# 플랫폼 키 → (로그 라벨, Collector 클래스)
+# Collector는 db/user_id가 필요하므로 런타임에 생성됨
+PLATFORM_COLLECTORS = (
+    ('instagram', 'Instagram', InstagramCollectorAgent),
+    ('youtube', 'YouTube', YouTubeCollectorAgent),
+    ('threads', 'Threads', ThreadsCollectorAgent),
+)
+
+_SEP = "=" * 80
+_RULE = "-" * 80
+
+
+def _log_banner(*lines: str):
+    """시작/완료 배너를 하나의 로그 레코드로 출력"""
+    logger.info("\n".join((_SEP, *lines, _SEP)))
+
+
+def _log_layer(title: str, *lines: str):
+    """Layer 헤더(및 부가 라인)를 하나의 로그 레코드로 출력"""
+    logger.info("\n".join(("", title, _RULE, *lines)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _sample_media(media_type: str, path: str) -> MediaInfo:
+    """수동 샘플용 단일 파일 MediaInfo (불변이므로 동일 경로는 인스턴스 재사용)"""
+    return MediaInfo(type=media_type, urls=(path,), count=1)
+
+
+# 공유 Agent 인스턴스 (Normalizer, Analyzers, Synthesizer)
+_shared_agents: Optional[Dict[str, Any]] = None
+
+
+def _get_shared_agents() -> Dict[str, Any]:
+    """
+    Layer 2~4 Agent 싱글톤 반환
+
+    Analyzer/Synthesizer는 생성 시 Vertex AI 클라이언트를 초기화하므로
+    import 시점이 아닌 첫 Pipeline 생성 시점에 한 번만 만든다.
+    """
+    global _shared_agents
+
+    if _shared_agents is None:
+        _shared_agents = {
+            'normalizer': DataNormalizer(),
+            'analyzers': {
+                'text': TextAnalyzerAgent(),
+                'visual': VisualAnalyzerAgent(),
+                'engagement': EngagementAnalyzerAgent()
+            },
+            'synthesizer': get_brand_profile_synthesizer()
+        }
+
+    return _shared_agents
+
 
 class BrandAnalysisPipeline:
     """
@@ -38,18 +94,38 @@ class BrandAnalysisPipeline:
         # Layer 1: Collectors (모든 Collector는 런타임에 생성)
         # Instagram, YouTube, Threads는 OAuth 연동 기반으로 런타임에 생성됨
 
-        # Layer 2: Normalizer
-        self.normalizer = DataNormalizer()
+        # Layer 2~4: 상태가 없는 Agent는 요청 간 공유
+        shared = _get_shared_agents()
+        self.normalizer = shared['normalizer']
+        self.analyzers = shared['analyzers']
+        self.synthesizer = shared['synthesizer']
 
-        # Layer 3: Analyzers
-        self.analyzers = {
-            'text': TextAnalyzerAgent(),
-            'visual': VisualAnalyzerAgent(),
-            'engagement': EngagementAnalyzerAgent()
-        }
+    async def _analyze(self, unified_contents: List[UnifiedContent]) -> Tuple[Dict, Dict, Dict]:
+        """
+        Layer 3 분석 Agent 병렬 실행
 
-        # Layer 4: Synthesizer
-        self.synthesizer = BrandProfileSynthesizer()
+        미디어가 없는 콘텐츠만 있으면 VisualAnalyzer가 텍스트 기반으로
+        비주얼 스타일/색상을 추론한다.
+
+        Returns:
+            (text_analysis, visual_analysis, engagement_analysis)
+        """
+        _log_layer(
+            "🔍 Layer 3: Multi-Agent Analysis",
+            "  📝 텍스트 분석 시작...",
+            "  🎨 비주얼 분석 시작...",
+            "  📊 참여 지표 분석 시작..."
+        )
+
+        # 병렬 분석 실행
+        text_analysis, visual_analysis, engagement_analysis = await asyncio.gather(
+            self.analyzers['text'].analyze(unified_contents),
+            self.analyzers['visual'].analyze(unified_contents),
+            self.analyzers['engagement'].analyze(unified_contents)
+        )
+
+        logger.info("  ✅ 모든 분석 완료")
+        return text_analysis, visual_analysis, engagement_analysis
 
     async def run(
         self,
@@ -74,57 +150,45 @@ class BrandAnalysisPipeline:
             BrandProfile 객체
         """
         try:
-            logger.info("=" * 80)
-            logger.info("🚀 Brand Analysis Multi-Agent Pipeline 시작")
-            logger.info("=" * 80)
+            _log_banner("🚀 Brand Analysis Multi-Agent Pipeline 시작")
 
             # ===== Layer 1: 데이터 수집 =====
-            logger.info("\n📦 Layer 1: Platform Data Collection")
-            logger.info("-" * 80)
+            _log_layer("📦 Layer 1: Platform Data Collection")
 
-            collection_tasks = []
-            platforms_to_analyze = []
-
-            # 입력된 플랫폼에 대해서만 collector 실행
-            # Instagram은 OAuth 연동 기반으로 수집
-            if 'instagram' in platform_urls and platform_urls['instagram']:
-                logger.info(f"  ✓ Instagram 수집 예정 (OAuth 연동 기반)")
-                instagram_collector = InstagramCollectorAgent(db=self.db, user_id=user_id)
-                collection_tasks.append(
-                    instagram_collector.collect(max_items=max_items)
-                )
-                platforms_to_analyze.append('instagram')
-
-            # YouTube는 OAuth 연동 기반으로 수집
-            if 'youtube' in platform_urls and platform_urls['youtube']:
-                logger.info(f"  ✓ YouTube 수집 예정 (OAuth 연동 기반)")
-                youtube_collector = YouTubeCollectorAgent(db=self.db, user_id=user_id)
-                collection_tasks.append(
-                    youtube_collector.collect(max_items=max_items)
-                )
-                platforms_to_analyze.append('youtube')
-
-            # Threads는 OAuth 연동 기반으로 수집
-            if 'threads' in platform_urls and platform_urls['threads']:
-                logger.info(f"  ✓ Threads 수집 예정 (OAuth 연동 기반)")
-                threads_collector = ThreadsCollectorAgent(db=self.db, user_id=user_id)
-                collection_tasks.append(
-                    threads_collector.collect(max_items=max_items)
-                )
-                platforms_to_analyze.append('threads')
+            # 입력된 플랫폼에 대해서만 collector 실행 (모두 OAuth 연동 기반)
+            collection_tasks: Dict[str, Coroutine] = {}
+            for platform, label, collector_cls in PLATFORM_COLLECTORS:
+                if platform_urls.get(platform):
+                    logger.info(f"  ✓ {label} 수집 예정 (OAuth 연동 기반)")
+                    collector = collector_cls(db=self.db, user_id=user_id)
+                    collection_tasks[platform] = collector.collect(max_items=max_items)
 
             if not collection_tasks:
                 raise ValueError("분석할 플랫폼이 없습니다")
 
-            # 병렬 수집 실행
+            # 병렬 수집 실행 (일부 플랫폼이 실패해도 나머지 결과로 계속 진행)
             logger.info(f"\n  ⏳ {len(collection_tasks)}개 플랫폼 병렬 수집 중...")
-            raw_contents_lists = await asyncio.gather(*collection_tasks, return_exceptions=False)
+            raw_contents_lists = await asyncio.gather(*collection_tasks.values(), return_exceptions=True)
 
-            # 결과 병합
-            raw_contents = []
-            for raw_list in raw_contents_lists:
+            # 실패한 플랫폼 제외
+            platforms_to_analyze = []
+            failed_platforms = []
+            collected_lists = []
+            for platform, raw_list in zip(collection_tasks, raw_contents_lists):
+                # 취소된 collector는 CancelledError(BaseException)로 반환되므로 BaseException으로 검사
+                if isinstance(raw_list, BaseException):
+                    logger.warning(f"  ⚠️ {platform} 수집 실패: {raw_list!r}")
+                    failed_platforms.append(platform)
+                    continue
+                platforms_to_analyze.append(platform)
                 if raw_list:
-                    raw_contents.extend(raw_list)
+                    collected_lists.append(raw_list)
+
+            if not platforms_to_analyze:
+                raise ValueError(f"모든 플랫폼 수집 실패: {', '.join(failed_platforms)}")
+
+            # 결과 병합
+            raw_contents = list(itertools.chain.from_iterable(collected_lists))
 
             logger.info(f"  ✅ 총 {len(raw_contents)}개 콘텐츠 수집 완료")
 
@@ -132,34 +196,16 @@ class BrandAnalysisPipeline:
                 raise ValueError("수집된 콘텐츠가 없습니다")
 
             # ===== Layer 2: 데이터 정규화 =====
-            logger.info("\n🔄 Layer 2: Data Normalization")
-            logger.info("-" * 80)
+            _log_layer("🔄 Layer 2: Data Normalization")
 
-            unified_contents = [
-                self.normalizer.normalize(raw) for raw in raw_contents
-            ]
+            unified_contents = self.normalizer.normalize_batch(raw_contents)
             logger.info(f"  ✅ {len(unified_contents)}개 콘텐츠 정규화 완료")
 
             # ===== Layer 3: 분석 =====
-            logger.info("\n🔍 Layer 3: Multi-Agent Analysis")
-            logger.info("-" * 80)
-
-            logger.info("  📝 텍스트 분석 시작...")
-            logger.info("  🎨 비주얼 분석 시작...")
-            logger.info("  📊 참여 지표 분석 시작...")
-
-            # 병렬 분석 실행
-            text_analysis, visual_analysis, engagement_analysis = await asyncio.gather(
-                self.analyzers['text'].analyze(unified_contents),
-                self.analyzers['visual'].analyze(unified_contents),
-                self.analyzers['engagement'].analyze(unified_contents)
-            )
-
-            logger.info("  ✅ 모든 분석 완료")
+            text_analysis, visual_analysis, engagement_analysis = await self._analyze(unified_contents)
 
             # ===== Layer 4: 브랜드 프로필 통합 =====
-            logger.info("\n🔮 Layer 4: Brand Profile Synthesis")
-            logger.info("-" * 80)
+            _log_layer("🔮 Layer 4: Brand Profile Synthesis")
 
             brand_profile = await self.synthesizer.synthesize(
                 user_id=str(user_id),  # str 타입으로 변환 (BrandProfile.brand_id가 str 타입)
@@ -173,22 +219,19 @@ class BrandAnalysisPipeline:
             # ✅ 메타데이터 업데이트: SNS 분석임을 명시
             brand_profile.source = BrandProfileSource.SNS_ANALYSIS
             brand_profile.confidence_level = ConfidenceLevel.HIGH
-            brand_profile.updated_at = datetime.utcnow()
 
-            logger.info("=" * 80)
-            logger.info("✅ Brand Analysis Pipeline 완료!")
-            logger.info(f"   브랜드명: {brand_profile.brand_name or '(미확인)'}")
-            logger.info(f"   분석된 플랫폼: {', '.join(platforms_to_analyze)}")
-            logger.info(f"   총 콘텐츠 수: {len(unified_contents)}")
-            logger.info(f"   신뢰도: {brand_profile.confidence_level}")
-            logger.info("=" * 80 + "\n")
+            _log_banner(
+                "✅ Brand Analysis Pipeline 완료!",
+                f"   브랜드명: {brand_profile.brand_name or '(미확인)'}",
+                f"   분석된 플랫폼: {', '.join(platforms_to_analyze)}",
+                f"   총 콘텐츠 수: {len(unified_contents)}",
+                f"   신뢰도: {brand_profile.confidence_level}"
+            )
 
             return brand_profile
 
         except Exception as e:
-            logger.error(f"\n❌ Pipeline 실행 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"\n❌ Pipeline 실행 실패: {e}", exc_info=True)
             raise Exception(f"브랜드 분석 실패: {str(e)}")
 
     async def run_from_manual_samples(
@@ -210,14 +253,15 @@ class BrandAnalysisPipeline:
         Returns:
             BrandProfile 객체 (source=MANUAL_SAMPLES, confidence_level=MEDIUM)
         """
+        # 실행 시각은 한 번만 읽어 샘플 created_at에 공통 사용
+        # (프로필 created_at/updated_at은 합성 완료 시점에 synthesizer가 기록)
+        pipeline_now = datetime.now(timezone.utc)
+
         try:
-            logger.info("=" * 80)
-            logger.info("🚀 Manual Samples Brand Analysis Pipeline 시작")
-            logger.info("=" * 80)
+            _log_banner("🚀 Manual Samples Brand Analysis Pipeline 시작")
 
             # ===== Layer 1 건너뛰기: 수동 샘플을 UnifiedContent로 변환 =====
-            logger.info("\n📦 Manual Samples → UnifiedContent 변환")
-            logger.info("-" * 80)
+            _log_layer("📦 Manual Samples → UnifiedContent 변환")
 
             unified_contents = []
 
@@ -232,8 +276,8 @@ class BrandAnalysisPipeline:
                             media=None,
                             tags=[],
                             engagement=None,
-                            created_at=datetime.utcnow(),
-                            platform_specific={'sample_index': idx}
+                            created_at=pipeline_now,
+                            platform_specific=ManualSampleMeta(sample_index=idx)
                         ))
                 logger.info(f"  ✓ {len(text_samples)}개 텍스트 샘플 변환 완료")
 
@@ -244,15 +288,11 @@ class BrandAnalysisPipeline:
                         platform='manual_image',
                         title=None,
                         body_text='',
-                        media=MediaInfo(
-                            type='image',
-                            urls=[img_path],
-                            count=1
-                        ),
+                        media=_sample_media('image', img_path),
                         tags=[],
                         engagement=None,
-                        created_at=datetime.utcnow(),
-                        platform_specific={'sample_index': idx, 'file_path': img_path}
+                        created_at=pipeline_now,
+                        platform_specific=ManualSampleMeta(sample_index=idx, file_path=img_path)
                     ))
                 logger.info(f"  ✓ {len(image_samples)}개 이미지 샘플 변환 완료")
 
@@ -263,15 +303,11 @@ class BrandAnalysisPipeline:
                         platform='manual_video',
                         title=None,
                         body_text='',
-                        media=MediaInfo(
-                            type='video',
-                            urls=[vid_path],
-                            count=1
-                        ),
+                        media=_sample_media('video', vid_path),
                         tags=[],
                         engagement=None,
-                        created_at=datetime.utcnow(),
-                        platform_specific={'sample_index': idx, 'file_path': vid_path}
+                        created_at=pipeline_now,
+                        platform_specific=ManualSampleMeta(sample_index=idx, file_path=vid_path)
                     ))
                 logger.info(f"  ✓ {len(video_samples)}개 영상 샘플 변환 완료")
 
@@ -283,25 +319,10 @@ class BrandAnalysisPipeline:
             # ===== Layer 2: 정규화 건너뛰기 (이미 UnifiedContent 형식) =====
 
             # ===== Layer 3: 분석 =====
-            logger.info("\n🔍 Layer 3: Multi-Agent Analysis")
-            logger.info("-" * 80)
-
-            logger.info("  📝 텍스트 분석 시작...")
-            logger.info("  🎨 비주얼 분석 시작...")
-            logger.info("  📊 참여 지표 분석 시작...")
-
-            # 병렬 분석 실행
-            text_analysis, visual_analysis, engagement_analysis = await asyncio.gather(
-                self.analyzers['text'].analyze(unified_contents),
-                self.analyzers['visual'].analyze(unified_contents),
-                self.analyzers['engagement'].analyze(unified_contents)
-            )
-
-            logger.info("  ✅ 모든 분석 완료")
+            text_analysis, visual_analysis, engagement_analysis = await self._analyze(unified_contents)
 
             # ===== Layer 4: 브랜드 프로필 통합 =====
-            logger.info("\n🔮 Layer 4: Brand Profile Synthesis")
-            logger.info("-" * 80)
+            _log_layer("🔮 Layer 4: Brand Profile Synthesis")
 
             brand_profile = await self.synthesizer.synthesize(
                 user_id=user_id,
@@ -315,19 +336,16 @@ class BrandAnalysisPipeline:
             # ✅ 메타데이터 업데이트: 수동 샘플 분석임을 명시
             brand_profile.source = BrandProfileSource.MANUAL_SAMPLES
             brand_profile.confidence_level = ConfidenceLevel.MEDIUM
-            brand_profile.updated_at = datetime.utcnow()
 
-            logger.info("=" * 80)
-            logger.info("✅ Manual Samples Brand Analysis Pipeline 완료!")
-            logger.info(f"   브랜드명: {brand_profile.brand_name or '(미확인)'}")
-            logger.info(f"   분석된 샘플: {len(unified_contents)}개")
-            logger.info(f"   신뢰도: {brand_profile.confidence_level}")
-            logger.info("=" * 80 + "\n")
+            _log_banner(
+                "✅ Manual Samples Brand Analysis Pipeline 완료!",
+                f"   브랜드명: {brand_profile.brand_name or '(미확인)'}",
+                f"   분석된 샘플: {len(unified_contents)}개",
+                f"   신뢰도: {brand_profile.confidence_level}"
+            )
 
             return brand_profile
 
         except Exception as e:
-            logger.error(f"\n❌ Manual Samples Pipeline 실행 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"\n❌ Manual Samples Pipeline 실행 실패: {e}", exc_info=True)
             raise Exception(f"수동 샘플 브랜드 분석 실패: {str(e)}")
@@ -4,8 +4,8 @@ Brand Analysis Schemas
 브랜드 분석을 위한 데이터 스키마 정의
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Sequence, Union
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -29,15 +29,15 @@ class ConfidenceLevel:
 
 # ===== Layer 2: Unified Content Schema =====
 
-@dataclass
+@dataclass(frozen=True)
 class MediaInfo:
-    """미디어 정보"""
+    """미디어 정보 (불변 - 동일한 미디어는 인스턴스 공유 가능)"""
     type: str  # 'image', 'video', 'none'
-    urls: List[str]
+    urls: Sequence[str]
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EngagementMetrics:
     """참여 지표"""
     likes: int = 0
@@ -46,7 +46,14 @@ class EngagementMetrics:
     views: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ManualSampleMeta:
+    """수동 샘플 메타데이터 (UnifiedContent.platform_specific 용)"""
+    sample_index: int
+    file_path: Optional[str] = None
+
+
+@dataclass(slots=True)
 class UnifiedContent:
     """
     플랫폼 간 통합 콘텐츠 구조
@@ -60,13 +67,15 @@ class UnifiedContent:
     tags: List[str]
     engagement: Optional[EngagementMetrics]
     created_at: Optional[datetime]
-    platform_specific: Dict[str, Any]  # 플랫폼별 고유 정보
+    platform_specific: Union[Dict[str, Any], ManualSampleMeta]  # 플랫폼별 고유 정보 (수동 샘플은 ManualSampleMeta)
 
 
 # ===== Layer 4: Brand Profile Schema =====
 
 class ToneOfVoice(BaseModel):
     """톤 & 보이스 특성"""
+    model_config = ConfigDict(frozen=True)
+
     formality: int = Field(..., ge=0, le=100, description="격식 수준 (0: 매우 캐주얼, 100: 매우 격식있는)")
     warmth: int = Field(..., ge=0, le=100, description="따뜻함 (0: 차가운, 100: 매우 따뜻한)")
     enthusiasm: int = Field(..., ge=0, le=100, description="열정 (0: 차분한, 100: 열정적인)")
@@ -80,6 +89,8 @@ class ToneOfVoice(BaseModel):
 
 class ContentStrategy(BaseModel):
     """콘텐츠 전략"""
+    model_config = ConfigDict(frozen=True)
+
     primary_topics: List[str] = Field(..., description="주요 주제")
     content_structure: str = Field(..., description="콘텐츠 구조 (예: 도입-본론-결론)")
     call_to_action_style: str = Field(..., description="행동 유도 방식")
@@ -89,6 +100,8 @@ class ContentStrategy(BaseModel):
 
 class VisualStyle(BaseModel):
     """시각적 스타일 (이미지/영상)"""
+    model_config = ConfigDict(frozen=True)
+
     color_palette: List[str] = Field(default_factory=list, description="주요 색상 팔레트 (HEX 코드)")
     image_style: Optional[str] = Field(None, description="이미지 스타일 (예: '밝고 화사한', '미니멀')")
     composition_style: Optional[str] = Field(None, description="구도 스타일 (예: '중앙 정렬', '그리드 레이아웃')")
@@ -97,6 +110,8 @@ class VisualStyle(BaseModel):
 
 class BrandIdentity(BaseModel):
     """브랜드 아이덴티티"""
+    model_config = ConfigDict(frozen=True)
+
     brand_name: Optional[str] = Field(None, description="브랜드명")
     business_type: Optional[str] = Field(None, description="업종")
     brand_personality: str = Field(..., description="브랜드 성격 (2-3문장)")
@@ -107,6 +122,8 @@ class BrandIdentity(BaseModel):
 
 class GenerationPrompts(BaseModel):
     """콘텐츠 생성용 프롬프트 템플릿"""
+    model_config = ConfigDict(frozen=True)
+
     text_generation_prompt: str = Field(..., description="텍스트 생성용 시스템 프롬프트")
     image_generation_prompt: str = Field(..., description="이미지 생성용 프롬프트")
     video_generation_prompt: Optional[str] = Field(None, description="비디오 생성용 프롬프트")
@@ -6,8 +6,13 @@ Brand Profile Synthesizer
 
 import logging
 import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import asyncio
+import copy
+import hashlib
+import time
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 from .schemas import (
     BrandProfile,
     BrandIdentity,
@@ -23,6 +28,117 @@ from ..utils.vertex_ai_client import get_vertex_client
 
 logger = logging.getLogger(__name__)
 
+# 브랜드 아이덴티티에서 허용하는 업종 코드
+VALID_BUSINESS_TYPES = frozenset({'food', 'fashion', 'health', 'education', 'tech', 'retail', 'service'})
+
+
+# ===== 프롬프트 템플릿 =====
+
+# 콘텐츠 샘플 기반 브랜드 아이덴티티 추론 프롬프트
+IDENTITY_PROMPT = """아래 브랜드의 콘텐츠를 분석하여 브랜드 아이덴티티를 파악해주세요.
+
+===== 콘텐츠 샘플 =====
+{combined_text}
+=======================
+
+다음 정보를 JSON 형식으로 추출해주세요:
+
+{{
+  "brand_name": "브랜드명 (콘텐츠에서 반복 언급되는 이름, 없으면 null)",
+  "business_type": "업종 - 반드시 다음 중 하나만 선택: food, fashion, health, education, tech, retail, service",
+  "brand_personality": "브랜드 성격을 2-3문장으로 설명",
+  "brand_values": ["브랜드 가치 1", "가치 2", "가치 3"],
+  "target_audience": "타겟 고객 - 반드시 구체적으로 (예: 20-30대 직장인 여성)",
+  "emotional_tone": "감정적 톤 (예: 따뜻한, 유머러스한, 진지한)"
+}}
+
+**업종 분류 기준:**
+- food: 음식점, 카페, 베이커리, 식음료 관련
+- fashion: 패션, 뷰티, 화장품, 의류 관련
+- health: 헬스, 피트니스, 요가, 운동, 건강 관련
+- education: 학원, 교육, 강의, 학습 관련
+- tech: IT, 소프트웨어, 기술, 개발 관련
+- retail: 소매, 유통, 쇼핑몰, 제품 판매 관련
+- service: 서비스업 전반 (위 카테고리에 해당하지 않는 모든 서비스)
+
+**중요 규칙:**
+1. business_type은 반드시 위 7개 중 하나의 영문 코드만 사용
+2. target_audience는 '전체', '모든 연령' 같은 모호한 답변 금지. 반드시 연령대나 특성을 포함하세요.
+"""
+
+# 콘텐츠 생성용 텍스트 프롬프트 템플릿
+TEXT_GENERATION_PROMPT = """다음 브랜드 특성에 맞춰 콘텐츠를 작성하세요:
+
+**브랜드 특성**
+- 브랜드명: {brand_name}
+- 업종: {business_type}
+- 타겟 고객: {target_audience}
+- 브랜드 성격: {brand_personality}
+- 감정적 톤: {emotional_tone}
+
+**글쓰기 스타일**
+- 톤앤매너: 격식 수준 {formality}/100, 따뜻함 {warmth}/100, 열정 {enthusiasm}/100
+- 문장 스타일: {sentence_style}
+- 시그니처 표현: {signature_phrases}
+
+**콘텐츠 구조**
+- {content_structure}
+"""
+
+# 콘텐츠 생성용 이미지 프롬프트 템플릿
+IMAGE_GENERATION_PROMPT = """다음 브랜드의 비주얼 스타일에 맞춰 이미지를 생성하세요:
+
+**비주얼 스타일**
+- 이미지 스타일: {image_style}
+- 구도: {composition_style}
+- 색상 팔레트: {color_palette}
+
+**브랜드 정체성**
+- {brand_personality}
+- 타겟: {target_audience}
+"""
+
+
+# ===== 비즈니스 정보 추론 결과 캐시 =====
+# 온보딩 폼 재제출/새로고침 시 동일 입력에 대한 LLM 재호출 방지 (프로세스 메모리)
+BUSINESS_INFO_CACHE_TTL = 60 * 60 * 24  # 24시간
+BUSINESS_INFO_CACHE_MAX_SIZE = 256
+
+_business_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _business_info_cache_key(
+    brand_name: str,
+    business_type: str,
+    business_description: str,
+    target_audience: str,
+    selected_styles: Optional[List[str]],
+    brand_values: Optional[List[str]]
+) -> str:
+    """비즈니스 정보 입력값으로 캐시 키 생성"""
+    inputs = [brand_name, business_type, business_description, target_audience, selected_styles, brand_values]
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _business_info_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """캐시 조회 (만료된 항목은 제거)"""
+    entry = _business_info_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, ai_result = entry
+    if time.monotonic() - cached_at > BUSINESS_INFO_CACHE_TTL:
+        _business_info_cache.pop(key, None)
+        return None
+    return copy.deepcopy(ai_result)
+
+
+def _business_info_cache_set(key: str, ai_result: Dict[str, Any]):
+    """캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+    if len(_business_info_cache) >= BUSINESS_INFO_CACHE_MAX_SIZE:
+        _business_info_cache.pop(next(iter(_business_info_cache)))
+    _business_info_cache[key] = (time.monotonic(), copy.deepcopy(ai_result))
+
 
 # ===== Layer 4: Brand Profile Synthesizer =====
 
@@ -61,24 +177,12 @@ class BrandProfileSynthesizer:
 
         partial_failures = []  # 부분 실패 추적
 
-        # ===== 1. Brand Identity 생성 =====
-        try:
-            brand_identity = await self._synthesize_identity(
-                text_analysis,
-                unified_contents
-            )
-            logger.info("✅ Brand Identity 생성 완료")
-        except Exception as e:
-            logger.warning(f"⚠️ Brand Identity 생성 실패, 기본값 사용: {e}")
-            partial_failures.append("identity")
-            brand_identity = BrandIdentity(
-                brand_name=None,
-                business_type="service",
-                brand_personality="정의되지 않음",
-                brand_values=[],
-                target_audience="일반 대중",
-                emotional_tone="중립적"
-            )
+        # ===== 1. Brand Identity 생성 시작 (LLM 호출) =====
+        # 네트워크 호출을 먼저 띄워두고, 그동안 LLM이 필요 없는 2~4단계를 처리
+        identity_task = asyncio.create_task(
+            self._synthesize_identity(text_analysis, unified_contents)
+        )
+        await asyncio.sleep(0)  # identity_task가 Vertex 호출까지 진행하도록 양보
 
         # ===== 2. Tone of Voice 생성 =====
         try:
@@ -125,9 +229,25 @@ class BrandProfileSynthesizer:
                 filter_preference=None
             )
 
+        # ===== 1. Brand Identity 생성 완료 대기 =====
+        try:
+            brand_identity = await identity_task
+            logger.info("✅ Brand Identity 생성 완료")
+        except Exception as e:
+            logger.warning(f"⚠️ Brand Identity 생성 실패, 기본값 사용: {e}")
+            partial_failures.append("identity")
+            brand_identity = BrandIdentity(
+                brand_name=None,
+                business_type="service",
+                brand_personality="정의되지 않음",
+                brand_values=[],
+                target_audience="일반 대중",
+                emotional_tone="중립적"
+            )
+
         # ===== 5. Generation Prompts 생성 =====
         try:
-            generation_prompts = await self._synthesize_generation_prompts(
+            generation_prompts = self._synthesize_generation_prompts(
                 brand_identity,
                 tone_of_voice,
                 content_strategy,
@@ -144,7 +264,9 @@ class BrandProfileSynthesizer:
             )
 
         # ===== 6. BrandProfile 조립 =====
-        brand_profile = BrandProfile(
+        # 중첩 모델 검증은 CPU 작업이므로 이벤트 루프 밖(스레드)에서 수행
+        now = datetime.now(timezone.utc)
+        brand_profile = await asyncio.to_thread(BrandProfile.model_validate, dict(
             brand_id=user_id,
             brand_name=brand_identity.brand_name,
             identity=brand_identity,
@@ -154,9 +276,9 @@ class BrandProfileSynthesizer:
             generation_prompts=generation_prompts,
             analyzed_platforms=analyzed_platforms,
             total_contents_analyzed=len(unified_contents),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
-        )
+            created_at=now,
+            updated_at=now
+        ))
 
         if partial_failures:
             logger.warning(f"⚠️ [Brand Profile Synthesizer] 부분 실패 발생: {partial_failures}")
@@ -173,47 +295,14 @@ class BrandProfileSynthesizer:
     ) -> BrandIdentity:
         """Brand Identity 생성"""
         try:
-            # 콘텐츠에서 브랜드 정보 추출을 위한 프롬프트
-            sample_texts = [c.body_text[:500] for c in unified_contents if c.body_text]
-            combined_text = "\n\n".join(sample_texts[:5])  # 처음 5개 샘플만
-
-            prompt = f"""아래 브랜드의 콘텐츠를 분석하여 브랜드 아이덴티티를 파악해주세요.
-
-===== 콘텐츠 샘플 =====
-{combined_text}
-=======================
-
-다음 정보를 JSON 형식으로 추출해주세요:
-
-{{
-  "brand_name": "브랜드명 (콘텐츠에서 반복 언급되는 이름, 없으면 null)",
-  "business_type": "업종 - 반드시 다음 중 하나만 선택: food, fashion, health, education, tech, retail, service",
-  "brand_personality": "브랜드 성격을 2-3문장으로 설명",
-  "brand_values": ["브랜드 가치 1", "가치 2", "가치 3"],
-  "target_audience": "타겟 고객 - 반드시 구체적으로 (예: 20-30대 직장인 여성)",
-  "emotional_tone": "감정적 톤 (예: 따뜻한, 유머러스한, 진지한)"
-}}
-
-**업종 분류 기준:**
-- food: 음식점, 카페, 베이커리, 식음료 관련
-- fashion: 패션, 뷰티, 화장품, 의류 관련
-- health: 헬스, 피트니스, 요가, 운동, 건강 관련
-- education: 학원, 교육, 강의, 학습 관련
-- tech: IT, 소프트웨어, 기술, 개발 관련
-- retail: 소매, 유통, 쇼핑몰, 제품 판매 관련
-- service: 서비스업 전반 (위 카테고리에 해당하지 않는 모든 서비스)
-
-**중요 규칙:**
-1. business_type은 반드시 위 7개 중 하나의 영문 코드만 사용
-2. target_audience는 '전체', '모든 연령' 같은 모호한 답변 금지. 반드시 연령대나 특성을 포함하세요.
-"""
-
-            identity_data = await self.vertex_client.generate_json(prompt, temperature=0.3)
+            # 텍스트 분석(Layer 3)에서 함께 추출한 아이덴티티가 있으면 재사용 (추가 LLM 호출 없음)
+            identity_data = text_analysis.get("brand_identity")
+            if not isinstance(identity_data, dict) or not identity_data:
+                identity_data = await self._infer_identity_from_samples(unified_contents)
 
             # 업종 검증: 허용된 카테고리만 사용
-            valid_business_types = ['food', 'fashion', 'health', 'education', 'tech', 'retail', 'service']
             business_type = identity_data.get("business_type", "service")
-            if business_type not in valid_business_types:
+            if business_type not in VALID_BUSINESS_TYPES:
                 logger.warning(f"⚠️ 유효하지 않은 업종: {business_type}, 기본값 'service'로 설정")
                 business_type = "service"
 
@@ -237,6 +326,25 @@ class BrandProfileSynthesizer:
                 emotional_tone="중립적"
             )
 
+    async def _infer_identity_from_samples(
+        self,
+        unified_contents: List[UnifiedContent]
+    ) -> Dict[str, Any]:
+        """콘텐츠 샘플로 브랜드 아이덴티티 추론 (텍스트 분석 결과에 없을 때 폴백)"""
+        # 콘텐츠에서 브랜드 정보 추출을 위한 프롬프트
+        # 처음 5개 샘플만 필요하므로 5개를 모으면 바로 중단
+        sample_texts = []
+        for content in unified_contents:
+            if content.body_text:
+                sample_texts.append(content.body_text[:500])
+                if len(sample_texts) == 5:
+                    break
+        combined_text = "\n\n".join(sample_texts)
+
+        prompt = IDENTITY_PROMPT.format(combined_text=combined_text)
+
+        return await self.vertex_client.generate_json(prompt, temperature=0.3)
+
     def _synthesize_tone_of_voice(self, text_analysis: Dict[str, Any]) -> ToneOfVoice:
         """Tone of Voice 생성"""
         try:
@@ -266,7 +374,7 @@ class BrandProfileSynthesizer:
             keyword_freq = text_analysis.get("keyword_frequency", {})
 
             return ContentStrategy(
-                primary_topics=list(keyword_freq.keys())[:5] if keyword_freq else [],
+                primary_topics=list(islice(keyword_freq, 5)) if keyword_freq else [],
                 content_structure=text_analysis.get("writing_style", "정보 전달형"),
                 call_to_action_style="표준형",
                 keyword_usage=keyword_freq,
@@ -300,7 +408,7 @@ class BrandProfileSynthesizer:
                 filter_preference=None
             )
 
-    async def _synthesize_generation_prompts(
+    def _synthesize_generation_prompts(
         self,
         identity: BrandIdentity,
         tone: ToneOfVoice,
@@ -310,36 +418,28 @@ class BrandProfileSynthesizer:
         """콘텐츠 생성용 프롬프트 템플릿 생성"""
         try:
             # 텍스트 생성 프롬프트
-            text_prompt = f"""다음 브랜드 특성에 맞춰 콘텐츠를 작성하세요:
-
-**브랜드 특성**
-- 브랜드명: {identity.brand_name or '(브랜드명)'}
-- 업종: {identity.business_type}
-- 타겟 고객: {identity.target_audience}
-- 브랜드 성격: {identity.brand_personality}
-- 감정적 톤: {identity.emotional_tone}
-
-**글쓰기 스타일**
-- 톤앤매너: 격식 수준 {tone.formality}/100, 따뜻함 {tone.warmth}/100, 열정 {tone.enthusiasm}/100
-- 문장 스타일: {tone.sentence_style}
-- 시그니처 표현: {', '.join(tone.signature_phrases[:3]) if tone.signature_phrases else '없음'}
-
-**콘텐츠 구조**
-- {strategy.content_structure}
-"""
+            text_prompt = TEXT_GENERATION_PROMPT.format(
+                brand_name=identity.brand_name or '(브랜드명)',
+                business_type=identity.business_type,
+                target_audience=identity.target_audience,
+                brand_personality=identity.brand_personality,
+                emotional_tone=identity.emotional_tone,
+                formality=tone.formality,
+                warmth=tone.warmth,
+                enthusiasm=tone.enthusiasm,
+                sentence_style=tone.sentence_style,
+                signature_phrases=', '.join(tone.signature_phrases[:3]) if tone.signature_phrases else '없음',
+                content_structure=strategy.content_structure
+            )
 
             # 이미지 생성 프롬프트
-            image_prompt = f"""다음 브랜드의 비주얼 스타일에 맞춰 이미지를 생성하세요:
-
-**비주얼 스타일**
-- 이미지 스타일: {visual.image_style or '표준 스타일'}
-- 구도: {visual.composition_style or '표준 레이아웃'}
-- 색상 팔레트: {', '.join(visual.color_palette[:5]) if visual.color_palette else '기본 색상'}
-
-**브랜드 정체성**
-- {identity.brand_personality}
-- 타겟: {identity.target_audience}
-"""
+            image_prompt = IMAGE_GENERATION_PROMPT.format(
+                image_style=visual.image_style or '표준 스타일',
+                composition_style=visual.composition_style or '표준 레이아웃',
+                color_palette=', '.join(visual.color_palette[:5]) if visual.color_palette else '기본 색상',
+                brand_personality=identity.brand_personality,
+                target_audience=identity.target_audience
+            )
 
             return GenerationPrompts(
                 text_generation_prompt=text_prompt,
@@ -421,7 +521,17 @@ class BrandProfileSynthesizer:
 4. brand_values는 사용자 입력이 있으면 그대로 사용
 """
 
-            ai_result = await self.vertex_client.generate_json(prompt, temperature=0.5)
+            # 같은 온보딩 정보 재제출 시 LLM 호출 없이 캐시된 추론 결과 재사용
+            cache_key = _business_info_cache_key(
+                brand_name, business_type, business_description,
+                target_audience, selected_styles, brand_values
+            )
+            ai_result = _business_info_cache_get(cache_key)
+            if ai_result is None:
+                ai_result = await self.vertex_client.generate_json(prompt, temperature=0.5)
+                _business_info_cache_set(cache_key, ai_result)
+            else:
+                logger.info("♻️ [Synthesizer] 캐시된 비즈니스 정보 추론 결과 사용")
 
             # BrandIdentity 생성
             brand_identity = BrandIdentity(
@@ -461,12 +571,13 @@ class BrandProfileSynthesizer:
             )
 
             # GenerationPrompts 생성
-            generation_prompts = await self._synthesize_generation_prompts(
+            generation_prompts = self._synthesize_generation_prompts(
                 brand_identity, tone_of_voice, content_strategy, visual_style
             )
 
-            # BrandProfile 조립
-            brand_profile = BrandProfile(
+            # BrandProfile 조립 (검증은 스레드에서 수행)
+            now = datetime.now(timezone.utc)
+            brand_profile = await asyncio.to_thread(BrandProfile.model_validate, dict(
                 brand_id=user_id,
                 brand_name=brand_name,
                 identity=brand_identity,
@@ -478,9 +589,9 @@ class BrandProfileSynthesizer:
                 total_contents_analyzed=0,
                 source=BrandProfileSource.INFERRED,
                 confidence_level=ConfidenceLevel.LOW,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
+                created_at=now,
+                updated_at=now
+            ))
 
             logger.info("✅ [Synthesizer] 기본 BrandProfile 생성 완료 (추론 기반)")
             return brand_profile
@@ -488,3 +599,25 @@ class BrandProfileSynthesizer:
         except Exception as e:
             logger.error(f"❌ [Synthesizer] 기본 BrandProfile 생성 실패: {e}")
             raise Exception(f"기본 브랜드 프로필 생성 실패: {str(e)}")
+
+
+# 싱글톤 인스턴스
+_synthesizer: Optional[BrandProfileSynthesizer] = None
+
+
+def get_brand_profile_synthesizer() -> BrandProfileSynthesizer:
+    """
+    BrandProfileSynthesizer 싱글톤 인스턴스 반환
+
+    Synthesizer는 요청별 상태가 없으므로 Vertex AI 클라이언트 조회를 포함한
+    생성 비용을 요청마다 반복하지 않고 한 번만 치른다.
+
+    Returns:
+        BrandProfileSynthesizer 인스턴스
+    """
+    global _synthesizer
+
+    if _synthesizer is None:
+        _synthesizer = BrandProfileSynthesizer()
+
+    return _synthesizer
@@ -1,15 +1,14 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 import os
-from pathlib import Path
-from dotenv import load_dotenv
+from uuid import uuid4
+from .env import load_env
 
-# 프로젝트 루트의 .env 파일 로드 (시스템 환경 변수 덮어쓰기)
-root_env = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(root_env, override=True)
-# 백엔드 .env 파일도 로드 (있으면 덮어쓰기)
-load_dotenv(override=True)
+# .env 파일 로드 (프로세스당 한 번)
+load_env()
 
 # 환경 변수 설정
 ENV = os.getenv("ENV", "development")  # development, production, test
@@ -18,15 +17,22 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL 환경 변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
 
+# 커넥션 풀 설정 (기본값은 Supabase Free tier 연결 제한 기준)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))          # 기본 유지 연결 수
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))   # 최대 초과 연결 수
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))  # 연결 재활용 주기 (초, Supabase 타임아웃 대응)
+
 # PostgreSQL 데이터베이스 연결 설정 (Supabase Pooler 최적화)
 if DATABASE_URL.startswith("postgresql"):
     engine = create_engine(
         DATABASE_URL,
-        pool_size=5,               # Supabase Free tier 제한 고려
-        max_overflow=10,           # 최대 초과 연결 수
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
         pool_pre_ping=True,        # 연결 유효성 검사
-        pool_recycle=300,          # 5분마다 연결 재활용 (Supabase 타임아웃 대응)
+        pool_recycle=DB_POOL_RECYCLE,
         pool_timeout=30,           # 연결 대기 타임아웃
+        insertmanyvalues_page_size=10000,       # 다건 INSERT를 한 문장에 묶는 행 수
+        executemany_mode="values_plus_batch",   # 다건 UPDATE/DELETE도 psycopg2 batch helper 사용
         connect_args={
             "connect_timeout": 10,  # 연결 타임아웃 10초
             "keepalives": 1,
@@ -41,6 +47,33 @@ else:
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (asyncpg) - async 엔드포인트에서 이벤트 루프를 막지 않고 DB 접근
+# 기존 동기 라우터는 SessionLocal/get_db를 그대로 사용
+# Supabase Pooler(pgbouncer transaction 모드)는 요청마다 다른 서버 연결을 쓸 수 있으므로
+# SQLAlchemy 문서의 pgbouncer 설정대로 prepared statement 캐시를 끄고 이름이 겹치지 않게 함
+ASYNC_DATABASE_URL = make_url(
+    DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1).replace(
+        "postgresql://", "postgresql+asyncpg://", 1
+    )
+).update_query_dict({"prepared_statement_cache_size": "0"})
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,        # 연결 유효성 검사
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=30,           # 연결 대기 타임아웃
+    connect_args={
+        "timeout": 10,              # 연결 타임아웃 10초
+        "statement_cache_size": 0,  # asyncpg 자체 statement 캐시 비활성화
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",  # 서버 연결 간 statement 이름 충돌 방지
+    },
+    echo=False
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -54,3 +87,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션을 생성하고 반환합니다.
+    요청이 끝나면 자동으로 세션을 닫습니다.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,37 @@
+"""
+환경 변수(.env) 로딩 모듈
+
+프로젝트 루트 .env → backend/.env 순서로 한 번만 로드합니다.
+main, database, auth, oauth 등 여러 모듈이 import 시점에 호출해도
+파일 읽기/파싱은 프로세스당 한 번만 수행됩니다.
+"""
+import os
+from pathlib import Path
+from dotenv import dotenv_values, find_dotenv
+
+# 프로젝트 루트의 .env 파일 경로
+ROOT_ENV_PATH = Path(__file__).parent.parent.parent / ".env"
+
+_loaded = False
+
+
+def load_env():
+    """
+    .env 파일 로드 (프로세스당 한 번)
+
+    - 프로젝트 루트 .env 로드 (시스템 환경 변수 덮어쓰기)
+    - backend/.env 파일도 로드 (있으면 덮어쓰기)
+
+    두 파일을 먼저 파싱해 병합한 뒤 os.environ에 한 번에 반영한다.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    env_values = {
+        **dotenv_values(ROOT_ENV_PATH),
+        **dotenv_values(find_dotenv()),
+    }
+    os.environ.update({key: value for key, value in env_values.items() if value is not None})
+    _loaded = True
@@ -4,6 +4,14 @@
 import logging
 import sys
 
+# Windows에서 ANSI 컬러 지원 (프로세스당 한 번만 초기화)
+try:
+    import colorama
+    colorama.init()
+    _HAS_COLORAMA = True
+except ImportError:
+    _HAS_COLORAMA = False
+
 # 로그 포맷 설정
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -29,10 +37,24 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: LogColors.CRITICAL,
     }
 
+    # 레벨별 컬러 레벨명 미리 계산 (로그마다 문자열 생성 방지)
+    LEVEL_NAMES = {
+        level: f"{color}{logging.getLevelName(level)}{LogColors.RESET}"
+        for level, color in COLORS.items()
+    }
+
     def format(self, record):
-        log_color = self.COLORS.get(record.levelno, LogColors.RESET)
-        record.levelname = f"{log_color}{record.levelname}{LogColors.RESET}"
-        return super().format(record)
+        colored_levelname = self.LEVEL_NAMES.get(record.levelno)
+        if colored_levelname is None:
+            return super().format(record)
+
+        # 공유 LogRecord는 다른 핸들러도 사용하므로 포맷 후 원래 레벨명 복원
+        original_levelname = record.levelname
+        record.levelname = colored_levelname
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original_levelname
 
 
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
@@ -66,12 +88,9 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
         except Exception:
             pass
 
-    # Windows에서 ANSI 컬러 지원 (Python 3.10+에서는 자동 지원)
-    try:
-        import colorama
-        colorama.init()
+    if _HAS_COLORAMA:
         console_formatter = ColoredFormatter(LOG_FORMAT, DATE_FORMAT)
-    except ImportError:
+    else:
         # colorama가 없으면 일반 포맷터 사용
         console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
 
@@ -1,11 +1,17 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.sessions import SessionMiddleware
 import os
+import asyncio
+import importlib
+import json
 import logging
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import List, Optional
+from .env import load_env
+
+# .env 파일 먼저 로드 (프로젝트 루트 → backend) - 라우터 import 전에 로드 필수!
+load_env()
 
 
 # 폴링 엔드포인트 로그 필터링 (로그 과다 방지)
@@ -20,18 +26,21 @@ class PollingEndpointFilter(logging.Filter):
 
 # uvicorn 액세스 로그에 필터 적용
 logging.getLogger("uvicorn.access").addFilter(PollingEndpointFilter())
-from .routers import auth, oauth, image, generated_videos, cardnews, onboarding, ai_recommendations, user, chat, brand_analysis, ai_video_generation, ai_content, published_content, dashboard, credits, templates
-from .routers.sns import blog, youtube, facebook, instagram, x, threads, tiktok, wordpress
-from .database import engine, Base
+from sqlalchemy import inspect
+from .database import engine, Base, ENV
 from .scheduler import start_scheduler, stop_scheduler
+from .middleware import PathScopedSessionMiddleware, WildcardCORSMiddleware
+from .logger import get_logger
 
+logger = get_logger(__name__)
 
-# 루트 .env 파일 먼저 로드 (프로젝트 루트) - 라우터 import 전에 로드 필수!
-root_env = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(root_env)
 
-# backend/.env 파일 로드 (있으면 덮어쓰기)
-load_dotenv()
+def _remove_file(path: str):
+    """임시 인증 파일 삭제 (atexit 용)"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
 
 
 # Google Cloud / Vertex AI 인증 설정
@@ -39,10 +48,15 @@ def setup_google_credentials():
     """
     Google Cloud 인증 설정
     - GOOGLE_APPLICATION_CREDENTIALS가 이미 설정되어 있으면 절대 경로로 변환
-    - GOOGLE_CREDENTIALS_BASE64가 있으면 디코딩해서 임시 파일로 저장
+    - GOOGLE_CREDENTIALS_BASE64가 있으면 디코딩해서 임시 파일로 저장 (프로세스 종료 시 삭제)
     """
-    # GOOGLE_APPLICATION_CREDENTIALS가 설정되어 있으면 절대 경로로 변환
+    # 사용하는 환경 변수는 한 번만 읽기
     credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    credentials_base64 = os.getenv("GOOGLE_CREDENTIALS_BASE64")
+    project = os.getenv("GOOGLE_CLOUD_PROJECT")
+    location = os.getenv("GOOGLE_CLOUD_LOCATION")
+
+    # GOOGLE_APPLICATION_CREDENTIALS가 설정되어 있으면 절대 경로로 변환
     if credentials_path:
         # 상대 경로인 경우 절대 경로로 변환
         if not os.path.isabs(credentials_path):
@@ -55,16 +69,14 @@ def setup_google_credentials():
 
         # 파일 존재 여부 확인
         if os.path.exists(credentials_path):
-            print(f"✅ Vertex AI credentials set: {credentials_path}")
-            print(f"   Project: {os.getenv('GOOGLE_CLOUD_PROJECT')}")
-            print(f"   Location: {os.getenv('GOOGLE_CLOUD_LOCATION')}")
+            logger.info("✅ Vertex AI credentials set: %s (project=%s, location=%s)", credentials_path, project, location)
         else:
-            print(f"⚠️  Credentials file not found: {credentials_path}")
+            logger.warning("⚠️  Credentials file not found: %s", credentials_path)
         return
 
     # Base64 환경 변수가 있으면 디코딩해서 임시 파일로 저장
-    credentials_base64 = os.getenv("GOOGLE_CREDENTIALS_BASE64")
     if credentials_base64:
+        import atexit
         import base64
         import tempfile
 
@@ -77,22 +89,35 @@ def setup_google_credentials():
             temp_file.close()
 
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = temp_file.name
-            print(f"✅ Vertex AI credentials loaded from GOOGLE_CREDENTIALS_BASE64")
-            print(f"   Project: {os.getenv('GOOGLE_CLOUD_PROJECT')}")
-            print(f"   Location: {os.getenv('GOOGLE_CLOUD_LOCATION')}")
+            atexit.register(_remove_file, temp_file.name)
+            logger.info("✅ Vertex AI credentials loaded from GOOGLE_CREDENTIALS_BASE64 (project=%s, location=%s)", project, location)
         except Exception as e:
-            print(f"⚠️  Failed to load Vertex AI credentials: {e}")
+            logger.warning("⚠️  Failed to load Vertex AI credentials: %s", e)
     else:
-        print(f"ℹ️  No Vertex AI credentials found (GOOGLE_CREDENTIALS_BASE64 or GOOGLE_APPLICATION_CREDENTIALS)")
+        logger.info("ℹ️  No Vertex AI credentials found (GOOGLE_CREDENTIALS_BASE64 or GOOGLE_APPLICATION_CREDENTIALS)")
 
 
-# 앱 시작 전 인증 설정
-setup_google_credentials()
+# 데이터베이스 테이블 생성 여부
+# 워커마다 DB 조회가 반복되지 않도록 RUN_DB_MIGRATIONS=1 일 때만 startup 이벤트에서 실행
+# (기본값: development 환경에서만 실행, 운영에서는 배포 시 한 번 실행)
+RUN_DB_MIGRATIONS = os.getenv("RUN_DB_MIGRATIONS", "1" if ENV == "development" else "0") == "1"
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+def create_missing_tables():
+    """
+    없는 테이블만 한 트랜잭션에서 생성
 
-# 초기 크레딧 패키지 시딩 (앱 시작 시 한 번만)
+    create_all(checkfirst=True)는 테이블마다 존재 여부를 조회하므로,
+    테이블 목록을 한 번만 조회한 뒤 없는 테이블만 생성한다.
+    """
+    with engine.begin() as conn:
+        existing_tables = set(inspect(conn).get_table_names())
+        missing_tables = [table for table in Base.metadata.sorted_tables if table.name not in existing_tables]
+        if missing_tables:
+            Base.metadata.create_all(conn, tables=missing_tables, checkfirst=False)
+            logger.info("✅ 테이블 생성 완료: %s", ", ".join(table.name for table in missing_tables))
+
+
+# 초기 크레딧 패키지 시딩 (startup 이벤트에서 한 번만 실행)
 def seed_initial_credit_packages():
     from .database import SessionLocal
     from . import models
@@ -110,105 +135,165 @@ def seed_initial_credit_packages():
             models.CreditPackage(name="프로", description="전문 크리에이터를 위한 패키지", credits=700, bonus_credits=150, price=50000, badge="추천", sort_order=4),
             models.CreditPackage(name="엔터프라이즈", description="대량 콘텐츠 제작에 최적화", credits=1500, bonus_credits=500, price=100000, badge="BEST", sort_order=5),
         ]
-        for pkg in packages:
-            db.add(pkg)
+        db.add_all(packages)
         db.commit()
-        print("✅ 크레딧 패키지 초기 데이터 생성 완료")
+        logger.info("✅ 크레딧 패키지 초기 데이터 생성 완료")
     except Exception as e:
-        print(f"⚠️ 크레딧 패키지 시딩 실패: {e}")
+        logger.warning("⚠️ 크레딧 패키지 시딩 실패: %s", e)
     finally:
         db.close()
 
-seed_initial_credit_packages()
 
+# 등록할 라우터 모듈 (등록 순서 유지)
+ROUTER_MODULES = [
+    ".routers.auth",
+    ".routers.oauth",
+    ".routers.user",
+    ".routers.image",
+    ".routers.cardnews",
+    ".routers.onboarding",
+    ".routers.ai_recommendations",
+    ".routers.sns.blog",
+    ".routers.chat",
+    ".routers.brand_analysis",
+    ".routers.sns.youtube",
+    ".routers.sns.facebook",
+    ".routers.sns.instagram",
+    ".routers.sns.x",
+    ".routers.sns.threads",
+    ".routers.sns.tiktok",
+    ".routers.sns.wordpress",
+    ".routers.ai_video_generation",
+    ".routers.generated_videos",
+    ".routers.ai_content",
+    ".routers.published_content",
+    ".routers.dashboard",
+    ".routers.credits",
+    ".routers.templates",
+]
+
+
+def register_routers(app: FastAPI, router_modules: List[str]):
+    """
+    router_modules의 라우터를 import하여 앱에 등록
 
-app = FastAPI(
-    title="Contents Creator API",
-    description="AI 기반 콘텐츠 제작 서비스 API (OAuth2.0 소셜 로그인)",
-    version="1.0.0"
-)
+    include_router로 등록해야 앱의 default_response_class(ORJSONResponse)와
+    dependency_overrides가 각 route에 적용된다.
+    """
+    for module_name in router_modules:
+        module = importlib.import_module(module_name, package=__package__)
+        app.include_router(module.router)
 
-# Session Middleware (OAuth에 필요)
-app.add_middleware(
-    SessionMiddleware,
-    secret_key=os.getenv("SECRET_KEY", "your-secret-key-here")
-)
 
-# CORS 설정 - 개발 환경에서는 모든 출처 허용
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 개발 환경에서 모든 출처 허용
-    allow_credentials=False,  # credentials를 사용하지 않으므로 False
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],  # 응답 헤더 노출
+# API 문서 노출 여부 (운영 환경에서는 OpenAPI 스키마 생성/노출 비활성화)
+DOCS_ENABLED = os.getenv("ENABLE_API_DOCS", "0" if ENV == "production" else "1") == "1"
+DOCS_URL = "/docs" if DOCS_ENABLED else None
+
+# Session Middleware (OAuth에 필요) - OAuth 로그인/SNS 연동 라우터에서만 실행
+SESSION_PATH_PREFIXES = (
+    "/api/oauth/",
+    "/api/facebook/",
+    "/api/youtube/",
+    "/api/instagram/",
 )
 
-# 라우터 등록
-app.include_router(auth.router)
-app.include_router(oauth.router)
-app.include_router(user.router)
-app.include_router(image.router)
-app.include_router(cardnews.router)
-app.include_router(onboarding.router)
-app.include_router(ai_recommendations.router)
-app.include_router(blog.router)
-app.include_router(chat.router)
-app.include_router(brand_analysis.router)
-app.include_router(youtube.router)
-app.include_router(facebook.router)
-app.include_router(instagram.router)
-app.include_router(x.router)
-app.include_router(threads.router)
-app.include_router(tiktok.router)
-app.include_router(wordpress.router)
-app.include_router(ai_video_generation.router)
-app.include_router(generated_videos.router)
-app.include_router(ai_content.router)
-app.include_router(published_content.router)
-app.include_router(dashboard.router)
-app.include_router(credits.router)
-app.include_router(templates.router)
-
-# Static files 설정 (업로드된 파일 서빙)
+# Static files 디렉토리 (업로드 파일, 템플릿 미리보기 이미지 등)
 uploads_dir = Path(__file__).parent.parent / "uploads"
-uploads_dir.mkdir(exist_ok=True)  # uploads 디렉토리가 없으면 생성
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
-
-# Static files 설정 (템플릿 미리보기 이미지 등)
 static_dir = Path(__file__).parent.parent / "static"
-static_dir.mkdir(exist_ok=True)
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+# 고정 응답 본문은 한 번만 직렬화 (헬스 체크는 로드밸런서가 자주 호출)
+ROOT_RESPONSE_BODY = json.dumps({
+    "message": "Welcome to Contents Creator API",
+    "version": "1.0.0",
+    "docs": DOCS_URL
+}).encode()
+HEALTH_RESPONSE_BODY = json.dumps({"status": "healthy"}).encode()
 
-@app.get("/")
-def read_root():
+
+async def read_root() -> Response:
     """
     API 루트 엔드포인트
     """
-    return {
-        "message": "Welcome to Contents Creator API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
-@app.get("/health")
-def health_check():
+async def health_check() -> Response:
     """
     헬스 체크 엔드포인트
     """
-    return {"status": "healthy"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 # 앱 시작/종료 이벤트
-@app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 스케줄러 시작"""
+    """앱 시작 시 인증 설정, 테이블 생성, 크레딧 패키지 시딩 및 스케줄러 시작"""
+    # import 시점이 아닌 서버 시작 시 인증 설정 (테스트/스크립트에서 import만 할 때는 생략)
+    setup_google_credentials()
+    if RUN_DB_MIGRATIONS:
+        # import 시점이 아닌 서버 시작 시 DB 연결 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        await asyncio.to_thread(create_missing_tables)
+    if ENV != "test":
+        # 시딩은 동기 DB I/O이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        await asyncio.to_thread(seed_initial_credit_packages)
     start_scheduler()
 
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 스케줄러 정지"""
     stop_scheduler()
+
+
+def create_app(router_modules: Optional[List[str]] = None) -> FastAPI:
+    """
+    FastAPI 앱 생성
+
+    Args:
+        router_modules: 등록할 라우터 모듈 목록 (기본값: ROUTER_MODULES 전체)
+            테스트에서는 필요한 라우터만 넘겨 import 범위를 줄일 수 있습니다.
+
+    Returns:
+        미들웨어, 라우터, 정적 파일, 이벤트가 등록된 FastAPI 앱
+    """
+    app = FastAPI(
+        title="Contents Creator API",
+        description="AI 기반 콘텐츠 제작 서비스 API (OAuth2.0 소셜 로그인)",
+        version="1.0.0",
+        openapi_url="/openapi.json" if DOCS_ENABLED else None,
+        docs_url=DOCS_URL,
+        redoc_url="/redoc" if DOCS_ENABLED else None,
+        default_response_class=ORJSONResponse,  # JSON 응답 직렬화에 orjson 사용
+    )
+
+    app.add_middleware(
+        PathScopedSessionMiddleware,
+        path_prefixes=SESSION_PATH_PREFIXES,
+        secret_key=os.getenv("SECRET_KEY", "your-secret-key-here")
+    )
+
+    # CORS 설정 - 모든 출처 허용 (credentials 미사용)
+    # 가장 바깥 미들웨어로 등록되어 preflight 요청은 세션 처리 전에 바로 응답
+    app.add_middleware(WildcardCORSMiddleware)
+
+    # 라우터 등록 (모듈은 앱 생성 후 등록 시점에 import)
+    register_routers(app, ROUTER_MODULES if router_modules is None else router_modules)
+
+    # Static files 설정 (업로드된 파일 서빙)
+    # 운영 환경에서 nginx/CDN이 /uploads를 직접 서빙하면 SERVE_UPLOADS=0 으로 마운트 생략
+    uploads_dir.mkdir(exist_ok=True)  # uploads 디렉토리가 없으면 생성
+    if os.getenv("SERVE_UPLOADS", "1") == "1":
+        app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+
+    # Static files 설정 (템플릿 미리보기 이미지 등)
+    static_dir.mkdir(exist_ok=True)
+    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+
+    app.add_api_route("/", read_root, methods=["GET"], response_model=None)
+    app.add_api_route("/health", health_check, methods=["GET"], response_model=None)
+
+    app.add_event_handler("startup", startup_event)
+    app.add_event_handler("shutdown", shutdown_event)
+
+    return app
+
+
+app = create_app()
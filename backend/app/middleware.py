@@ -0,0 +1,85 @@
+"""
+ASGI 미들웨어 모듈
+
+요청마다 실행되는 미들웨어는 Starlette BaseHTTPMiddleware 대신
+순수 ASGI 형태로 구현합니다.
+"""
+from typing import Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Preflight 응답에 허용할 메서드 (CORSMiddleware allow_methods=["*"]와 동일)
+ALLOW_METHODS = "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = "600"
+
+
+class WildcardCORSMiddleware:
+    """
+    모든 출처를 허용하는 CORS 미들웨어 (credentials 미사용)
+
+    CORSMiddleware(allow_origins=["*"], allow_credentials=False, allow_methods=["*"],
+    allow_headers=["*"], expose_headers=["*"])와 같은 헤더를 내려주지만,
+    출처 목록/정규식 검사 없이 고정 헤더만 추가합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if "origin" not in headers:
+            # 동일 출처 요청 (CORS 헤더 불필요)
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and "access-control-request-method" in headers:
+            # Preflight 요청은 앱까지 전달하지 않고 바로 응답
+            preflight_headers = {
+                "Access-Control-Allow-Origin": "*",
+                "Access-Control-Allow-Methods": ALLOW_METHODS,
+                "Access-Control-Max-Age": PREFLIGHT_MAX_AGE,
+            }
+            requested_headers = headers.get("access-control-request-headers")
+            if requested_headers:
+                preflight_headers["Access-Control-Allow-Headers"] = requested_headers
+
+            response = PlainTextResponse("OK", status_code=200, headers=preflight_headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["Access-Control-Allow-Origin"] = "*"
+                response_headers["Access-Control-Expose-Headers"] = "*"
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class PathScopedSessionMiddleware:
+    """
+    지정한 경로에서만 SessionMiddleware를 실행하는 미들웨어
+
+    세션은 OAuth 로그인/연동 흐름(state 저장)에서만 사용하므로,
+    헬스 체크, 정적 파일 등 나머지 요청은 세션 쿠키 서명/검증 없이 통과시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: Tuple[str, ...], **session_kwargs):
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.session_app = SessionMiddleware(app, **session_kwargs)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] in ("http", "websocket") and scope["path"].startswith(self.path_prefixes):
+            await self.session_app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -1,219 +1,378 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, JSON
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+import base64
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from sqlalchemy import BigInteger, Integer, SmallInteger, String, Boolean, DateTime, Text, ForeignKey, Float, Index, Computed, Enum, CheckConstraint, Identity, LargeBinary
+from sqlalchemy import DDL, FetchedValue, TypeDecorator, event, update
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import expression, func
 from .database import Base
 
+# 값이 고정된 상태 컬럼은 PostgreSQL ENUM 타입으로 저장 (4바이트, Python에서는 문자열 그대로 사용)
+CONTENT_STATUS = Enum("draft", "published", "scheduled", name="content_status")
+GENERATION_STATUS = Enum("pending", "generating", "completed", "failed", name="generation_status")
+ANALYSIS_STATUS = Enum("pending", "analyzing", "completed", "failed", name="analysis_status")
+CHAT_ROLE = Enum("user", "assistant", name="chat_role")
+VIDEO_TIER = Enum("short", "standard", "premium", name="video_tier")
+PRIVACY_STATUS = Enum("public", "private", "unlisted", name="privacy_status")
 
-class User(Base):
+
+class HexColorArray(TypeDecorator):
+    """
+    HEX 색상 목록 (["#FF5733", ...])을 integer[] (RGB 24비트 정수)로 저장하는 타입
+    - 애플리케이션에서는 기존처럼 "#RRGGBB" 문자열 리스트로 사용
+    - "#RGB" 축약형은 6자리로 확장, HEX가 아닌 값은 저장하지 않음
+    """
+    impl = ARRAY(Integer)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+
+        colors = []
+        for color in value:
+            hex_value = str(color).strip().lstrip("#")
+            if len(hex_value) == 3:
+                hex_value = "".join(ch * 2 for ch in hex_value)
+            if len(hex_value) != 6:
+                continue
+            try:
+                colors.append(int(hex_value, 16))
+            except ValueError:
+                continue
+        return colors
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return [f"#{color:06X}" for color in value]
+
+
+TOKEN_NONCE_SIZE = 12  # AES-GCM 권장 nonce 길이 (96비트)
+
+
+@lru_cache(maxsize=1)
+def _token_cipher() -> AESGCM:
+    """TOKEN_ENCRYPTION_KEY (base64 32바이트)로 만든 AES-GCM 인스턴스 (프로세스당 한 번 생성)"""
+    key = os.getenv("TOKEN_ENCRYPTION_KEY")
+    if not key:
+        raise ValueError("TOKEN_ENCRYPTION_KEY 환경 변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
+    return AESGCM(base64.b64decode(key))
+
+
+def encrypt_token(value: str) -> bytes:
+    """토큰 문자열을 nonce || ciphertext || tag 바이트로 암호화"""
+    nonce = os.urandom(TOKEN_NONCE_SIZE)
+    return nonce + _token_cipher().encrypt(nonce, value.encode(), None)
+
+
+def decrypt_token(data: bytes) -> str:
+    """encrypt_token으로 암호화한 바이트를 토큰 문자열로 복호화"""
+    data = bytes(data)
+    return _token_cipher().decrypt(data[:TOKEN_NONCE_SIZE], data[TOKEN_NONCE_SIZE:], None).decode()
+
+
+class EncryptedToken(TypeDecorator):
+    """
+    OAuth 토큰을 AES-GCM으로 암호화해 bytea로 저장하는 타입
+    - 애플리케이션에서는 기존처럼 평문 문자열로 사용
+    - 같은 값도 매번 다른 nonce로 암호화되므로 WHERE 조건 비교에는 사용 불가
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return encrypt_token(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decrypt_token(value)
+
+
+class CreatedAtMixin:
+    """created_at 공통 컬럼 (DB에서 INSERT 시각 기록)"""
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), sort_order=100)
+
+
+class TimestampMixin(CreatedAtMixin):
+    """created_at/updated_at 공통 컬럼 (updated_at은 DB 트리거가 갱신)"""
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), sort_order=101)
+
+
+class User(TimestampMixin, Base):
     """
     사용자 모델 (OAuth2.0 소셜 로그인 전용)
     """
     __tablename__ = "users"
-
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
-    full_name = Column(String, nullable=True)
-    is_active = Column(Boolean, default=True)
-    is_superuser = Column(Boolean, default=False)
+    __table_args__ = (
+        # OAuth 로그인 조회 (oauth_provider + oauth_id)
+        Index("ix_users_oauth", "oauth_provider", "oauth_id", unique=True),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    email: Mapped[str] = mapped_column(String(254), unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    full_name: Mapped[Optional[str]] = mapped_column(String)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    is_superuser: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())
 
     # OAuth2.0 소셜 로그인 필드
-    oauth_provider = Column(String, nullable=False)  # google, kakao, facebook, apple
-    oauth_id = Column(String, nullable=False, index=True)  # 각 플랫폼의 고유 ID
-    profile_image = Column(String, nullable=True)  # 프로필 이미지 URL
+    oauth_provider: Mapped[str] = mapped_column(String(20))  # google, kakao, facebook, apple
+    oauth_id: Mapped[str] = mapped_column(String(128))  # 각 플랫폼의 고유 ID
+    profile_image: Mapped[Optional[str]] = mapped_column(String)  # 프로필 이미지 URL
 
     # 비즈니스 정보
-    brand_name = Column(String, nullable=True)  # 브랜드명
-    business_type = Column(String, nullable=True)  # 업종
-    business_description = Column(Text, nullable=True)  # 비즈니스 설명
+    brand_name: Mapped[Optional[str]] = mapped_column(String)  # 브랜드명
+    business_type: Mapped[Optional[str]] = mapped_column(String)  # 업종
+    business_description: Mapped[Optional[str]] = mapped_column(Text)  # 비즈니스 설명
 
     # 타겟 고객 정보 (JSON)
-    target_audience = Column(JSON, nullable=True)  # {"age_range": "20-30", "gender": "all", "interests": ["fashion", "beauty"]}
+    # 온보딩/프로필 수정에서 사용자가 직접 입력한 구조화된 타겟 (BrandAnalysis.target_audience는 AI 분석 결과 문구로 별도)
+    target_audience: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # {"age_range": "20-30", "gender": "all", "interests": ["fashion", "beauty"]}
+    # target_audience에서 자주 필터링하는 키 (DB 생성 컬럼, 직접 수정 불가)
+    target_age_range: Mapped[Optional[str]] = mapped_column(String, Computed("target_audience->>'age_range'", persisted=True), index=True)
+    target_gender: Mapped[Optional[str]] = mapped_column(String, Computed("target_audience->>'gender'", persisted=True), index=True)
 
     # 온보딩 완료 여부
-    onboarding_completed = Column(Boolean, default=False)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    onboarding_completed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())
 
     # Relationships
-    preferences = relationship("UserPreference", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    contents = relationship("Content", back_populates="user", cascade="all, delete-orphan")
-    brand_analysis = relationship("BrandAnalysis", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    chat_sessions = relationship("ChatSession", back_populates="user", cascade="all, delete-orphan")
-    youtube_connection = relationship("YouTubeConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    facebook_connection = relationship("FacebookConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    instagram_connection = relationship("InstagramConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    x_connection = relationship("XConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    threads_connection = relationship("ThreadsConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    tiktok_connection = relationship("TikTokConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    wordpress_connection = relationship("WordPressConnection", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    content_sessions = relationship("ContentGenerationSession", back_populates="user", cascade="all, delete-orphan")
-
-
-class UserPreference(Base):
+    preferences: Mapped[Optional["UserPreference"]] = relationship(back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    contents: Mapped[List["Content"]] = relationship(back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    brand_analysis: Mapped[Optional["BrandAnalysis"]] = relationship("BrandAnalysis", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    chat_sessions: Mapped[List["ChatSession"]] = relationship("ChatSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    youtube_connection: Mapped[Optional["YouTubeConnection"]] = relationship("YouTubeConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    facebook_connection: Mapped[Optional["FacebookConnection"]] = relationship("FacebookConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    instagram_connection: Mapped[Optional["InstagramConnection"]] = relationship("InstagramConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    x_connection: Mapped[Optional["XConnection"]] = relationship("XConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    threads_connection: Mapped[Optional["ThreadsConnection"]] = relationship("ThreadsConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    tiktok_connection: Mapped[Optional["TikTokConnection"]] = relationship("TikTokConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    wordpress_connection: Mapped[Optional["WordPressConnection"]] = relationship("WordPressConnection", back_populates="user", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    content_sessions: Mapped[List["ContentGenerationSession"]] = relationship("ContentGenerationSession", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class UserPreference(TimestampMixin, Base):
     """
     사용자 콘텐츠 선호도 모델 (샘플 저장)
     """
     __tablename__ = "user_preferences"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # 글 스타일 샘플
-    text_style_sample = Column(Text, nullable=True)  # 선호하는 글 스타일 샘플
-    text_tone = Column(String, nullable=True)  # casual, professional, friendly, formal
+    text_style_sample: Mapped[Optional[str]] = mapped_column(Text)  # 선호하는 글 스타일 샘플
+    text_tone: Mapped[Optional[str]] = mapped_column(String)  # casual, professional, friendly, formal
 
     # 이미지 스타일 샘플
-    image_style_sample_url = Column(String, nullable=True)  # 샘플 이미지 URL (Cloudinary 등)
-    image_style_description = Column(Text, nullable=True)  # 이미지 스타일 설명
-    image_color_palette = Column(JSON, nullable=True)  # ["#FF5733", "#C70039", "#900C3F"]
+    image_style_sample_url: Mapped[Optional[str]] = mapped_column(String)  # 샘플 이미지 URL (Cloudinary 등)
+    image_style_description: Mapped[Optional[str]] = mapped_column(Text)  # 이미지 스타일 설명
+    image_color_palette: Mapped[Optional[List[str]]] = mapped_column(HexColorArray)  # ["#FF5733", "#C70039", "#900C3F"]
 
     # 영상 스타일 샘플
-    video_style_sample_url = Column(String, nullable=True)  # 샘플 영상 URL
-    video_style_description = Column(Text, nullable=True)  # 영상 스타일 설명
-    video_duration_preference = Column(String, nullable=True)  # short (15s), medium (30s), long (60s+)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    video_style_sample_url: Mapped[Optional[str]] = mapped_column(String)  # 샘플 영상 URL
+    video_style_description: Mapped[Optional[str]] = mapped_column(Text)  # 영상 스타일 설명
+    video_duration_preference: Mapped[Optional[str]] = mapped_column(String)  # short (15s), medium (30s), long (60s+)
 
     # Relationships
-    user = relationship("User", back_populates="preferences")
+    user: Mapped["User"] = relationship(back_populates="preferences")
 
 
-class Content(Base):
+class Content(TimestampMixin, Base):
     """
     통합 콘텐츠 모델 (블로그 + 이미지 + 영상)
     """
     __tablename__ = "contents"
+    __table_args__ = (
+        # 플랫폼/키워드 필터 (platforms @> '["instagram"]') - jsonb_path_ops는 @> 전용으로 인덱스 크기가 작음
+        Index("ix_contents_platforms_gin", "platforms", postgresql_using="gin", postgresql_ops={"platforms": "jsonb_path_ops"}),
+        Index("ix_contents_keywords_gin", "keywords", postgresql_using="gin", postgresql_ops={"keywords": "jsonb_path_ops"}),
+        # 기간별 조회 (created_at >= ?) - 삽입 순서대로 쌓이는 테이블이라 BRIN이 b-tree보다 훨씬 작음
+        Index("ix_contents_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
 
     # 콘텐츠 기본 정보
-    title = Column(String, nullable=False)
-    goal = Column(Text, nullable=False)  # 사용자가 입력한 목표/의도
-    keywords = Column(JSON, nullable=True)  # ["keyword1", "keyword2"]
-    platforms = Column(JSON, nullable=True)  # ["instagram", "blog", "youtube"]
+    title: Mapped[str] = mapped_column(String)
+    goal: Mapped[str] = mapped_column(Text)  # 사용자가 입력한 목표/의도
+    keywords: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["keyword1", "keyword2"]
+    platforms: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["instagram", "blog", "youtube"]
 
-    # 생성된 콘텐츠
-    blog_content = Column(Text, nullable=True)  # 블로그 포스트 내용
-    blog_seo_keywords = Column(JSON, nullable=True)  # SEO 키워드
+    # 생성된 콘텐츠 (긴 본문/카피는 ContentBody에 저장)
+    blog_seo_keywords: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # SEO 키워드
 
-    image_urls = Column(JSON, nullable=True)  # 생성된 이미지 URL 목록
-    image_prompts = Column(JSON, nullable=True)  # 각 이미지의 프롬프트
-
-    video_url = Column(String, nullable=True)  # 생성된 영상 URL
-    video_prompt = Column(Text, nullable=True)  # 영상 생성 프롬프트
-    video_thumbnail_url = Column(String, nullable=True)
-
-    # SNS별 카피
-    instagram_caption = Column(Text, nullable=True)
-    facebook_post = Column(Text, nullable=True)
-    youtube_description = Column(Text, nullable=True)
+    video_url: Mapped[Optional[str]] = mapped_column(String)  # 생성된 영상 URL
+    video_thumbnail_url: Mapped[Optional[str]] = mapped_column(String)
 
     # 상태
-    status = Column(String, nullable=False, default="draft")  # draft, published, scheduled
-    generation_status = Column(String, nullable=False, default="pending")  # pending, generating, completed, failed
-    error_message = Column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(CONTENT_STATUS, default="draft", server_default=expression.text("'draft'"))  # draft, published, scheduled
+    generation_status: Mapped[str] = mapped_column(GENERATION_STATUS, default="pending", server_default=expression.text("'pending'"))  # pending, generating, completed, failed
 
     # 발행 정보
-    published_at = Column(DateTime(timezone=True), nullable=True)
-    scheduled_at = Column(DateTime(timezone=True), nullable=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    # Relationships
+    user: Mapped["User"] = relationship(back_populates="contents")
+    # 생성된 이미지 (순서대로, 콘텐츠 조회 시 IN 쿼리 한 번으로 함께 로드)
+    images: Mapped[List["ContentImage"]] = relationship(
+        back_populates="content",
+        order_by="ContentImage.position",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+    )
+    # 본문 (목록 조회에서는 로드하지 않음, 상세 조회 시 selectinload(Content.body) 필요)
+    body: Mapped[Optional["ContentBody"]] = relationship(
+        back_populates="content",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,  # 삭제 시 본문을 로드하지 않고 DB의 ON DELETE CASCADE에 맡김
+    )
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+# 사용자별 콘텐츠 목록 조회 (WHERE user_id = ? AND status = ? ORDER BY created_at DESC)
+Index("ix_contents_user_status_created", Content.user_id, Content.status, Content.created_at.desc())
+
+
+class ContentImage(Base):
+    """
+    통합 콘텐츠의 생성 이미지 (contents.image_urls / image_prompts 배열 분리)
+    - 이미지 추가 시 contents 행 전체를 다시 쓰지 않고 한 행만 INSERT
+    """
+    __tablename__ = "content_images"
+
+    content_id: Mapped[int] = mapped_column(Integer, ForeignKey("contents.id", ondelete="CASCADE"), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)  # 이미지 순서 (0부터)
+    url: Mapped[str] = mapped_column(String)  # 생성된 이미지 URL
+    prompt: Mapped[Optional[str]] = mapped_column(Text)  # 이미지 생성 프롬프트
 
     # Relationships
-    user = relationship("User", back_populates="contents")
+    content: Mapped["Content"] = relationship(back_populates="images")
 
-class BrandAnalysis(Base):
+
+class ContentBody(Base):
+    """
+    통합 콘텐츠 본문 (contents와 1:1)
+    - 블로그 본문, SNS 카피 등 긴 텍스트를 분리해 contents 행을 작게 유지
+    """
+    __tablename__ = "content_bodies"
+
+    content_id: Mapped[int] = mapped_column(Integer, ForeignKey("contents.id", ondelete="CASCADE"), primary_key=True)
+
+    blog_content: Mapped[Optional[str]] = mapped_column(Text)  # 블로그 포스트 내용
+    video_prompt: Mapped[Optional[str]] = mapped_column(Text)  # 영상 생성 프롬프트
+
+    # SNS별 카피
+    instagram_caption: Mapped[Optional[str]] = mapped_column(Text)
+    facebook_post: Mapped[Optional[str]] = mapped_column(Text)
+    youtube_description: Mapped[Optional[str]] = mapped_column(Text)
+
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Relationships
+    content: Mapped["Content"] = relationship(back_populates="body")
+
+
+class BrandAnalysis(TimestampMixin, Base):
     """
     브랜드 분석 모델 (멀티 플랫폼 지원)
     - 전반적인 브랜드 특성: 모든 플랫폼에 공통으로 적용
     - 플랫폼별 특성: 블로그, 인스타그램, 유튜브 각각의 스타일
+
+    플랫폼별 스타일 필드와 brand_profile_json은 플랫폼 단위 deferred 그룹으로 묶어
+    해당 플랫폼을 쓰는 조회에서만 로드합니다 (여러 그룹을 읽는 조회는 undefer_group 사용).
+    URL/분석 상태/분석 시간 필드는 상태 조회에서 항상 쓰므로 즉시 로드합니다.
     """
     __tablename__ = "brand_analysis"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # ===== 전반적인 브랜드 요소 (Overall Brand Elements) =====
     # 모든 플랫폼에 공통으로 적용되는 브랜드 특성
-    brand_name = Column(String, nullable=True)  # 블로그에서 추론한 브랜드명
-    business_type = Column(String, nullable=True)  # 업종 (예: 카페/베이커리, IT/소프트웨어)
-    brand_tone = Column(String, nullable=True)  # 브랜드 톤앤매너 (예: 친근하고 전문적인)
-    brand_values = Column(JSON, nullable=True)  # 브랜드 가치 ["진정성", "혁신"]
-    target_audience = Column(String, nullable=True)  # 타겟 고객층 (예: 20-30대 여성)
-    brand_personality = Column(Text, nullable=True)  # 브랜드 성격 종합 설명
-    key_themes = Column(JSON, nullable=True)  # 주요 주제 ["건강", "라이프스타일"]
-    emotional_tone = Column(String, nullable=True)  # 감정적 톤 (예: 따뜻한, 유머러스한)
+    brand_name: Mapped[Optional[str]] = mapped_column(String)  # 블로그에서 추론한 브랜드명
+    business_type: Mapped[Optional[str]] = mapped_column(String)  # 업종 (예: 카페/베이커리, IT/소프트웨어)
+    brand_tone: Mapped[Optional[str]] = mapped_column(String)  # 브랜드 톤앤매너 (예: 친근하고 전문적인)
+    brand_values: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # 브랜드 가치 ["진정성", "혁신"]
+    target_audience: Mapped[Optional[str]] = mapped_column(String)  # 타겟 고객층 (예: 20-30대 여성), AI 분석 결과 (사용자 입력값은 User.target_audience)
+    brand_personality: Mapped[Optional[str]] = mapped_column(Text)  # 브랜드 성격 종합 설명
+    key_themes: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # 주요 주제 ["건강", "라이프스타일"]
+    emotional_tone: Mapped[Optional[str]] = mapped_column(String)  # 감정적 톤 (예: 따뜻한, 유머러스한)
 
     # ===== 블로그 플랫폼 특성 (Blog Platform Specifics) =====
-    blog_url = Column(String, nullable=True)  # 분석된 블로그 URL
-    blog_writing_style = Column(String, nullable=True)  # 글쓰기 스타일 (예: ~해요체, 스토리텔링 중심)
-    blog_content_structure = Column(String, nullable=True)  # 콘텐츠 구조 (예: 도입-본론-결론)
-    blog_call_to_action = Column(String, nullable=True)  # 행동 유도 방식 (예: 질문형, 직접적)
-    blog_keyword_usage = Column(JSON, nullable=True)  # 자주 사용하는 키워드와 빈도
-    blog_analyzed_posts = Column(Integer, default=0)  # 분석된 포스트 수
-    blog_analyzed_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 분석 시간
-    blog_analysis_status = Column(String, default="pending")  # pending, analyzing, completed, failed
+    blog_url: Mapped[Optional[str]] = mapped_column(String)  # 분석된 블로그 URL
+    blog_writing_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="blog")  # 글쓰기 스타일 (예: ~해요체, 스토리텔링 중심)
+    blog_content_structure: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="blog")  # 콘텐츠 구조 (예: 도입-본론-결론)
+    blog_call_to_action: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="blog")  # 행동 유도 방식 (예: 질문형, 직접적)
+    blog_keyword_usage: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, deferred=True, deferred_group="blog")  # 자주 사용하는 키워드와 빈도
+    blog_analyzed_posts: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 분석된 포스트 수
+    blog_analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 마지막 분석 시간
+    blog_analysis_status: Mapped[Optional[str]] = mapped_column(ANALYSIS_STATUS, default="pending", server_default=expression.text("'pending'"))  # pending, analyzing, completed, failed
 
     # ===== 인스타그램 플랫폼 특성 (Instagram Platform Specifics) =====
-    instagram_url = Column(String, nullable=True)  # 분석된 인스타그램 URL
-    instagram_caption_style = Column(String, nullable=True)  # 캡션 작성 스타일 (예: 짧고 임팩트 있는)
-    instagram_image_style = Column(String, nullable=True)  # 이미지 느낌 (예: 밝고 화사한, 미니멀)
-    instagram_hashtag_pattern = Column(String, nullable=True)  # 해시태그 사용 패턴 (예: 5-10개, 브랜드명 포함)
-    instagram_color_palette = Column(JSON, nullable=True)  # 주요 색상 팔레트 ["#FF5733", "#C70039"]
-    instagram_analyzed_posts = Column(Integer, default=0)  # 분석된 포스트 수
-    instagram_analyzed_at = Column(DateTime(timezone=True), nullable=True)
-    instagram_analysis_status = Column(String, default="pending")
+    instagram_url: Mapped[Optional[str]] = mapped_column(String)  # 분석된 인스타그램 URL
+    instagram_caption_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="instagram")  # 캡션 작성 스타일 (예: 짧고 임팩트 있는)
+    instagram_image_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="instagram")  # 이미지 느낌 (예: 밝고 화사한, 미니멀)
+    instagram_hashtag_pattern: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="instagram")  # 해시태그 사용 패턴 (예: 5-10개, 브랜드명 포함)
+    instagram_color_palette: Mapped[Optional[List[str]]] = mapped_column(HexColorArray, deferred=True, deferred_group="instagram")  # 주요 색상 팔레트 ["#FF5733", "#C70039"]
+    instagram_analyzed_posts: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 분석된 포스트 수
+    instagram_analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    instagram_analysis_status: Mapped[Optional[str]] = mapped_column(ANALYSIS_STATUS, default="pending", server_default=expression.text("'pending'"))
 
     # ===== 유튜브 플랫폼 특성 (YouTube Platform Specifics) =====
-    youtube_url = Column(String, nullable=True)  # 분석된 유튜브 채널 URL
-    youtube_content_style = Column(String, nullable=True)  # 콘텐츠 스타일 (예: 튜토리얼, 브이로그)
-    youtube_title_pattern = Column(String, nullable=True)  # 제목 패턴 (예: 숫자 활용, 질문형)
-    youtube_description_style = Column(String, nullable=True)  # 설명 작성 스타일
-    youtube_thumbnail_style = Column(String, nullable=True)  # 썸네일 스타일 (예: 텍스트 오버레이, 밝은 배경)
-    youtube_analyzed_videos = Column(Integer, default=0)  # 분석된 영상 수
-    youtube_analyzed_at = Column(DateTime(timezone=True), nullable=True)
-    youtube_analysis_status = Column(String, default="pending")
+    youtube_url: Mapped[Optional[str]] = mapped_column(String)  # 분석된 유튜브 채널 URL
+    youtube_content_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="youtube")  # 콘텐츠 스타일 (예: 튜토리얼, 브이로그)
+    youtube_title_pattern: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="youtube")  # 제목 패턴 (예: 숫자 활용, 질문형)
+    youtube_description_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="youtube")  # 설명 작성 스타일
+    youtube_thumbnail_style: Mapped[Optional[str]] = mapped_column(String, deferred=True, deferred_group="youtube")  # 썸네일 스타일 (예: 텍스트 오버레이, 밝은 배경)
+    youtube_analyzed_videos: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 분석된 영상 수
+    youtube_analyzed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    youtube_analysis_status: Mapped[Optional[str]] = mapped_column(ANALYSIS_STATUS, default="pending", server_default=expression.text("'pending'"))
 
     # ===== 통합 브랜드 프로필 (Unified Brand Profile) =====
-    brand_profile_json = Column(JSON, nullable=True)  # BrandProfile 전체 객체를 JSON으로 저장
-    profile_source = Column(String, nullable=True)  # inferred_from_business_info, analyzed_from_sns, analyzed_from_samples, user_edited
-    profile_confidence = Column(String, nullable=True)  # low, medium, high
-    profile_updated_at = Column(DateTime(timezone=True), nullable=True)  # 프로필 마지막 업데이트 시간
+    brand_profile_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, deferred=True, deferred_group="brand_profile")  # BrandProfile 전체 객체를 JSON으로 저장
+    profile_source: Mapped[Optional[str]] = mapped_column(String)  # inferred_from_business_info, analyzed_from_sns, analyzed_from_samples, user_edited
+    profile_confidence: Mapped[Optional[str]] = mapped_column(String)  # low, medium, high
+    profile_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 프로필 마지막 업데이트 시간
 
     # ===== 전체 분석 상태 (Overall Analysis Status) =====
-    analysis_status = Column(String, default="pending")  # pending, analyzing, completed, failed
-    analysis_progress = Column(Integer, default=0)  # 0-100 진행률 (%)
-    analysis_step = Column(String, nullable=True)  # 현재 분석 단계 (collecting, analyzing, synthesizing, finalizing)
-    analysis_error = Column(Text, nullable=True)  # 실패 시 에러 메시지
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    analysis_status: Mapped[Optional[str]] = mapped_column(ANALYSIS_STATUS, default="pending", server_default=expression.text("'pending'"))  # pending, analyzing, completed, failed
+    analysis_progress: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 0-100 진행률 (%)
+    analysis_step: Mapped[Optional[str]] = mapped_column(String)  # 현재 분석 단계 (collecting, analyzing, synthesizing, finalizing)
+    analysis_error: Mapped[Optional[str]] = mapped_column(Text)  # 실패 시 에러 메시지
 
     # Relationship
-    user = relationship("User", back_populates="brand_analysis")
+    user: Mapped["User"] = relationship("User", back_populates="brand_analysis")
 
 
-class ChatSession(Base):
+class ChatSession(TimestampMixin, Base):
     """
     채팅 세션 모델
     """
     __tablename__ = "chat_sessions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    title = Column(String, nullable=True)  # 세션 제목 (첫 메시지 기반)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    title: Mapped[str] = mapped_column(String, nullable=False, default="", server_default=expression.text("''"))  # 세션 제목 (첫 메시지 기반, 없으면 빈 문자열)
+    # 목록 조회용 캐시 컬럼 (ChatMessage insert/delete 이벤트에서 갱신)
+    message_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=expression.text("0"))
+    last_message_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 마지막 메시지 시각
 
     # Relationships
-    user = relationship("User", back_populates="chat_sessions")
-    messages = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="chat_sessions")
+    # 메시지는 session_id로 직접 조회 (자동 로드 금지, 접근 시 예외)
+    messages: Mapped[List["ChatMessage"]] = relationship("ChatMessage", back_populates="session", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
 class ChatMessage(Base):
@@ -221,100 +380,127 @@ class ChatMessage(Base):
     채팅 메시지 모델
     """
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # 세션별 메시지 조회 (WHERE session_id = ? ORDER BY created_at)
+        Index("ix_chat_messages_session_created", "session_id", "created_at"),
+    )
+
+    # 행 수가 계속 늘어나는 테이블: BIGINT + 시퀀스 값 캐시 (INSERT마다 시퀀스 조회 방지)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(cache=1000), primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("chat_sessions.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
+    role: Mapped[str] = mapped_column(CHAT_ROLE)  # user, assistant
+    content: Mapped[str] = mapped_column(Text)
+    model: Mapped[Optional[str]] = mapped_column(String)  # AI 모델명 (gemini-1.5-pro 등)
+    tokens_used: Mapped[Optional[int]] = mapped_column(Integer)  # 사용된 토큰 수
+
+    # INSERT가 많은 테이블: 트랜잭션 시작 시각(now()) 대신 실제 INSERT 시각 기록
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.clock_timestamp())
+
+    # Relationships
+    session: Mapped["ChatSession"] = relationship("ChatSession", back_populates="messages")
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("chat_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    role = Column(String, nullable=False)  # user, assistant
-    content = Column(Text, nullable=False)
-    model = Column(String, nullable=True)  # AI 모델명 (gemini-1.5-pro 등)
-    tokens_used = Column(Integer, nullable=True)  # 사용된 토큰 수
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+@event.listens_for(ChatMessage, "after_insert")
+def _increment_session_message_count(mapper, connection, target):
+    """메시지 저장 시 세션의 메시지 수/마지막 메시지 시각 갱신 (같은 flush 안에서 실행)"""
+    # last_message_at은 INSERT ... RETURNING으로 받은 메시지 created_at(clock_timestamp)과 같은 값 사용
+    connection.execute(
+        update(ChatSession)
+        .where(ChatSession.id == target.session_id)
+        .values(message_count=ChatSession.message_count + 1, last_message_at=target.created_at)
+    )
 
-    # Relationships
-    session = relationship("ChatSession", back_populates="messages")
+
+@event.listens_for(ChatMessage, "after_delete")
+def _decrement_session_message_count(mapper, connection, target):
+    """ORM으로 메시지 삭제 시 세션의 메시지 수 감소 (Query.delete() 대량 삭제는 제외)"""
+    connection.execute(
+        update(ChatSession)
+        .where(ChatSession.id == target.session_id)
+        .values(message_count=ChatSession.message_count - 1)
+    )
 
 
-class YouTubeConnection(Base):
+class YouTubeConnection(TimestampMixin, Base):
     """
     YouTube 채널 연동 정보 모델
     - 사용자별 YouTube 채널 연동 및 토큰 관리
     """
     __tablename__ = "youtube_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # YouTube 채널 정보
-    channel_id = Column(String, nullable=False, index=True)  # YouTube 채널 ID
-    channel_title = Column(String, nullable=True)  # 채널명
-    channel_description = Column(Text, nullable=True)  # 채널 설명
-    channel_thumbnail_url = Column(String, nullable=True)  # 채널 썸네일
-    channel_custom_url = Column(String, nullable=True)  # 커스텀 URL (@handle)
-    subscriber_count = Column(Integer, nullable=True)  # 구독자 수
-    video_count = Column(Integer, nullable=True)  # 동영상 수
-    view_count = Column(Integer, nullable=True)  # 총 조회수
-
-    # OAuth 토큰 정보 (암호화 저장 권장)
-    access_token = Column(Text, nullable=False)  # YouTube API 액세스 토큰
-    refresh_token = Column(Text, nullable=True)  # 리프레시 토큰
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)  # 토큰 만료 시간
+    channel_id: Mapped[str] = mapped_column(String(64), index=True)  # YouTube 채널 ID
+    channel_title: Mapped[Optional[str]] = mapped_column(String)  # 채널명
+    channel_description: Mapped[Optional[str]] = mapped_column(Text)  # 채널 설명
+    channel_thumbnail_url: Mapped[Optional[str]] = mapped_column(String)  # 채널 썸네일
+    channel_custom_url: Mapped[Optional[str]] = mapped_column(String)  # 커스텀 URL (@handle)
+    subscriber_count: Mapped[Optional[int]] = mapped_column(Integer)  # 구독자 수
+    video_count: Mapped[Optional[int]] = mapped_column(Integer)  # 동영상 수
+    view_count: Mapped[Optional[int]] = mapped_column(Integer)  # 총 조회수
+
+    # OAuth 토큰 정보 (AES-GCM 암호화 저장)
+    access_token: Mapped[str] = mapped_column(EncryptedToken)  # YouTube API 액세스 토큰
+    refresh_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 리프레시 토큰
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 토큰 만료 시간
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)  # 연동 활성화 상태
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 동기화 시간
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())  # 연동 활성화 상태
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 마지막 동기화 시간
 
     # Relationships
-    user = relationship("User", back_populates="youtube_connection")
-    videos = relationship("YouTubeVideo", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="youtube_connection")
+    # 동영상 목록은 connection_id로 직접 조회 (자동 로드 금지, 접근 시 예외)
+    videos: Mapped[List["YouTubeVideo"]] = relationship("YouTubeVideo", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
-class YouTubeVideo(Base):
+class YouTubeVideo(TimestampMixin, Base):
     """
     YouTube 동영상 정보 모델
     - 연동된 채널의 동영상 목록 및 분석 데이터
     """
     __tablename__ = "youtube_videos"
+    __table_args__ = (
+        # 연동 채널별 동영상 목록 (WHERE connection_id = ? ORDER BY published_at DESC)
+        Index("ix_youtube_videos_connection_published", "connection_id", "published_at"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("youtube_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("youtube_connections.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # YouTube 동영상 기본 정보
-    video_id = Column(String, nullable=False, unique=True, index=True)  # YouTube 동영상 ID
-    title = Column(String, nullable=False)
-    description = Column(Text, nullable=True)
-    thumbnail_url = Column(String, nullable=True)  # 썸네일 URL
-    published_at = Column(DateTime(timezone=True), nullable=True)  # 게시 일시
-    duration = Column(String, nullable=True)  # ISO 8601 형식 (PT4M13S)
-    duration_seconds = Column(Integer, nullable=True)  # 초 단위
+    video_id: Mapped[str] = mapped_column(String(32), unique=True, index=True)  # YouTube 동영상 ID
+    title: Mapped[str] = mapped_column(String)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(String)  # 썸네일 URL
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 게시 일시
+    duration: Mapped[Optional[str]] = mapped_column(String)  # ISO 8601 형식 (PT4M13S)
+    duration_seconds: Mapped[Optional[int]] = mapped_column(Integer)  # 초 단위
 
     # 동영상 상태
-    privacy_status = Column(String, nullable=True)  # public, private, unlisted
-    upload_status = Column(String, nullable=True)  # uploaded, processed, failed
+    privacy_status: Mapped[Optional[str]] = mapped_column(PRIVACY_STATUS)  # public, private, unlisted
+    upload_status: Mapped[Optional[str]] = mapped_column(String)  # uploaded, processed, failed
 
     # 동영상 통계 (최신 데이터)
-    view_count = Column(Integer, default=0)
-    like_count = Column(Integer, default=0)
-    comment_count = Column(Integer, default=0)
+    view_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    comment_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # 태그 및 카테고리
-    tags = Column(JSON, nullable=True)  # ["tag1", "tag2"]
-    category_id = Column(String, nullable=True)  # YouTube 카테고리 ID
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["tag1", "tag2"]
+    category_id: Mapped[Optional[str]] = mapped_column(String)  # YouTube 카테고리 ID
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("YouTubeConnection", back_populates="videos")
-    analytics = relationship("YouTubeAnalytics", back_populates="video", cascade="all, delete-orphan")
+    connection: Mapped["YouTubeConnection"] = relationship("YouTubeConnection", back_populates="videos")
+    # 기간별 통계는 video_id로 직접 조회 (자동 로드 금지, 접근 시 예외)
+    analytics: Mapped[List["YouTubeAnalytics"]] = relationship("YouTubeAnalytics", back_populates="video", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
 class YouTubeAnalytics(Base):
@@ -323,211 +509,215 @@ class YouTubeAnalytics(Base):
     - 일별/주별 성과 데이터 저장
     """
     __tablename__ = "youtube_analytics"
+    __table_args__ = (
+        # 영상별 기간 조회 (WHERE video_id = ? AND date BETWEEN ...)
+        Index("ix_youtube_analytics_video_date", "video_id", "date"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    video_id = Column(Integer, ForeignKey("youtube_videos.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # 행 수가 계속 늘어나는 테이블: BIGINT + 시퀀스 값 캐시 (INSERT마다 시퀀스 조회 방지)
+    id: Mapped[int] = mapped_column(BigInteger, Identity(cache=1000), primary_key=True)
+    video_id: Mapped[int] = mapped_column(Integer, ForeignKey("youtube_videos.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 분석 기간
-    date = Column(DateTime(timezone=True), nullable=False)  # 해당 날짜
+    date: Mapped[datetime] = mapped_column(DateTime(timezone=True))  # 해당 날짜
 
     # 조회 지표
-    views = Column(Integer, default=0)  # 조회수
-    watch_time_minutes = Column(Float, default=0)  # 시청 시간 (분)
-    average_view_duration = Column(Float, default=0)  # 평균 시청 시간 (초)
-    average_view_percentage = Column(Float, default=0)  # 평균 시청 비율 (%)
+    views: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 조회수
+    watch_time_minutes: Mapped[Optional[float]] = mapped_column(Float, default=0, server_default=expression.text("0"))  # 시청 시간 (분)
+    average_view_duration: Mapped[Optional[float]] = mapped_column(Float, default=0, server_default=expression.text("0"))  # 평균 시청 시간 (초)
+    average_view_percentage: Mapped[Optional[float]] = mapped_column(Float, default=0, server_default=expression.text("0"))  # 평균 시청 비율 (%)
 
     # 참여 지표
-    likes = Column(Integer, default=0)
-    dislikes = Column(Integer, default=0)
-    comments = Column(Integer, default=0)
-    shares = Column(Integer, default=0)
+    likes: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    dislikes: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    comments: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    shares: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # 구독 지표
-    subscribers_gained = Column(Integer, default=0)
-    subscribers_lost = Column(Integer, default=0)
+    subscribers_gained: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    subscribers_lost: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # 트래픽 소스 (JSON)
-    traffic_sources = Column(JSON, nullable=True)  # {"search": 30, "suggested": 40, "external": 20}
+    traffic_sources: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # {"search": 30, "suggested": 40, "external": 20}
 
     # 시청자 정보 (JSON)
-    demographics = Column(JSON, nullable=True)  # {"age_group": {...}, "gender": {...}, "country": {...}}
+    demographics: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # {"age_group": {...}, "gender": {...}, "country": {...}}
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # INSERT가 많은 테이블: 트랜잭션 시작 시각(now()) 대신 실제 INSERT 시각 기록
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.clock_timestamp())
 
     # Relationships
-    video = relationship("YouTubeVideo", back_populates="analytics")
+    video: Mapped["YouTubeVideo"] = relationship("YouTubeVideo", back_populates="analytics")
 
 
-class FacebookConnection(Base):
+class FacebookConnection(TimestampMixin, Base):
     """
     Facebook 페이지 연동 정보 모델
     - 사용자별 Facebook 페이지 연동 및 토큰 관리
     """
     __tablename__ = "facebook_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # Facebook 사용자 정보
-    facebook_user_id = Column(String, nullable=False, index=True)  # Facebook 사용자 ID
-    facebook_user_name = Column(String, nullable=True)  # Facebook 사용자 이름
+    facebook_user_id: Mapped[str] = mapped_column(String(64), index=True)  # Facebook 사용자 ID
+    facebook_user_name: Mapped[Optional[str]] = mapped_column(String)  # Facebook 사용자 이름
 
     # 연동된 Facebook 페이지 정보
-    page_id = Column(String, nullable=True, index=True)  # Facebook 페이지 ID
-    page_name = Column(String, nullable=True)  # 페이지 이름
-    page_category = Column(String, nullable=True)  # 페이지 카테고리
-    page_picture_url = Column(String, nullable=True)  # 페이지 프로필 사진
-    page_fan_count = Column(Integer, nullable=True)  # 페이지 팬(좋아요) 수
-    page_followers_count = Column(Integer, nullable=True)  # 페이지 팔로워 수
+    page_id: Mapped[Optional[str]] = mapped_column(String(64), index=True)  # Facebook 페이지 ID
+    page_name: Mapped[Optional[str]] = mapped_column(String)  # 페이지 이름
+    page_category: Mapped[Optional[str]] = mapped_column(String)  # 페이지 카테고리
+    page_picture_url: Mapped[Optional[str]] = mapped_column(String)  # 페이지 프로필 사진
+    page_fan_count: Mapped[Optional[int]] = mapped_column(Integer)  # 페이지 팬(좋아요) 수
+    page_followers_count: Mapped[Optional[int]] = mapped_column(Integer)  # 페이지 팔로워 수
 
     # OAuth 토큰 정보
-    user_access_token = Column(Text, nullable=False)  # 사용자 액세스 토큰
-    page_access_token = Column(Text, nullable=True)  # 페이지 액세스 토큰 (장기 토큰)
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)  # 토큰 만료 시간
+    user_access_token: Mapped[str] = mapped_column(EncryptedToken)  # 사용자 액세스 토큰
+    page_access_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 페이지 액세스 토큰 (장기 토큰)
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 토큰 만료 시간
 
     # 관리 가능한 페이지 목록 (캐싱)
-    available_pages = Column(JSON, nullable=True)  # [{"id": "...", "name": "...", ...}, ...]
+    available_pages: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # [{"id": "...", "name": "...", ...}, ...]
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="facebook_connection")
-    posts = relationship("FacebookPost", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="facebook_connection")
+    # 게시물 목록은 connection_id로 직접 조회 (자동 로드 금지, 접근 시 예외)
+    posts: Mapped[List["FacebookPost"]] = relationship("FacebookPost", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
-class FacebookPost(Base):
+class FacebookPost(TimestampMixin, Base):
     """
     Facebook 페이지 게시물 모델
     - 연동된 페이지의 게시물 목록 및 통계
     """
     __tablename__ = "facebook_posts"
+    __table_args__ = (
+        # 연동 계정별 게시물 목록 (WHERE connection_id = ? ORDER BY created_time DESC)
+        Index("ix_facebook_posts_connection_created", "connection_id", "created_time"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("facebook_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("facebook_connections.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # Facebook 게시물 기본 정보
-    post_id = Column(String, nullable=False, unique=True, index=True)  # Facebook 게시물 ID
-    message = Column(Text, nullable=True)  # 게시물 텍스트
-    story = Column(String, nullable=True)  # 스토리 텍스트
-    full_picture = Column(String, nullable=True)  # 게시물 이미지 URL
-    permalink_url = Column(String, nullable=True)  # 게시물 링크
-    post_type = Column(String, nullable=True)  # link, status, photo, video
-    created_time = Column(DateTime(timezone=True), nullable=True)  # 게시 시간
+    post_id: Mapped[str] = mapped_column(String(128), unique=True, index=True)  # Facebook 게시물 ID
+    message: Mapped[Optional[str]] = mapped_column(Text)  # 게시물 텍스트
+    story: Mapped[Optional[str]] = mapped_column(String)  # 스토리 텍스트
+    full_picture: Mapped[Optional[str]] = mapped_column(String)  # 게시물 이미지 URL
+    permalink_url: Mapped[Optional[str]] = mapped_column(String)  # 게시물 링크
+    post_type: Mapped[Optional[str]] = mapped_column(String)  # link, status, photo, video
+    created_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 게시 시간
 
     # 게시물 상태
-    is_published = Column(Boolean, default=True)
-    is_hidden = Column(Boolean, default=False)
+    is_published: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    is_hidden: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())
 
     # 게시물 통계
-    likes_count = Column(Integer, default=0)
-    comments_count = Column(Integer, default=0)
-    shares_count = Column(Integer, default=0)
-    reactions_count = Column(Integer, default=0)  # 전체 반응 수
+    likes_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    comments_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    shares_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    reactions_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 전체 반응 수
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("FacebookConnection", back_populates="posts")
+    connection: Mapped["FacebookConnection"] = relationship("FacebookConnection", back_populates="posts")
 
 
-class InstagramConnection(Base):
+class InstagramConnection(TimestampMixin, Base):
     """
     Instagram 비즈니스 계정 연동 정보 모델
     - Facebook 페이지와 연결된 Instagram 비즈니스/크리에이터 계정
     """
     __tablename__ = "instagram_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # Facebook 사용자 정보
-    facebook_user_id = Column(String, nullable=True)  # Facebook 사용자 ID
-    facebook_user_name = Column(String, nullable=True)  # Facebook 사용자 이름
+    facebook_user_id: Mapped[Optional[str]] = mapped_column(String)  # Facebook 사용자 ID
+    facebook_user_name: Mapped[Optional[str]] = mapped_column(String)  # Facebook 사용자 이름
 
     # 연동된 Facebook 페이지 정보
-    page_id = Column(String, nullable=True, index=True)  # Facebook 페이지 ID
-    page_name = Column(String, nullable=True)  # 페이지 이름
+    page_id: Mapped[Optional[str]] = mapped_column(String(64), index=True)  # Facebook 페이지 ID
+    page_name: Mapped[Optional[str]] = mapped_column(String)  # 페이지 이름
 
     # Instagram 계정 정보
-    instagram_account_id = Column(String, nullable=True, index=True)  # Instagram 비즈니스 계정 ID
-    instagram_username = Column(String, nullable=True)  # Instagram 사용자명 (@username)
-    instagram_name = Column(String, nullable=True)  # 표시 이름
-    instagram_profile_picture_url = Column(String, nullable=True)  # 프로필 사진 URL
-    instagram_biography = Column(Text, nullable=True)  # 자기소개
-    instagram_website = Column(String, nullable=True)  # 웹사이트 URL
+    instagram_account_id: Mapped[Optional[str]] = mapped_column(String(64), index=True)  # Instagram 비즈니스 계정 ID
+    instagram_username: Mapped[Optional[str]] = mapped_column(String)  # Instagram 사용자명 (@username)
+    instagram_name: Mapped[Optional[str]] = mapped_column(String)  # 표시 이름
+    instagram_profile_picture_url: Mapped[Optional[str]] = mapped_column(String)  # 프로필 사진 URL
+    instagram_biography: Mapped[Optional[str]] = mapped_column(Text)  # 자기소개
+    instagram_website: Mapped[Optional[str]] = mapped_column(String)  # 웹사이트 URL
 
     # 계정 통계
-    followers_count = Column(Integer, default=0)  # 팔로워 수
-    follows_count = Column(Integer, default=0)  # 팔로잉 수
-    media_count = Column(Integer, default=0)  # 게시물 수
+    followers_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 팔로워 수
+    follows_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 팔로잉 수
+    media_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 게시물 수
 
     # OAuth 토큰 정보
-    user_access_token = Column(Text, nullable=True)  # 사용자 액세스 토큰
-    page_access_token = Column(Text, nullable=True)  # 페이지 액세스 토큰
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)
+    user_access_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 사용자 액세스 토큰
+    page_access_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 페이지 액세스 토큰
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="instagram_connection")
-    posts = relationship("InstagramPost", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="instagram_connection")
+    # 게시물 목록은 connection_id로 직접 조회 (자동 로드 금지, 접근 시 예외)
+    posts: Mapped[List["InstagramPost"]] = relationship("InstagramPost", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 
-class InstagramPost(Base):
+class InstagramPost(TimestampMixin, Base):
     """
     Instagram 게시물 모델
     - 연동된 비즈니스 계정의 게시물 목록 및 통계
     """
     __tablename__ = "instagram_posts"
+    __table_args__ = (
+        # 연동 계정별 게시물 목록 (WHERE connection_id = ? ORDER BY timestamp DESC)
+        Index("ix_instagram_posts_connection_timestamp", "connection_id", "timestamp"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("instagram_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("instagram_connections.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # Instagram 게시물 기본 정보
-    media_id = Column(String, nullable=False, unique=True, index=True)  # Instagram 미디어 ID
-    media_type = Column(String, nullable=True)  # IMAGE, VIDEO, CAROUSEL_ALBUM
-    media_url = Column(String, nullable=True)  # 미디어 URL
-    thumbnail_url = Column(String, nullable=True)  # 썸네일 URL (비디오용)
-    permalink = Column(String, nullable=True)  # 게시물 링크
-    caption = Column(Text, nullable=True)  # 캡션
-    timestamp = Column(DateTime(timezone=True), nullable=True)  # 게시 시간
+    media_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)  # Instagram 미디어 ID
+    media_type: Mapped[Optional[str]] = mapped_column(String)  # IMAGE, VIDEO, CAROUSEL_ALBUM
+    media_url: Mapped[Optional[str]] = mapped_column(String)  # 미디어 URL
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(String)  # 썸네일 URL (비디오용)
+    permalink: Mapped[Optional[str]] = mapped_column(String)  # 게시물 링크
+    caption: Mapped[Optional[str]] = mapped_column(Text)  # 캡션
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 게시 시간
 
     # 게시물 통계
-    like_count = Column(Integer, default=0)
-    comments_count = Column(Integer, default=0)
-    saved_count = Column(Integer, default=0)  # 저장 수 (비즈니스 계정만)
-    reach_count = Column(Integer, default=0)  # 도달 수 (비즈니스 계정만)
-    impressions_count = Column(Integer, default=0)  # 노출 수 (비즈니스 계정만)
-    engagement_count = Column(Integer, default=0)  # 참여 수
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    comments_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    saved_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 저장 수 (비즈니스 계정만)
+    reach_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 도달 수 (비즈니스 계정만)
+    impressions_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 노출 수 (비즈니스 계정만)
+    engagement_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 참여 수
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("InstagramConnection", back_populates="posts")
+    connection: Mapped["InstagramConnection"] = relationship("InstagramConnection", back_populates="posts")
 
 
-class VideoGenerationJob(Base):
+class VideoGenerationJob(CreatedAtMixin, Base):
     """
     AI 비디오 생성 작업 모델
     - 사용자가 업로드한 제품 사진과 정보를 기반으로
@@ -536,24 +726,33 @@ class VideoGenerationJob(Base):
     - 이미지 생성 → 비디오 트랜지션 생성 → 최종 합성
     """
     __tablename__ = "video_generation_jobs"
-
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, unique=True, nullable=False, index=True)  # 작업 추적용 고유 세션 ID (UUID)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'analyzing_product', 'planning_story', 'designing_scenes', 'validating_quality', "
+            "'generating_images', 'generating_videos', 'composing', 'completed', 'failed')",
+            name="ck_video_generation_jobs_status",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)  # 작업 추적용 고유 세션 ID (UUID)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 제품 정보
-    product_name = Column(String, nullable=False)  # 제품명
-    product_description = Column(Text, nullable=True)  # 제품 설명
-    uploaded_image_url = Column(String, nullable=False)  # 업로드된 제품 이미지 URL
+    product_name: Mapped[str] = mapped_column(String)  # 제품명
+    product_description: Mapped[Optional[str]] = mapped_column(Text)  # 제품 설명
+    uploaded_image_url: Mapped[str] = mapped_column(String)  # 업로드된 제품 이미지 URL
 
     # 영상 설정
-    tier = Column(String, nullable=False)  # short, standard, premium
-    cut_count = Column(Integer, nullable=False)  # 4, 6, 8
-    duration_seconds = Column(Integer, nullable=False)  # 15, 25, 40
+    tier: Mapped[str] = mapped_column(VIDEO_TIER)  # short, standard, premium
+    cut_count: Mapped[int] = mapped_column(SmallInteger)  # 4, 6, 8
+    duration_seconds: Mapped[int] = mapped_column(SmallInteger)  # 15, 25, 40
 
     # ===== 4단계 Agent 파이프라인 결과 =====
+    # 크기가 큰 JSONB 결과는 deferred 그룹으로 묶어 상태 조회/갱신 시 SELECT하지 않음
+    # (하나에 접근하면 그룹 전체를 한 번에 로드, 목록/상세 조회는 undefer_group 사용)
     # 1단계: 제품 분석 결과
-    product_analysis = Column(JSON, nullable=True)
+    product_analysis: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")
     # {
     #   "category": {"main": "...", "sub": "..."},
     #   "key_features": [...],
@@ -563,7 +762,7 @@ class VideoGenerationJob(Base):
     # }
 
     # 2단계: 스토리 기획 결과
-    story_plan = Column(JSON, nullable=True)
+    story_plan: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")
     # {
     #   "selected_structure": "...",
     #   "selection_reason": "...",
@@ -573,10 +772,10 @@ class VideoGenerationJob(Base):
     # }
 
     # 3단계: 최종 스토리보드 (기존 필드 유지)
-    storyboard = Column(JSON, nullable=True)  # [{"cut": 1, "scene": "...", "image_prompt": "...", "duration": 5}, ...]
+    storyboard: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")  # [{"cut": 1, "scene": "...", "image_prompt": "...", "duration": 5}, ...]
 
     # 4단계: 품질 검증 결과
-    quality_evaluation = Column(JSON, nullable=True)
+    quality_evaluation: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")
     # {
     #   "evaluation": {"story_coherence": {...}, "visual_consistency": {...}, ...},
     #   "total_score": 8.5,
@@ -586,17 +785,17 @@ class VideoGenerationJob(Base):
     # }
 
     # ===== 생성 단계별 데이터 =====
-    generated_image_urls = Column(JSON, nullable=True)  # [{"cut": 1, "url": "..."}, ...]
-    generated_video_urls = Column(JSON, nullable=True)  # [{"transition": "1-2", "url": "..."}, ...]
-    final_video_url = Column(String, nullable=True)  # 최종 합성된 비디오 URL
+    generated_image_urls: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")  # [{"cut": 1, "url": "..."}, ...]
+    generated_video_urls: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB, deferred=True, deferred_group="pipeline_results")  # [{"transition": "1-2", "url": "..."}, ...]
+    final_video_url: Mapped[Optional[str]] = mapped_column(String)  # 최종 합성된 비디오 URL
 
     # ===== 메타데이터 =====
-    generation_attempts = Column(Integer, nullable=True, default=1)  # 품질 검증 재시도 횟수
-    brand_confidence_used = Column(String, nullable=True)  # 적용된 브랜드 신뢰도 (high/medium/low)
-    processing_time_seconds = Column(Float, nullable=True)  # 총 처리 시간
+    generation_attempts: Mapped[Optional[int]] = mapped_column(Integer, default=1, server_default=expression.text("1"))  # 품질 검증 재시도 횟수
+    brand_confidence_used: Mapped[Optional[str]] = mapped_column(String)  # 적용된 브랜드 신뢰도 (high/medium/low)
+    processing_time_seconds: Mapped[Optional[float]] = mapped_column(Float)  # 총 처리 시간
 
     # ===== 상태 추적 =====
-    status = Column(String, nullable=False, default="pending")
+    status: Mapped[str] = mapped_column(String(30), default="pending", server_default=expression.text("'pending'"))
     # pending: 대기 중
     # analyzing_product: 1단계 - 제품 분석 중
     # planning_story: 2단계 - 스토리 기획 중
@@ -608,17 +807,16 @@ class VideoGenerationJob(Base):
     # completed: 완료
     # failed: 실패
 
-    current_step = Column(String, nullable=True)  # 현재 진행 중인 단계 상세 설명
-    error_message = Column(Text, nullable=True)  # 에러 메시지
+    current_step: Mapped[Optional[str]] = mapped_column(String)  # 현재 진행 중인 단계 상세 설명
+    error_message: Mapped[Optional[str]] = mapped_column(Text)  # 에러 메시지
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    completed_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedVideo(Base):
+class GeneratedVideo(CreatedAtMixin, Base):
     """
     생성된 비디오 (완료된 결과물만 저장)
     - VideoGenerationJob과 session_id로 1:1 연결
@@ -626,311 +824,291 @@ class GeneratedVideo(Base):
     """
     __tablename__ = "generated_videos"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, ForeignKey("video_generation_jobs.session_id"), nullable=False, unique=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[str] = mapped_column(String(64), ForeignKey("video_generation_jobs.session_id"), unique=True, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 비디오 정보
-    final_video_url = Column(String, nullable=False)  # Supabase Storage URL
-    product_name = Column(String, nullable=False)  # 제품명 (검색/표시용)
-    tier = Column(String, nullable=False)  # short, standard, premium
-    duration_seconds = Column(Integer, nullable=False)  # 15, 25, 40
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    final_video_url: Mapped[str] = mapped_column(String)  # Supabase Storage URL
+    product_name: Mapped[str] = mapped_column(String)  # 제품명 (검색/표시용)
+    tier: Mapped[str] = mapped_column(VIDEO_TIER)  # short, standard, premium
+    duration_seconds: Mapped[int] = mapped_column(SmallInteger)  # 15, 25, 40
 
     # Relationships
-    user = relationship("User")
+    user: Mapped["User"] = relationship("User")
 
 
-class XConnection(Base):
+class XConnection(TimestampMixin, Base):
     """
     X(구 Twitter) 계정 연동 정보 모델
     - X API v2를 사용한 OAuth 2.0 연동
     """
     __tablename__ = "x_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # X 사용자 정보
-    x_user_id = Column(String, nullable=False, index=True)  # X 사용자 ID
-    username = Column(String, nullable=True)  # @username (handle)
-    name = Column(String, nullable=True)  # 표시 이름
-    description = Column(Text, nullable=True)  # 자기소개
-    profile_image_url = Column(String, nullable=True)  # 프로필 이미지 URL
-    verified = Column(Boolean, default=False)  # 인증 계정 여부
+    x_user_id: Mapped[str] = mapped_column(String(64), index=True)  # X 사용자 ID
+    username: Mapped[Optional[str]] = mapped_column(String)  # @username (handle)
+    name: Mapped[Optional[str]] = mapped_column(String)  # 표시 이름
+    description: Mapped[Optional[str]] = mapped_column(Text)  # 자기소개
+    profile_image_url: Mapped[Optional[str]] = mapped_column(String)  # 프로필 이미지 URL
+    verified: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())  # 인증 계정 여부
 
     # 계정 통계
-    followers_count = Column(Integer, default=0)  # 팔로워 수
-    following_count = Column(Integer, default=0)  # 팔로잉 수
-    post_count = Column(Integer, default=0)  # 포스트 수
-    listed_count = Column(Integer, default=0)  # 리스트에 추가된 수
+    followers_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 팔로워 수
+    following_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 팔로잉 수
+    post_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 포스트 수
+    listed_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 리스트에 추가된 수
 
     # OAuth 2.0 토큰 정보
-    access_token = Column(Text, nullable=False)  # 액세스 토큰
-    refresh_token = Column(Text, nullable=True)  # 리프레시 토큰
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)  # 토큰 만료 시간
+    access_token: Mapped[str] = mapped_column(EncryptedToken)  # 액세스 토큰
+    refresh_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 리프레시 토큰
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 토큰 만료 시간
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="x_connection")
-    posts = relationship("XPost", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="x_connection")
+    posts: Mapped[List["XPost"]] = relationship("XPost", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class XPost(Base):
+class XPost(TimestampMixin, Base):
     """
     X 포스트 모델
     - 연동된 계정의 포스트 목록 및 통계
     """
     __tablename__ = "x_posts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("x_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("x_connections.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 포스트 기본 정보
-    post_id = Column(String, nullable=False, unique=True, index=True)  # X 포스트 ID
-    text = Column(Text, nullable=True)  # 포스트 텍스트
-    created_at_x = Column(DateTime(timezone=True), nullable=True)  # 포스트 작성 시간
+    post_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)  # X 포스트 ID
+    text: Mapped[Optional[str]] = mapped_column(Text)  # 포스트 텍스트
+    created_at_x: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 포스트 작성 시간
 
     # 미디어 정보
-    media_type = Column(String, nullable=True)  # photo, video, animated_gif
-    media_url = Column(String, nullable=True)  # 첫 번째 미디어 URL
-    media_urls = Column(JSON, nullable=True)  # 모든 미디어 URL 목록
+    media_type: Mapped[Optional[str]] = mapped_column(String)  # photo, video, animated_gif
+    media_url: Mapped[Optional[str]] = mapped_column(String)  # 첫 번째 미디어 URL
+    media_urls: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # 모든 미디어 URL 목록
 
     # 포스트 통계
-    repost_count = Column(Integer, default=0)  # 리포스트 수
-    reply_count = Column(Integer, default=0)  # 답글 수
-    like_count = Column(Integer, default=0)  # 좋아요 수
-    quote_count = Column(Integer, default=0)  # 인용 포스트 수
-    bookmark_count = Column(Integer, default=0)  # 북마크 수
-    impression_count = Column(Integer, default=0)  # 노출 수
+    repost_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 리포스트 수
+    reply_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 답글 수
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 좋아요 수
+    quote_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 인용 포스트 수
+    bookmark_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 북마크 수
+    impression_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 노출 수
 
     # 포스트 메타데이터
-    conversation_id = Column(String, nullable=True)  # 대화 ID (스레드)
-    in_reply_to_user_id = Column(String, nullable=True)  # 답글 대상 사용자 ID
-    referenced_posts = Column(JSON, nullable=True)  # 참조된 포스트 목록
+    conversation_id: Mapped[Optional[str]] = mapped_column(String)  # 대화 ID (스레드)
+    in_reply_to_user_id: Mapped[Optional[str]] = mapped_column(String)  # 답글 대상 사용자 ID
+    referenced_posts: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # 참조된 포스트 목록
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("XConnection", back_populates="posts")
+    connection: Mapped["XConnection"] = relationship("XConnection", back_populates="posts")
 
 
 # ============================================
 # 새로운 콘텐츠 생성 테이블 구조 (v2)
 # ============================================
 
-class ContentGenerationSession(Base):
+class ContentGenerationSession(TimestampMixin, Base):
     """
     콘텐츠 생성 세션 (사용자 입력값 저장)
     - 사용자가 입력한 주제, 생성 타입, 스타일, 선택한 플랫폼 등 저장
     - 각 플랫폼별 결과 테이블과 연결
     """
     __tablename__ = "content_generation_sessions"
+    __table_args__ = (
+        CheckConstraint("status IN ('generated', 'published', 'archived')", name="ck_content_generation_sessions_status"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     # 사용자 입력값
-    topic = Column(Text, nullable=False)  # 주제
-    content_type = Column(String, nullable=False)  # text, image, both
-    style = Column(String, nullable=False)  # casual, professional, friendly, etc.
-    selected_platforms = Column(JSON, nullable=False)  # ["blog", "sns", "x", "threads"]
+    topic: Mapped[str] = mapped_column(Text)  # 주제
+    content_type: Mapped[str] = mapped_column(String)  # text, image, both
+    style: Mapped[str] = mapped_column(String)  # casual, professional, friendly, etc.
+    selected_platforms: Mapped[List[str]] = mapped_column(JSONB)  # ["blog", "sns", "x", "threads"]
 
     # AI 분석 결과
-    analysis_data = Column(JSON, nullable=True)  # 분석 결과 전체 (JSON)
-    critique_data = Column(JSON, nullable=True)  # 평가 결과 전체 (JSON)
+    analysis_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # 분석 결과 전체 (JSON)
+    critique_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # 평가 결과 전체 (JSON)
 
     # 이미지 설정
-    requested_image_count = Column(Integer, default=0)  # 요청한 이미지 갯수
+    requested_image_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 요청한 이미지 갯수
 
     # 메타데이터
-    generation_attempts = Column(Integer, default=1)  # 생성 시도 횟수
-    status = Column(String, default="generated")  # generated, published, archived
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    generation_attempts: Mapped[Optional[int]] = mapped_column(Integer, default=1, server_default=expression.text("1"))  # 생성 시도 횟수
+    status: Mapped[Optional[str]] = mapped_column(String(20), default="generated", server_default=expression.text("'generated'"))  # generated, published, archived
 
     # Relationships
-    user = relationship("User", back_populates="content_sessions")
-    blog_content = relationship("GeneratedBlogContent", back_populates="session", uselist=False, cascade="all, delete-orphan")
-    sns_content = relationship("GeneratedSNSContent", back_populates="session", uselist=False, cascade="all, delete-orphan")
-    x_content = relationship("GeneratedXContent", back_populates="session", uselist=False, cascade="all, delete-orphan")
-    threads_content = relationship("GeneratedThreadsContent", back_populates="session", uselist=False, cascade="all, delete-orphan")
-    cardnews_content = relationship("GeneratedCardnewsContent", back_populates="session", uselist=False, cascade="all, delete-orphan")
-    images = relationship("GeneratedImage", back_populates="session", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="content_sessions")
+    blog_content: Mapped[Optional["GeneratedBlogContent"]] = relationship("GeneratedBlogContent", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    sns_content: Mapped[Optional["GeneratedSNSContent"]] = relationship("GeneratedSNSContent", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    x_content: Mapped[Optional["GeneratedXContent"]] = relationship("GeneratedXContent", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    threads_content: Mapped[Optional["GeneratedThreadsContent"]] = relationship("GeneratedThreadsContent", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    cardnews_content: Mapped[Optional["GeneratedCardnewsContent"]] = relationship("GeneratedCardnewsContent", back_populates="session", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    images: Mapped[List["GeneratedImage"]] = relationship("GeneratedImage", back_populates="session", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class GeneratedBlogContent(Base):
+class GeneratedBlogContent(CreatedAtMixin, Base):
     """
     생성된 블로그 콘텐츠
     """
     __tablename__ = "generated_blog_contents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 블로그 콘텐츠
-    title = Column(String, nullable=False)  # 블로그 제목
-    content = Column(Text, nullable=False)  # 블로그 본문 (마크다운)
-    tags = Column(JSON, nullable=True)  # ["태그1", "태그2"]
+    title: Mapped[str] = mapped_column(String)  # 블로그 제목
+    content: Mapped[str] = mapped_column(Text)  # 블로그 본문 (마크다운)
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["태그1", "태그2"]
 
     # 평가 점수
-    score = Column(Integer, nullable=True)  # 블로그 품질 점수 (0-100)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    score: Mapped[Optional[int]] = mapped_column(Integer)  # 블로그 품질 점수 (0-100)
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="blog_content")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="blog_content")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedSNSContent(Base):
+class GeneratedSNSContent(CreatedAtMixin, Base):
     """
     생성된 SNS 콘텐츠 (Instagram/Facebook)
     """
     __tablename__ = "generated_sns_contents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # SNS 콘텐츠
-    content = Column(Text, nullable=False)  # SNS 본문
-    hashtags = Column(JSON, nullable=True)  # ["#해시태그1", "#해시태그2"]
+    content: Mapped[str] = mapped_column(Text)  # SNS 본문
+    hashtags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["#해시태그1", "#해시태그2"]
 
     # 평가 점수
-    score = Column(Integer, nullable=True)  # SNS 품질 점수 (0-100)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    score: Mapped[Optional[int]] = mapped_column(Integer)  # SNS 품질 점수 (0-100)
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="sns_content")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="sns_content")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedXContent(Base):
+class GeneratedXContent(CreatedAtMixin, Base):
     """
     생성된 X(Twitter) 콘텐츠
     """
     __tablename__ = "generated_x_contents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # X 콘텐츠
-    content = Column(Text, nullable=False)  # X 본문 (280자 이내)
-    hashtags = Column(JSON, nullable=True)  # ["#해시태그1", "#해시태그2"]
+    content: Mapped[str] = mapped_column(Text)  # X 본문 (280자 이내)
+    hashtags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["#해시태그1", "#해시태그2"]
 
     # 평가 점수
-    score = Column(Integer, nullable=True)  # X 품질 점수 (0-100)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    score: Mapped[Optional[int]] = mapped_column(Integer)  # X 품질 점수 (0-100)
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="x_content")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="x_content")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedThreadsContent(Base):
+class GeneratedThreadsContent(CreatedAtMixin, Base):
     """
     생성된 Threads 콘텐츠
     """
     __tablename__ = "generated_threads_contents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # Threads 콘텐츠
-    content = Column(Text, nullable=False)  # Threads 본문 (500자 이내)
-    hashtags = Column(JSON, nullable=True)  # ["#해시태그1", "#해시태그2"]
+    content: Mapped[str] = mapped_column(Text)  # Threads 본문 (500자 이내)
+    hashtags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # ["#해시태그1", "#해시태그2"]
 
     # 평가 점수
-    score = Column(Integer, nullable=True)  # Threads 품질 점수 (0-100)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    score: Mapped[Optional[int]] = mapped_column(Integer)  # Threads 품질 점수 (0-100)
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="threads_content")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="threads_content")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedImage(Base):
+class GeneratedImage(CreatedAtMixin, Base):
     """
     생성된 이미지
     """
     __tablename__ = "generated_images"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 이미지 정보
-    image_url = Column(Text, nullable=False)  # 이미지 URL (Base64 데이터 포함 가능)
-    prompt = Column(Text, nullable=True)  # 생성에 사용된 프롬프트
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    image_url: Mapped[str] = mapped_column(Text)  # 이미지 URL (Base64 데이터 포함 가능)
+    prompt: Mapped[Optional[str]] = mapped_column(Text)  # 생성에 사용된 프롬프트
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="images")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="images")
+    user: Mapped["User"] = relationship("User")
 
 
-class GeneratedCardnewsContent(Base):
+class GeneratedCardnewsContent(CreatedAtMixin, Base):
     """
     생성된 카드뉴스 콘텐츠
     - 각 페이지 이미지와 메타데이터 저장
     """
     __tablename__ = "generated_cardnews_contents"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    session_id: Mapped[int] = mapped_column(Integer, ForeignKey("content_generation_sessions.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 카드뉴스 기본 정보
-    title = Column(String, nullable=False)  # 카드뉴스 제목 (첫 페이지 타이틀)
-    prompt = Column(Text, nullable=False)  # 사용자 입력 프롬프트
-    purpose = Column(String(20), nullable=True)  # promotion, menu, info, event
-    page_count = Column(Integer, nullable=False)  # 페이지 수
+    title: Mapped[str] = mapped_column(String)  # 카드뉴스 제목 (첫 페이지 타이틀)
+    prompt: Mapped[str] = mapped_column(Text)  # 사용자 입력 프롬프트
+    purpose: Mapped[Optional[str]] = mapped_column(String(20))  # promotion, menu, info, event
+    page_count: Mapped[int] = mapped_column(Integer)  # 페이지 수
 
     # 카드뉴스 페이지 이미지 URL (Supabase Storage)
-    card_image_urls = Column(JSON, nullable=False)  # ["https://...", "https://..."]
+    card_image_urls: Mapped[List[str]] = mapped_column(JSONB)  # ["https://...", "https://..."]
 
     # AI 분석 결과
-    analysis_data = Column(JSON, nullable=True)  # Orchestrator 분석 결과
-    pages_data = Column(JSON, nullable=True)  # 각 페이지별 title, content, layout 등
+    analysis_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # Orchestrator 분석 결과
+    pages_data: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # 각 페이지별 title, content, layout 등
 
     # 디자인 설정
-    design_settings = Column(JSON, nullable=True)  # bg_color, text_color, font_pair, style 등
+    design_settings: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB)  # bg_color, text_color, font_pair, style 등
 
     # 품질 점수
-    quality_score = Column(Float, nullable=True)  # QA Agent 평가 점수
+    quality_score: Mapped[Optional[float]] = mapped_column(Float)  # QA Agent 평가 점수
 
     # 평가 점수 (통합 - 다른 콘텐츠와 일관성)
-    score = Column(Integer, nullable=True)  # 품질 점수 (0-100)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    score: Mapped[Optional[int]] = mapped_column(Integer)  # 품질 점수 (0-100)
 
     # Relationships
-    session = relationship("ContentGenerationSession", back_populates="cardnews_content")
-    user = relationship("User")
+    session: Mapped["ContentGenerationSession"] = relationship("ContentGenerationSession", back_populates="cardnews_content")
+    user: Mapped["User"] = relationship("User")
 
 
-class ThreadsConnection(Base):
+class ThreadsConnection(TimestampMixin, Base):
     """
     Threads 계정 연동 정보 모델
     - Meta의 Threads API를 사용한 OAuth 연동
@@ -938,433 +1116,433 @@ class ThreadsConnection(Base):
     """
     __tablename__ = "threads_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # Threads 사용자 정보
-    threads_user_id = Column(String, nullable=False, index=True)  # Threads 사용자 ID
-    username = Column(String, nullable=True)  # @username
-    name = Column(String, nullable=True)  # 표시 이름
-    threads_profile_picture_url = Column(String, nullable=True)  # 프로필 이미지 URL
-    threads_biography = Column(Text, nullable=True)  # 자기소개
+    threads_user_id: Mapped[str] = mapped_column(String(64), index=True)  # Threads 사용자 ID
+    username: Mapped[Optional[str]] = mapped_column(String)  # @username
+    name: Mapped[Optional[str]] = mapped_column(String)  # 표시 이름
+    threads_profile_picture_url: Mapped[Optional[str]] = mapped_column(String)  # 프로필 이미지 URL
+    threads_biography: Mapped[Optional[str]] = mapped_column(Text)  # 자기소개
 
     # 계정 통계
-    followers_count = Column(Integer, default=0)  # 팔로워 수
+    followers_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 팔로워 수
 
     # OAuth 토큰 정보
-    access_token = Column(Text, nullable=False)  # 액세스 토큰
-    refresh_token = Column(Text, nullable=True)  # 리프레시 토큰 (장기 토큰)
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)  # 토큰 만료 시간
+    access_token: Mapped[str] = mapped_column(EncryptedToken)  # 액세스 토큰
+    refresh_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)  # 리프레시 토큰 (장기 토큰)
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 토큰 만료 시간
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="threads_connection")
-    posts = relationship("ThreadsPost", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="threads_connection")
+    posts: Mapped[List["ThreadsPost"]] = relationship("ThreadsPost", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class ThreadsPost(Base):
+class ThreadsPost(TimestampMixin, Base):
     """
     Threads 포스트 모델
     - 연동된 계정의 포스트 목록 및 통계
     """
     __tablename__ = "threads_posts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("threads_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("threads_connections.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 포스트 기본 정보
-    threads_post_id = Column(String, nullable=False, unique=True, index=True)  # Threads 미디어 ID
-    media_type = Column(String, nullable=True)  # TEXT_POST, IMAGE, VIDEO, CAROUSEL
-    media_url = Column(String, nullable=True)  # 미디어 URL
-    thumbnail_url = Column(String, nullable=True)  # 썸네일 URL (비디오용)
-    permalink = Column(String, nullable=True)  # 포스트 링크
-    text = Column(Text, nullable=True)  # 포스트 텍스트
-    timestamp = Column(DateTime(timezone=True), nullable=True)  # 게시 시간
+    threads_post_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)  # Threads 미디어 ID
+    media_type: Mapped[Optional[str]] = mapped_column(String)  # TEXT_POST, IMAGE, VIDEO, CAROUSEL
+    media_url: Mapped[Optional[str]] = mapped_column(String)  # 미디어 URL
+    thumbnail_url: Mapped[Optional[str]] = mapped_column(String)  # 썸네일 URL (비디오용)
+    permalink: Mapped[Optional[str]] = mapped_column(String)  # 포스트 링크
+    text: Mapped[Optional[str]] = mapped_column(Text)  # 포스트 텍스트
+    timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 게시 시간
 
     # 포스트 상태
-    is_quote_post = Column(Boolean, default=False)  # 인용 포스트 여부
+    is_quote_post: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())  # 인용 포스트 여부
 
     # 포스트 통계
-    like_count = Column(Integer, default=0)  # 좋아요 수
-    reply_count = Column(Integer, default=0)  # 답글 수
-    repost_count = Column(Integer, default=0)  # 리포스트 수
-    quote_count = Column(Integer, default=0)  # 인용 포스트 수
-    views_count = Column(Integer, default=0)  # 조회수
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 좋아요 수
+    reply_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 답글 수
+    repost_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 리포스트 수
+    quote_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 인용 포스트 수
+    views_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 조회수
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("ThreadsConnection", back_populates="posts")
+    connection: Mapped["ThreadsConnection"] = relationship("ThreadsConnection", back_populates="posts")
 
 
-class PublishedContent(Base):
+class PublishedContent(TimestampMixin, Base):
     """
     발행/임시저장 콘텐츠 모델
     - 생성된 콘텐츠를 편집하여 저장 (임시저장, 예약발행, 발행완료)
     - ContentGenerationSession의 원본을 보존하고 편집본을 별도 관리
     """
     __tablename__ = "published_contents"
-
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    session_id = Column(Integer, ForeignKey("content_generation_sessions.id"), nullable=True, index=True)
+    __table_args__ = (
+        # 사용자별 상태 조회 (임시저장 목록, 통계)
+        Index("ix_published_contents_user_status", "user_id", "status"),
+        # 예약 발행 스케줄러 조회 (status = 'scheduled' AND scheduled_at <= now)
+        # 발행 대기 중인 행만 담는 부분 인덱스 (크기가 테이블이 아닌 대기 건수에 비례)
+        Index("ix_published_contents_scheduled_pending", "scheduled_at", postgresql_where=expression.text("status = 'scheduled'")),
+        CheckConstraint("status IN ('draft', 'scheduled', 'published', 'failed')", name="ck_published_contents_status"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
+    session_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("content_generation_sessions.id"), index=True)
 
     # 플랫폼 정보
-    platform = Column(String(20), nullable=False)  # 'blog', 'sns', 'x', 'threads'
+    platform: Mapped[str] = mapped_column(String(20))  # 'blog', 'sns', 'x', 'threads'
 
     # 편집된 콘텐츠
-    title = Column(String(500), nullable=True)  # 블로그용 제목
-    content = Column(Text, nullable=False)  # 본문
-    tags = Column(JSON, nullable=True)  # 태그/해시태그 배열
+    title: Mapped[Optional[str]] = mapped_column(String(500))  # 블로그용 제목
+    content: Mapped[str] = mapped_column(Text)  # 본문
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # 태그/해시태그 배열
 
     # 이미지 참조
-    image_ids = Column(JSON, nullable=True)  # generated_images ID 목록
-    uploaded_image_url = Column(String(500), nullable=True)  # 직접 업로드한 이미지 URL
-    card_image_urls = Column(JSON, nullable=True)  # 카드뉴스 이미지 URL 배열
+    image_ids: Mapped[Optional[List[int]]] = mapped_column(JSONB)  # generated_images ID 목록
+    uploaded_image_url: Mapped[Optional[str]] = mapped_column(String(500))  # 직접 업로드한 이미지 URL
+    card_image_urls: Mapped[Optional[List[str]]] = mapped_column(JSONB)  # 카드뉴스 이미지 URL 배열
 
     # 상태 관리
-    status = Column(String(20), nullable=False, default="draft")
+    status: Mapped[str] = mapped_column(String(20), default="draft", server_default=expression.text("'draft'"))
     # 'draft' (임시저장/작성 중)
     # 'scheduled' (예약됨)
     # 'published' (발행됨)
     # 'failed' (발행 실패)
 
     # 예약/발행 정보
-    scheduled_at = Column(DateTime(timezone=True), nullable=True)  # 예약 발행 시간
-    published_at = Column(DateTime(timezone=True), nullable=True)  # 실제 발행 시간
-    publish_url = Column(String(500), nullable=True)  # 발행된 게시물 URL
-    platform_post_id = Column(String(100), nullable=True)  # 플랫폼별 게시물 ID (X post_id 등)
-    publish_error = Column(Text, nullable=True)  # 발행 실패 에러 메시지
+    scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 예약 발행 시간
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 실제 발행 시간
+    publish_url: Mapped[Optional[str]] = mapped_column(String(500))  # 발행된 게시물 URL
+    platform_post_id: Mapped[Optional[str]] = mapped_column(String(100))  # 플랫폼별 게시물 ID (X post_id 등)
+    publish_error: Mapped[Optional[str]] = mapped_column(Text)  # 발행 실패 에러 메시지
 
     # 통계 (발행 후 업데이트)
-    views = Column(Integer, default=0)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    views: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # Relationships
-    user = relationship("User")
-    session = relationship("ContentGenerationSession")
+    user: Mapped["User"] = relationship("User")
+    session: Mapped[Optional["ContentGenerationSession"]] = relationship("ContentGenerationSession")
 
 
-class TikTokConnection(Base):
+class TikTokConnection(TimestampMixin, Base):
     """
     TikTok 비즈니스 계정 연동 정보 모델
     - TikTok for Business API를 사용한 OAuth 2.0 연동
     """
     __tablename__ = "tiktok_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # TikTok 사용자 정보
-    tiktok_user_id = Column(String, nullable=False, index=True)  # TikTok 사용자 ID (open_id)
-    union_id = Column(String, nullable=True)  # TikTok Union ID
-    username = Column(String, nullable=True)  # @username (display_name)
-    avatar_url = Column(String, nullable=True)  # 프로필 이미지 URL
-    bio_description = Column(Text, nullable=True)  # 자기소개
-    profile_deep_link = Column(String, nullable=True)  # 프로필 딥링크
+    tiktok_user_id: Mapped[str] = mapped_column(String(128), index=True)  # TikTok 사용자 ID (open_id)
+    union_id: Mapped[Optional[str]] = mapped_column(String)  # TikTok Union ID
+    username: Mapped[Optional[str]] = mapped_column(String)  # @username (display_name)
+    avatar_url: Mapped[Optional[str]] = mapped_column(String)  # 프로필 이미지 URL
+    bio_description: Mapped[Optional[str]] = mapped_column(Text)  # 자기소개
+    profile_deep_link: Mapped[Optional[str]] = mapped_column(String)  # 프로필 딥링크
 
     # 계정 통계
-    follower_count = Column(Integer, default=0)
-    following_count = Column(Integer, default=0)
-    likes_count = Column(Integer, default=0)  # 받은 좋아요 수
-    video_count = Column(Integer, default=0)
+    follower_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    following_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    likes_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 받은 좋아요 수
+    video_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # OAuth 2.0 토큰 정보
-    access_token = Column(Text, nullable=False)
-    refresh_token = Column(Text, nullable=True)
-    token_expires_at = Column(DateTime(timezone=True), nullable=True)
+    access_token: Mapped[str] = mapped_column(EncryptedToken)
+    refresh_token: Mapped[Optional[str]] = mapped_column(EncryptedToken)
+    token_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="tiktok_connection")
-    videos = relationship("TikTokVideo", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="tiktok_connection")
+    videos: Mapped[List["TikTokVideo"]] = relationship("TikTokVideo", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class TikTokVideo(Base):
+class TikTokVideo(TimestampMixin, Base):
     """
     TikTok 동영상 모델
     - 연동된 계정의 동영상 목록 및 통계
     """
     __tablename__ = "tiktok_videos"
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("tiktok_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("tiktok_connections.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 동영상 기본 정보
-    video_id = Column(String, nullable=False, unique=True, index=True)  # TikTok 동영상 ID
-    title = Column(String, nullable=True)  # 동영상 제목
-    description = Column(Text, nullable=True)  # 동영상 설명
-    cover_image_url = Column(String, nullable=True)  # 커버 이미지 URL
-    share_url = Column(String, nullable=True)  # 공유 URL
-    embed_link = Column(String, nullable=True)  # 임베드 링크
-    duration = Column(Integer, nullable=True)  # 동영상 길이 (초)
-    create_time = Column(DateTime(timezone=True), nullable=True)  # 업로드 시간
+    video_id: Mapped[str] = mapped_column(String(64), unique=True, index=True)  # TikTok 동영상 ID
+    title: Mapped[Optional[str]] = mapped_column(String)  # 동영상 제목
+    description: Mapped[Optional[str]] = mapped_column(Text)  # 동영상 설명
+    cover_image_url: Mapped[Optional[str]] = mapped_column(String)  # 커버 이미지 URL
+    share_url: Mapped[Optional[str]] = mapped_column(String)  # 공유 URL
+    embed_link: Mapped[Optional[str]] = mapped_column(String)  # 임베드 링크
+    duration: Mapped[Optional[int]] = mapped_column(Integer)  # 동영상 길이 (초)
+    create_time: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))  # 업로드 시간
 
     # 동영상 통계
-    view_count = Column(Integer, default=0)
-    like_count = Column(Integer, default=0)
-    comment_count = Column(Integer, default=0)
-    share_count = Column(Integer, default=0)
+    view_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    like_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    comment_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
+    share_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # 동기화 정보
-    last_stats_updated_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_stats_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("TikTokConnection", back_populates="videos")
+    connection: Mapped["TikTokConnection"] = relationship("TikTokConnection", back_populates="videos")
 
 
-class WordPressConnection(Base):
+class WordPressConnection(TimestampMixin, Base):
     """
     WordPress 사이트 연동 정보 모델
     - WordPress REST API를 사용한 Application Password 또는 OAuth 연동
     """
     __tablename__ = "wordpress_connections"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # WordPress 사이트 정보
-    site_url = Column(String, nullable=False)  # WordPress 사이트 URL
-    site_name = Column(String, nullable=True)  # 사이트 이름
-    site_description = Column(Text, nullable=True)  # 사이트 설명
-    site_icon_url = Column(String, nullable=True)  # 사이트 아이콘
+    site_url: Mapped[str] = mapped_column(String)  # WordPress 사이트 URL
+    site_name: Mapped[Optional[str]] = mapped_column(String)  # 사이트 이름
+    site_description: Mapped[Optional[str]] = mapped_column(Text)  # 사이트 설명
+    site_icon_url: Mapped[Optional[str]] = mapped_column(String)  # 사이트 아이콘
 
     # WordPress 사용자 정보
-    wp_user_id = Column(Integer, nullable=True)  # WordPress 사용자 ID
-    wp_username = Column(String, nullable=True)  # WordPress 사용자명
-    wp_display_name = Column(String, nullable=True)  # 표시 이름
-    wp_email = Column(String, nullable=True)  # 이메일
-    wp_avatar_url = Column(String, nullable=True)  # 아바타 URL
+    wp_user_id: Mapped[Optional[int]] = mapped_column(Integer)  # WordPress 사용자 ID
+    wp_username: Mapped[Optional[str]] = mapped_column(String)  # WordPress 사용자명
+    wp_display_name: Mapped[Optional[str]] = mapped_column(String)  # 표시 이름
+    wp_email: Mapped[Optional[str]] = mapped_column(String)  # 이메일
+    wp_avatar_url: Mapped[Optional[str]] = mapped_column(String)  # 아바타 URL
 
     # 인증 정보 (Application Password 방식)
-    wp_app_password = Column(Text, nullable=True)  # Application Password (암호화 저장)
+    wp_app_password: Mapped[Optional[str]] = mapped_column(Text)  # Application Password (암호화 저장)
 
     # 사이트 통계
-    post_count = Column(Integer, default=0)  # 게시물 수
-    page_count = Column(Integer, default=0)  # 페이지 수
-    category_count = Column(Integer, default=0)  # 카테고리 수
+    post_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 게시물 수
+    page_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 페이지 수
+    category_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 카테고리 수
 
     # 카테고리 캐싱
-    categories = Column(JSON, nullable=True)  # [{"id": 1, "name": "...", "slug": "..."}, ...]
+    categories: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # [{"id": 1, "name": "...", "slug": "..."}, ...]
 
     # 연동 상태
-    is_active = Column(Boolean, default=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    user = relationship("User", back_populates="wordpress_connection")
-    posts = relationship("WordPressPost", back_populates="connection", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", back_populates="wordpress_connection")
+    posts: Mapped[List["WordPressPost"]] = relationship("WordPressPost", back_populates="connection", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class WordPressPost(Base):
+class WordPressPost(TimestampMixin, Base):
     """
     WordPress 게시물 모델
     - 연동된 사이트의 게시물 목록 및 통계
     """
     __tablename__ = "wordpress_posts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    connection_id = Column(Integer, ForeignKey("wordpress_connections.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    connection_id: Mapped[int] = mapped_column(Integer, ForeignKey("wordpress_connections.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 게시물 기본 정보
-    wp_post_id = Column(Integer, nullable=False, index=True)  # WordPress 게시물 ID
-    title = Column(String, nullable=False)  # 게시물 제목
-    content = Column(Text, nullable=True)  # 게시물 본문
-    excerpt = Column(Text, nullable=True)  # 요약
-    slug = Column(String, nullable=True)  # URL 슬러그
-    post_url = Column(String, nullable=True)  # 게시물 URL
-    featured_image_url = Column(String, nullable=True)  # 대표 이미지 URL
+    wp_post_id: Mapped[int] = mapped_column(Integer, index=True)  # WordPress 게시물 ID
+    title: Mapped[str] = mapped_column(String)  # 게시물 제목
+    content: Mapped[Optional[str]] = mapped_column(Text)  # 게시물 본문
+    excerpt: Mapped[Optional[str]] = mapped_column(Text)  # 요약
+    slug: Mapped[Optional[str]] = mapped_column(String)  # URL 슬러그
+    post_url: Mapped[Optional[str]] = mapped_column(String)  # 게시물 URL
+    featured_image_url: Mapped[Optional[str]] = mapped_column(String)  # 대표 이미지 URL
 
     # 게시물 상태
-    status = Column(String, nullable=True)  # publish, draft, pending, private
-    post_type = Column(String, default="post")  # post, page
+    status: Mapped[Optional[str]] = mapped_column(String)  # publish, draft, pending, private
+    post_type: Mapped[Optional[str]] = mapped_column(String, default="post", server_default=expression.text("'post'"))  # post, page
 
     # 카테고리/태그
-    categories = Column(JSON, nullable=True)  # [{"id": 1, "name": "..."}]
-    tags = Column(JSON, nullable=True)  # [{"id": 1, "name": "..."}]
+    categories: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # [{"id": 1, "name": "..."}]
+    tags: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(JSONB)  # [{"id": 1, "name": "..."}]
 
     # 날짜 정보
-    published_at = Column(DateTime(timezone=True), nullable=True)
-    modified_at = Column(DateTime(timezone=True), nullable=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    modified_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # 통계 (있는 경우)
-    comment_count = Column(Integer, default=0)
+    comment_count: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))
 
     # 동기화 정보
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
 
     # Relationships
-    connection = relationship("WordPressConnection", back_populates="posts")
+    connection: Mapped["WordPressConnection"] = relationship("WordPressConnection", back_populates="posts")
 
 
 # ============================================
 # 크레딧 시스템 테이블
 # ============================================
 
-class UserCredit(Base):
+class UserCredit(TimestampMixin, Base):
     """
     사용자 크레딧 잔액 모델
     - 각 사용자의 현재 크레딧 잔액 관리
     """
     __tablename__ = "user_credits"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), unique=True, index=True)
 
     # 크레딧 잔액
-    balance = Column(Integer, nullable=False, default=0)  # 현재 잔액
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    balance: Mapped[int] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 현재 잔액
 
     # Relationships
-    user = relationship("User", backref="credit")
-    transactions = relationship("CreditTransaction", back_populates="user_credit", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User", backref="credit")
+    transactions: Mapped[List["CreditTransaction"]] = relationship("CreditTransaction", back_populates="user_credit", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class CreditTransaction(Base):
+class CreditTransaction(CreatedAtMixin, Base):
     """
     크레딧 거래 내역 모델
     - 모든 크레딧 충전/사용/보너스/환불 기록
     """
     __tablename__ = "credit_transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_credit_id = Column(Integer, ForeignKey("user_credits.id"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_credit_id: Mapped[int] = mapped_column(Integer, ForeignKey("user_credits.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 거래 정보
-    amount = Column(Integer, nullable=False)  # +충전/보너스, -사용
-    type = Column(String(20), nullable=False)  # charge, use, bonus, refund
-    description = Column(String(255), nullable=True)  # 거래 설명 (예: '숏폼 영상 생성 (30초)', '회원가입 보너스')
+    amount: Mapped[int] = mapped_column(Integer)  # +충전/보너스, -사용
+    type: Mapped[str] = mapped_column(String(20))  # charge, use, bonus, refund
+    description: Mapped[Optional[str]] = mapped_column(String(255))  # 거래 설명 (예: '숏폼 영상 생성 (30초)', '회원가입 보너스')
 
     # 잔액 스냅샷
-    balance_before = Column(Integer, nullable=False)  # 거래 전 잔액
-    balance_after = Column(Integer, nullable=False)  # 거래 후 잔액
+    balance_before: Mapped[int] = mapped_column(Integer)  # 거래 전 잔액
+    balance_after: Mapped[int] = mapped_column(Integer)  # 거래 후 잔액
 
     # 참조 정보
-    reference_type = Column(String(50), nullable=True)  # video_generation, image_generation, cardnews, package_charge
-    reference_id = Column(String(100), nullable=True)  # 관련 콘텐츠/패키지 ID
-    package_id = Column(Integer, ForeignKey("credit_packages.id"), nullable=True)  # 충전 패키지 ID (충전 시)
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    reference_type: Mapped[Optional[str]] = mapped_column(String(50))  # video_generation, image_generation, cardnews, package_charge
+    reference_id: Mapped[Optional[str]] = mapped_column(String(100))  # 관련 콘텐츠/패키지 ID
+    package_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("credit_packages.id"), index=True)  # 충전 패키지 ID (충전 시)
 
     # Relationships
-    user_credit = relationship("UserCredit", back_populates="transactions")
-    user = relationship("User")
-    package = relationship("CreditPackage")
+    user_credit: Mapped["UserCredit"] = relationship("UserCredit", back_populates="transactions")
+    user: Mapped["User"] = relationship("User")
+    package: Mapped[Optional["CreditPackage"]] = relationship("CreditPackage")
 
 
-class CreditPackage(Base):
+class CreditPackage(TimestampMixin, Base):
     """
     크레딧 충전 패키지 모델
     - 구매 가능한 크레딧 패키지 정의
     """
     __tablename__ = "credit_packages"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     # 패키지 정보
-    name = Column(String(50), nullable=False)  # 패키지명 (스타터, 베이직, 프로, 엔터프라이즈)
-    description = Column(String(255), nullable=True)  # 패키지 설명
-    credits = Column(Integer, nullable=False)  # 기본 크레딧 수량
-    bonus_credits = Column(Integer, nullable=False, default=0)  # 보너스 크레딧
-    price = Column(Integer, nullable=False)  # 가격 (원화)
+    name: Mapped[str] = mapped_column(String(50))  # 패키지명 (스타터, 베이직, 프로, 엔터프라이즈)
+    description: Mapped[Optional[str]] = mapped_column(String(255))  # 패키지 설명
+    credits: Mapped[int] = mapped_column(Integer)  # 기본 크레딧 수량
+    bonus_credits: Mapped[int] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 보너스 크레딧
+    price: Mapped[int] = mapped_column(Integer)  # 가격 (원화)
 
     # 표시 정보
-    badge = Column(String(20), nullable=True)  # 뱃지 (인기, 추천, BEST 등)
-    is_popular = Column(Boolean, default=False)  # 인기 패키지 여부
+    badge: Mapped[Optional[str]] = mapped_column(String(20))  # 뱃지 (인기, 추천, BEST 등)
+    is_popular: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, server_default=expression.false())  # 인기 패키지 여부
 
     # 상태
-    is_active = Column(Boolean, default=True)  # 활성화 여부
-    sort_order = Column(Integer, default=0)  # 정렬 순서
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True, server_default=expression.true())  # 활성화 여부
+    sort_order: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 정렬 순서
 
 
 # ============================================
 # 템플릿 갤러리 시스템
 # ============================================
 
-class TemplateTab(Base):
+class TemplateTab(TimestampMixin, Base):
     """
     사용자별 템플릿 탭 모델
     - 사용자가 직접 생성/수정/삭제 가능한 템플릿 카테고리
     """
     __tablename__ = "template_tabs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
 
     # 탭 정보
-    tab_key = Column(String(50), nullable=False)  # 고유 키 (영문, 예: promotion, event)
-    label = Column(String(50), nullable=False)  # 표시 이름 (예: 홍보, 이벤트)
-    icon = Column(String(10), nullable=False, default="📁")  # 이모지 아이콘
-    sort_order = Column(Integer, default=0)  # 정렬 순서
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    tab_key: Mapped[str] = mapped_column(String(50))  # 고유 키 (영문, 예: promotion, event)
+    label: Mapped[str] = mapped_column(String(50))  # 표시 이름 (예: 홍보, 이벤트)
+    icon: Mapped[str] = mapped_column(String(10), default="📁", server_default=expression.text("'📁'"))  # 이모지 아이콘
+    sort_order: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 정렬 순서
 
     # Relationships
-    user = relationship("User")
-    templates = relationship("Template", back_populates="tab", cascade="all, delete-orphan")
+    user: Mapped["User"] = relationship("User")
+    templates: Mapped[List["Template"]] = relationship("Template", back_populates="tab", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class Template(Base):
+class Template(TimestampMixin, Base):
     """
     사용자별 프롬프트 템플릿 모델
     - 자주 사용하는 프롬프트를 템플릿으로 저장
     """
     __tablename__ = "templates"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    tab_id = Column(Integer, ForeignKey("template_tabs.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), index=True)
+    tab_id: Mapped[int] = mapped_column(Integer, ForeignKey("template_tabs.id", ondelete="CASCADE"), index=True)
 
     # 템플릿 정보
-    name = Column(String(100), nullable=False)  # 템플릿 이름
-    category = Column(String(50), nullable=True)  # 세부 카테고리 (예: 신제품 출시)
-    description = Column(String(255), nullable=True)  # 간단한 설명
-    prompt = Column(Text, nullable=False)  # 프롬프트 내용
-    icon = Column(String(10), nullable=False, default="📝")  # 이모지 아이콘
+    name: Mapped[str] = mapped_column(String(100))  # 템플릿 이름
+    category: Mapped[Optional[str]] = mapped_column(String(50))  # 세부 카테고리 (예: 신제품 출시)
+    description: Mapped[Optional[str]] = mapped_column(String(255))  # 간단한 설명
+    prompt: Mapped[str] = mapped_column(Text)  # 프롬프트 내용
+    icon: Mapped[str] = mapped_column(String(10), default="📝", server_default=expression.text("'📝'"))  # 이모지 아이콘
 
     # 통계
-    uses = Column(Integer, default=0)  # 사용 횟수
-
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    uses: Mapped[Optional[int]] = mapped_column(Integer, default=0, server_default=expression.text("0"))  # 사용 횟수
 
     # Relationships
-    user = relationship("User")
-    tab = relationship("TemplateTab", back_populates="templates")
+    user: Mapped["User"] = relationship("User")
+    tab: Mapped["TemplateTab"] = relationship("TemplateTab", back_populates="templates")
+
+
+# updated_at은 DB 트리거가 갱신 (ORM UPDATE, 대량 UPDATE, 직접 SQL 모두 동일하게 적용)
+SET_UPDATED_AT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def updated_at_trigger_sql(table_name: str) -> str:
+    """테이블의 updated_at 갱신 트리거 생성 SQL"""
+    return f"""
+CREATE TRIGGER trg_{table_name}_updated_at
+BEFORE UPDATE ON {table_name}
+FOR EACH ROW EXECUTE FUNCTION set_updated_at()
+"""
+
+
+# create_all로 새로 만드는 테이블에도 트리거 등록
+for _table in Base.metadata.tables.values():
+    if "updated_at" in _table.c:
+        event.listen(_table, "after_create", DDL(SET_UPDATED_AT_FUNCTION_SQL))
+        event.listen(_table, "after_create", DDL(updated_at_trigger_sql(_table.name)))
@@ -1,9 +1,9 @@
 from authlib.integrations.starlette_client import OAuth
 from starlette.config import Config
 import os
-from dotenv import load_dotenv
+from .env import load_env
 
-load_dotenv()
+load_env()
 
 config = Config(environ=os.environ)
 
@@ -5,8 +5,8 @@ AI 생성 콘텐츠 API 라우터
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import func, insert
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import base64
@@ -225,17 +225,25 @@ async def save_content_session(
 
         # 3. 이미지 저장
         if request.images:
-            for img in request.images:
-                image = GeneratedImage(
-                    session_id=session.id,
-                    user_id=current_user.id,
-                    image_url=img.image_url,
-                    prompt=img.prompt
-                )
-                db.add(image)
+            db.execute(
+                insert(GeneratedImage),
+                [
+                    {
+                        "session_id": session.id,
+                        "user_id": current_user.id,
+                        "image_url": img.image_url,
+                        "prompt": img.prompt,
+                    }
+                    for img in request.images
+                ],
+            )
 
         db.commit()
-        db.refresh(session)
+
+        # 저장된 세션을 콘텐츠/이미지와 함께 한 번에 다시 조회 (관계별 지연 로딩 방지)
+        session = _session_with_contents_query(db).filter(
+            ContentGenerationSession.id == session.id
+        ).one()
 
         return _build_session_response(session)
 
@@ -351,14 +359,7 @@ async def get_content_session(
     """
     특정 콘텐츠 생성 세션 조회 (v2)
     """
-    session = db.query(ContentGenerationSession).options(
-        joinedload(ContentGenerationSession.blog_content),
-        joinedload(ContentGenerationSession.sns_content),
-        joinedload(ContentGenerationSession.x_content),
-        joinedload(ContentGenerationSession.threads_content),
-        joinedload(ContentGenerationSession.cardnews_content),
-        joinedload(ContentGenerationSession.images)
-    ).filter(
+    session = _session_with_contents_query(db).filter(
         ContentGenerationSession.id == session_id,
         ContentGenerationSession.user_id == current_user.id
     ).first()
@@ -397,6 +398,23 @@ async def delete_content_session(
 # 헬퍼 함수
 # ============================================
 
+def _session_with_contents_query(db: Session):
+    """
+    플랫폼별 콘텐츠와 이미지를 함께 로드하는 세션 조회 쿼리
+
+    나머지 관계는 raiseload로 막아 응답 생성 중 지연 로딩(N+1)이 생기면 바로 예외가 나도록 한다.
+    """
+    return db.query(ContentGenerationSession).options(
+        joinedload(ContentGenerationSession.blog_content),
+        joinedload(ContentGenerationSession.sns_content),
+        joinedload(ContentGenerationSession.x_content),
+        joinedload(ContentGenerationSession.threads_content),
+        joinedload(ContentGenerationSession.cardnews_content),
+        joinedload(ContentGenerationSession.images),
+        raiseload("*")
+    )
+
+
 def _build_session_list_response_v2(
     session: ContentGenerationSession,
     blog: GeneratedBlogContent = None,
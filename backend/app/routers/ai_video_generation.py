@@ -1,12 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks
-from sqlalchemy.orm import Session
-from typing import List, Optional, Union, Any
+from sqlalchemy.orm import Session, undefer_group
+from typing import List, Optional, Union
 from datetime import datetime
-from pathlib import Path
-import google.generativeai as genai
-import os
-import json
-import io
 import uuid
 import asyncio
 
@@ -26,9 +21,6 @@ router = APIRouter(
 # Cloudinary 설정 - 함수 내부에서 동적으로 설정
 # (모듈 레벨에서 설정하면 .env 로드 전에 실행되어 환경변수를 찾지 못함)
 
-# Google Gemini 설정
-genai.configure(api_key=os.getenv("GOOGLE_API_KEY"))
-
 
 # ===== Pydantic 스키마 =====
 
@@ -100,6 +92,17 @@ class VideoGenerationJobResponse(BaseModel):
         return progress_map.get(status, 5)
 
 
+class VideoGenerationJobStatusResponse(BaseModel):
+    """비디오 생성 작업 상태 응답 (폴링용, 파이프라인 결과 JSON 제외)"""
+    id: int
+    product_name: str
+    final_video_url: Optional[str]
+    status: str
+    current_step: Optional[str]
+    error_message: Optional[str]
+    progress: int  # 진행률 (0-100)
+
+
 # ===== 티어 설정 =====
 
 TIER_CONFIG = {
@@ -292,7 +295,9 @@ async def get_video_generation_job(
     """
     특정 비디오 생성 작업 조회
     """
-    job = db.query(models.VideoGenerationJob).filter(
+    job = db.query(models.VideoGenerationJob).options(
+        undefer_group("pipeline_results")
+    ).filter(
         models.VideoGenerationJob.id == job_id,
         models.VideoGenerationJob.user_id == current_user.id
     ).first()
@@ -327,6 +332,40 @@ async def get_video_generation_job(
     )
 
 
+@router.get("/jobs/{job_id}/status", response_model=VideoGenerationJobStatusResponse)
+async def get_video_generation_job_status(
+    job_id: int,
+    current_user: models.User = Depends(auth.get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    비디오 생성 작업 상태 조회 (폴링용)
+    - 상태 관련 컬럼만 조회 (스토리보드 등 파이프라인 결과 JSON은 읽지 않음)
+    """
+    job = db.query(
+        models.VideoGenerationJob.id,
+        models.VideoGenerationJob.product_name,
+        models.VideoGenerationJob.final_video_url,
+        models.VideoGenerationJob.status,
+        models.VideoGenerationJob.current_step,
+        models.VideoGenerationJob.error_message,
+    ).filter(
+        models.VideoGenerationJob.id == job_id,
+        models.VideoGenerationJob.user_id == current_user.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Video generation job not found"
+        )
+
+    return VideoGenerationJobStatusResponse(
+        **job._asdict(),
+        progress=VideoGenerationJobResponse.calculate_progress(job.status),
+    )
+
+
 @router.get("/jobs", response_model=List[VideoGenerationJobResponse])
 async def list_video_generation_jobs(
     current_user: models.User = Depends(auth.get_current_active_user),
@@ -337,7 +376,9 @@ async def list_video_generation_jobs(
     """
     사용자의 비디오 생성 작업 목록 조회
     """
-    jobs = db.query(models.VideoGenerationJob).filter(
+    jobs = db.query(models.VideoGenerationJob).options(
+        undefer_group("pipeline_results")
+    ).filter(
         models.VideoGenerationJob.user_id == current_user.id
     ).order_by(
         models.VideoGenerationJob.created_at.desc()
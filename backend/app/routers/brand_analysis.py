@@ -3,20 +3,17 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, UploadFile, File, Form
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
-import asyncio
 
 from ..database import get_db, SessionLocal
 from ..models import User, BrandAnalysis, YouTubeConnection, InstagramConnection, ThreadsConnection
 from ..auth import get_current_user
-from ..services.brand_analyzer_service import BrandAnalyzerService
 from ..services.supabase_storage import get_storage_service
 from ..brand_agents import BrandAnalysisPipeline
-import uuid
 
 router = APIRouter(prefix="/api/brand-analysis", tags=["brand-analysis"])
 logger = logging.getLogger(__name__)
@@ -373,7 +370,11 @@ async def get_analysis_status(
     Returns:
         각 플랫폼별 분석 상태 및 결과
     """
-    brand_analysis = db.query(BrandAnalysis).filter(BrandAnalysis.user_id == current_user.id).first()
+    brand_analysis = db.query(BrandAnalysis).options(
+        undefer_group("blog"),
+        undefer_group("instagram"),
+        undefer_group("youtube")
+    ).filter(BrandAnalysis.user_id == current_user.id).first()
 
     if not brand_analysis:
         return {
@@ -779,10 +780,10 @@ async def create_basic_profile_background(
     try:
         logger.info(f"사용자 {user_id}의 기본 BrandProfile 생성 중...")
 
-        # BrandProfileSynthesizer 사용
-        from ..brand_agents.synthesizer import BrandProfileSynthesizer
+        # BrandProfileSynthesizer 사용 (공유 인스턴스)
+        from ..brand_agents.synthesizer import get_brand_profile_synthesizer
 
-        synthesizer = BrandProfileSynthesizer()
+        synthesizer = get_brand_profile_synthesizer()
         brand_profile = await synthesizer.synthesize_from_business_info(
             user_id=str(user_id),
             brand_name=brand_name,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Depends
+from fastapi import APIRouter, Form, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -12,10 +12,8 @@ from pathlib import Path
 import asyncio
 import re
 import httpx
-import google.generativeai as genai
 import logging
 from datetime import datetime
-import unicodedata
 from supabase import create_client, Client
 
 # DB 및 인증 모듈 임포트
@@ -26,21 +24,10 @@ from ..auth import get_current_user
 # 개선된 템플릿 시스템 임포트
 from ..utils.cardnews_templates_improved import (
     DESIGN_TEMPLATES as IMPROVED_TEMPLATES,
-    COLOR_PALETTES,
-    LAYOUT_STYLES,
     TEMPLATE_CATEGORIES,
-    get_template,
     get_palette,
     get_layout,
-    get_frontend_template_list,
-    get_templates_by_category
-)
-from ..utils.cardnews_renderer import (
-    CardNewsRenderer as ImprovedRenderer,
-    GradientGenerator,
-    EffectsProcessor,
-    CardRenderer,
-    DecorationRenderer
+    get_frontend_template_list
 )
 
 # ==================== 이모지 처리 유틸리티 ====================
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, undefer_group
 from pydantic import BaseModel
 from typing import List, Optional
 import os
@@ -8,7 +10,7 @@ from datetime import datetime, timezone
 import vertexai
 from vertexai.generative_models import GenerativeModel, Content, Part
 from ..logger import get_logger
-from ..database import get_db
+from ..database import get_db, get_async_db
 from .. import models, auth
 
 logger = get_logger(__name__)
@@ -121,7 +123,9 @@ def build_user_context(user: models.User, db: Session) -> str:
 
     # 브랜드 분석 정보 (brand_profile_json 우선 사용)
     try:
-        brand_analysis = db.query(models.BrandAnalysis).filter(
+        brand_analysis = db.query(models.BrandAnalysis).options(
+            undefer_group("brand_profile")
+        ).filter(
             models.BrandAnalysis.user_id == user.id
         ).first()
 
@@ -376,48 +380,32 @@ async def chat(
 async def get_chat_sessions(
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(auth.get_current_active_user)
 ):
     """
     현재 로그인한 사용자의 채팅 세션 목록 조회
     최신 순으로 정렬 (updated_at 기준)
-    단일 쿼리로 최적화 (JOIN 사용)
+    메시지 수는 chat_sessions.message_count 캐시 컬럼 사용
     """
     try:
         logger.info(f"채팅 세션 목록 조회 (user_id: {current_user.id}, limit: {limit}, offset: {offset})")
 
         # 전체 세션 수 조회
-        total = db.query(models.ChatSession).filter(
-            models.ChatSession.user_id == current_user.id
-        ).count()
-
-        # 세션 조회와 메시지 수를 한 번에 (subquery 사용으로 N+1 문제 해결)
-        from sqlalchemy import func, select
-
-        # 메시지 수를 계산하는 서브쿼리
-        message_count_subq = (
-            db.query(
-                models.ChatMessage.session_id,
-                func.count(models.ChatMessage.id).label('message_count')
-            )
-            .group_by(models.ChatMessage.session_id)
-            .subquery()
+        total = await db.scalar(
+            select(func.count())
+            .select_from(models.ChatSession)
+            .where(models.ChatSession.user_id == current_user.id)
         )
 
-        # 세션과 메시지 수를 조인하여 한 번에 조회
-        sessions_with_count = (
-            db.query(
-                models.ChatSession,
-                func.coalesce(message_count_subq.c.message_count, 0).label('message_count')
-            )
-            .outerjoin(message_count_subq, models.ChatSession.id == message_count_subq.c.session_id)
-            .filter(models.ChatSession.user_id == current_user.id)
+        # 메시지 수는 세션에 캐시된 message_count 사용 (메시지 테이블 집계 없음)
+        sessions = (await db.scalars(
+            select(models.ChatSession)
+            .where(models.ChatSession.user_id == current_user.id)
             .order_by(models.ChatSession.updated_at.desc().nullslast())
             .limit(limit)
             .offset(offset)
-            .all()
-        )
+        )).all()
 
         # 데이터 변환
         sessions_data = [
@@ -426,9 +414,9 @@ async def get_chat_sessions(
                 title=session.title or "새 채팅",
                 created_at=session.created_at.isoformat() if session.created_at else "",
                 updated_at=session.updated_at.isoformat() if session.updated_at else session.created_at.isoformat(),
-                message_count=message_count
+                message_count=session.message_count
             )
-            for session, message_count in sessions_with_count
+            for session in sessions
         ]
 
         logger.info(f"채팅 세션 목록 조회 완료 (total: {total}, returned: {len(sessions_data)})")
@@ -448,7 +436,7 @@ async def get_session_messages(
     session_id: int,
     limit: int = 100,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(auth.get_current_active_user)
 ):
     """
@@ -460,25 +448,26 @@ async def get_session_messages(
         logger.info(f"세션 메시지 조회 (user_id: {current_user.id}, session_id: {session_id}, limit: {limit})")
 
         # 메시지 조회 시 세션 소유권도 함께 확인 (JOIN 사용)
-        messages = (
-            db.query(models.ChatMessage)
+        messages = (await db.scalars(
+            select(models.ChatMessage)
             .join(models.ChatSession)
-            .filter(
+            .where(
                 models.ChatMessage.session_id == session_id,
                 models.ChatSession.user_id == current_user.id
             )
             .order_by(models.ChatMessage.created_at.desc())
             .limit(limit)
             .offset(offset)
-            .all()
-        )
+        )).all()
 
         if not messages and offset == 0:
             # 메시지가 없으면 세션이 없거나 권한이 없음
-            session_exists = db.query(models.ChatSession).filter(
-                models.ChatSession.id == session_id,
-                models.ChatSession.user_id == current_user.id
-            ).first()
+            session_exists = await db.scalar(
+                select(models.ChatSession.id).where(
+                    models.ChatSession.id == session_id,
+                    models.ChatSession.user_id == current_user.id
+                )
+            )
             if not session_exists:
                 raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
@@ -515,7 +504,7 @@ async def get_session_messages(
 @router.delete("/chat/sessions/{session_id}")
 async def delete_chat_session(
     session_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: models.User = Depends(auth.get_current_active_user)
 ):
     """
@@ -526,22 +515,25 @@ async def delete_chat_session(
         logger.info(f"채팅 세션 삭제 요청 (user_id: {current_user.id}, session_id: {session_id})")
 
         # 세션 조회 및 소유권 확인
-        session = db.query(models.ChatSession).filter(
-            models.ChatSession.id == session_id,
-            models.ChatSession.user_id == current_user.id
-        ).first()
+        session = await db.scalar(
+            select(models.ChatSession).where(
+                models.ChatSession.id == session_id,
+                models.ChatSession.user_id == current_user.id
+            )
+        )
 
         if not session:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
         # 관련 메시지 먼저 삭제
-        deleted_messages = db.query(models.ChatMessage).filter(
-            models.ChatMessage.session_id == session_id
-        ).delete()
+        result = await db.execute(
+            delete(models.ChatMessage).where(models.ChatMessage.session_id == session_id)
+        )
+        deleted_messages = result.rowcount
 
         # 세션 삭제
-        db.delete(session)
-        db.commit()
+        await db.delete(session)
+        await db.commit()
 
         logger.info(f"채팅 세션 삭제 완료 (session_id: {session_id}, deleted_messages: {deleted_messages})")
 
@@ -551,7 +543,7 @@ async def delete_chat_session(
         raise
     except Exception as e:
         logger.error(f"채팅 세션 삭제 실패: {e}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"세션 삭제 중 오류가 발생했습니다: {str(e)}"
@@ -4,8 +4,6 @@ Dashboard API - 통합 플랫폼 상태 조회
 """
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
 
 from ..database import get_db
 from ..models import (
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 import httpx
 import os
 from typing import Optional
@@ -34,7 +34,9 @@ class ImageGenerateResponse(BaseModel):
 
 def get_brand_analysis(db: Session, user_id: int) -> Optional[BrandAnalysis]:
     """사용자의 브랜드 분석 정보 조회"""
-    return db.query(BrandAnalysis).filter(BrandAnalysis.user_id == user_id).first()
+    return db.query(BrandAnalysis).options(
+        undefer_group("instagram")
+    ).filter(BrandAnalysis.user_id == user_id).first()
 
 
 async def convert_to_visual_prompt(prompt: str, google_api_key: str) -> str:
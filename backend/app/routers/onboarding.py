@@ -1,12 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional
 import cloudinary
 import cloudinary.uploader
 from .. import models, schemas, auth
 from ..database import get_db
 import os
-import json
 
 router = APIRouter(
     prefix="/api/onboarding",
@@ -5,7 +5,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, case, text
+from sqlalchemy import func, case, text
 from typing import Optional, List
 from datetime import datetime
 import time
@@ -14,7 +14,6 @@ from pydantic import BaseModel
 import os
 import uuid
 import base64
-from google.cloud import storage
 from supabase import create_client, Client
 
 from ..database import get_db
@@ -50,6 +49,7 @@ def init_gcs():
     try:
         import base64
         import json
+        from google.cloud import storage
         from google.oauth2 import service_account
 
         creds_base64 = os.getenv("GOOGLE_CREDENTIALS_BASE64")
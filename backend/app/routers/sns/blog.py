@@ -3,8 +3,8 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
-from pydantic import BaseModel, HttpUrl
+from sqlalchemy.orm import Session, undefer_group
+from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime
 import logging
@@ -169,7 +169,9 @@ async def get_analysis_status(
         - analyzed_at: 마지막 분석 시간
         - analysis: 분석 결과 (completed 상태일 때만)
     """
-    brand_analysis = db.query(BrandAnalysis).filter(BrandAnalysis.user_id == current_user.id).first()
+    brand_analysis = db.query(BrandAnalysis).options(
+        undefer_group("blog")
+    ).filter(BrandAnalysis.user_id == current_user.id).first()
 
     if not brand_analysis:
         return {
@@ -217,7 +219,11 @@ async def get_brand_analysis(
     Returns:
         브랜드 분석 결과 JSON
     """
-    brand_analysis = db.query(BrandAnalysis).filter(BrandAnalysis.user_id == current_user.id).first()
+    brand_analysis = db.query(BrandAnalysis).options(
+        undefer_group("blog"),
+        undefer_group("instagram"),
+        undefer_group("youtube")
+    ).filter(BrandAnalysis.user_id == current_user.id).first()
 
     if not brand_analysis or brand_analysis.blog_analysis_status != "completed":
         raise HTTPException(
@@ -4,7 +4,7 @@ Facebook API Router
 - 게시물 목록 조회/생성
 - 인사이트 조회
 """
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Request, HTTPException, Depends
 from fastapi.responses import RedirectResponse
@@ -67,6 +67,10 @@ class FacebookPostResponse(BaseModel):
         from_attributes = True
 
 
+# 목록 조회 시 응답 필드에 해당하는 컬럼만 SELECT
+FACEBOOK_POST_COLUMNS = [getattr(models.FacebookPost, field) for field in FacebookPostResponse.model_fields]
+
+
 class CreatePostRequest(BaseModel):
     message: str
     link: Optional[str] = None
@@ -411,13 +415,14 @@ async def get_posts(
     if not connection:
         raise HTTPException(status_code=404, detail="Facebook not connected")
 
-    posts = db.query(models.FacebookPost).filter(
+    rows = db.query(*FACEBOOK_POST_COLUMNS).filter(
         models.FacebookPost.connection_id == connection.id
     ).order_by(
         models.FacebookPost.created_time.desc()
     ).offset(skip).limit(limit).all()
 
-    return posts
+    # ORM 객체 대신 응답 컬럼만 조회한 행을 반환 (검증/직렬화는 response_model로)
+    return [row._asdict() for row in rows]
 
 
 @router.post('/posts/sync')
@@ -66,6 +66,10 @@ class InstagramPostResponse(BaseModel):
         from_attributes = True
 
 
+# 목록 조회 시 응답 필드에 해당하는 컬럼만 SELECT
+INSTAGRAM_POST_COLUMNS = [getattr(models.InstagramPost, field) for field in InstagramPostResponse.model_fields]
+
+
 class InstagramAccountInfo(BaseModel):
     id: str
     username: Optional[str]
@@ -384,13 +388,14 @@ async def get_posts(
     if not connection:
         raise HTTPException(status_code=404, detail="Instagram not connected")
 
-    posts = db.query(models.InstagramPost).filter(
+    rows = db.query(*INSTAGRAM_POST_COLUMNS).filter(
         models.InstagramPost.connection_id == connection.id
     ).order_by(
         models.InstagramPost.timestamp.desc()
     ).offset(skip).limit(limit).all()
 
-    return posts
+    # ORM 객체 대신 응답 컬럼만 조회한 행을 반환 (검증/직렬화는 response_model로)
+    return [row._asdict() for row in rows]
 
 
 @router.post('/posts/sync')
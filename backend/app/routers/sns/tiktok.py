@@ -8,7 +8,6 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
-from typing import Optional
 import httpx
 import os
 
@@ -379,12 +378,18 @@ async def sync_tiktok_videos(
             data = response.json()
             videos = data.get("data", {}).get("videos", [])
 
+            # 기존 영상 한 번에 조회 (영상마다 SELECT 하지 않음)
+            existing_videos = {
+                video.video_id: video
+                for video in db.query(TikTokVideo).filter(
+                    TikTokVideo.video_id.in_([video_data.get("id") for video_data in videos])
+                ).all()
+            } if videos else {}
+
             for video_data in videos:
                 video_id = video_data.get("id")
 
-                existing_video = db.query(TikTokVideo).filter(
-                    TikTokVideo.video_id == video_id
-                ).first()
+                existing_video = existing_videos.get(video_id)
 
                 create_time = None
                 if video_data.get("create_time"):
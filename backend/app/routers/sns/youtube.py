@@ -16,7 +16,7 @@ import tempfile
 from ... import models, auth
 from ...database import get_db
 from ...oauth import oauth
-from ...services.youtube_service import YouTubeService, sync_youtube_videos, parse_duration
+from ...services.youtube_service import YouTubeService, sync_youtube_videos
 from ...logger import get_logger
 
 logger = get_logger(__name__)
@@ -66,6 +66,10 @@ class YouTubeVideoResponse(BaseModel):
         from_attributes = True
 
 
+# 목록 조회 시 응답 필드에 해당하는 컬럼만 SELECT
+YOUTUBE_VIDEO_COLUMNS = [getattr(models.YouTubeVideo, field) for field in YouTubeVideoResponse.model_fields]
+
+
 class VideoUploadRequest(BaseModel):
     title: str
     description: Optional[str] = ""
@@ -305,13 +309,14 @@ async def get_youtube_videos(
     if not connection:
         raise HTTPException(status_code=404, detail="YouTube connection not found")
 
-    videos = db.query(models.YouTubeVideo).filter(
+    rows = db.query(*YOUTUBE_VIDEO_COLUMNS).filter(
         models.YouTubeVideo.connection_id == connection.id
     ).order_by(
         models.YouTubeVideo.published_at.desc()
     ).offset(skip).limit(limit).all()
 
-    return videos
+    # ORM 객체 대신 응답 컬럼만 조회한 행을 반환 (검증/직렬화는 response_model로)
+    return [row._asdict() for row in rows]
 
 
 @router.post('/videos/sync')
@@ -2,9 +2,9 @@
 템플릿 갤러리 API 라우터
 - 사용자별 탭/템플릿 CRUD
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, insert
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
@@ -86,12 +86,11 @@ def initialize_default_tabs_and_templates(db: Session, user_id: int):
         {"tab_key": "how_to", "label": "하우투", "icon": "📝", "sort_order": 4},
     ]
 
-    created_tabs = {}
-    for tab_data in default_tabs:
-        tab = TemplateTab(user_id=user_id, **tab_data)
-        db.add(tab)
-        db.flush()
-        created_tabs[tab_data["tab_key"]] = tab.id
+    # 탭은 한 번의 flush로 일괄 INSERT (RETURNING으로 id 확보)
+    tabs = [TemplateTab(user_id=user_id, **tab_data) for tab_data in default_tabs]
+    db.add_all(tabs)
+    db.flush()
+    created_tabs = {tab.tab_key: tab.id for tab in tabs}
 
     default_templates = [
         # 홍보 템플릿
@@ -150,12 +149,16 @@ def initialize_default_tabs_and_templates(db: Session, user_id: int):
          "description": "문제 해결 단계별 가이드"},
     ]
 
+    # 템플릿은 ORM 객체 없이 insertmanyvalues 경로로 일괄 INSERT
+    template_rows = []
     for tmpl_data in default_templates:
         tab_key = tmpl_data.pop("tab_key")
         tab_id = created_tabs.get(tab_key)
         if tab_id:
-            template = Template(user_id=user_id, tab_id=tab_id, **tmpl_data)
-            db.add(template)
+            template_rows.append({"user_id": user_id, "tab_id": tab_id, **tmpl_data})
+
+    if template_rows:
+        db.execute(insert(Template), template_rows)
 
     db.commit()
 
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session, joinedload, undefer_group
 from typing import Optional
 from .. import models, schemas, auth
 from ..database import get_db
@@ -39,6 +39,21 @@ def build_user_context(
     )
 
 
+def _load_preference_and_brand_analysis(db: Session, user: models.User):
+    """사용자 선호도와 브랜드 분석 결과를 단일 쿼리(JOIN)로 로드"""
+    user = db.query(models.User).options(
+        joinedload(models.User.preferences),
+        joinedload(models.User.brand_analysis).options(
+            undefer_group("brand_profile"),
+            undefer_group("blog"),
+            undefer_group("instagram"),
+            undefer_group("youtube")
+        )
+    ).filter(models.User.id == user.id).populate_existing().one()
+
+    return user.preferences, user.brand_analysis
+
+
 @router.get("/profile", response_model=schemas.UserProfile)
 async def get_user_profile(
     current_user: models.User = Depends(auth.get_current_user),
@@ -50,15 +65,8 @@ async def get_user_profile(
     - 브랜드 정보 (brand_profile_json에서 가져옴)
     - 사용자 선호도 정보 (텍스트/이미지/비디오 스타일 샘플)
     """
-    # 사용자 선호도 조회
-    user_preference = db.query(models.UserPreference).filter(
-        models.UserPreference.user_id == current_user.id
-    ).first()
-
-    # 브랜드 분석 결과 조회
-    brand_analysis = db.query(models.BrandAnalysis).filter(
-        models.BrandAnalysis.user_id == current_user.id
-    ).first()
+    # 사용자 선호도 + 브랜드 분석 결과를 한 번에 조회
+    user_preference, brand_analysis = _load_preference_and_brand_analysis(db, current_user)
 
     return schemas.UserProfile(
         user=current_user,
@@ -79,15 +87,8 @@ async def get_user_context_for_content(
     - 브랜드 분석 결과
     - 통합된 컨텍스트 (AI 프롬프트용)
     """
-    # 사용자 선호도 조회
-    user_preference = db.query(models.UserPreference).filter(
-        models.UserPreference.user_id == current_user.id
-    ).first()
-
-    # 브랜드 분석 결과 조회
-    brand_analysis = db.query(models.BrandAnalysis).filter(
-        models.BrandAnalysis.user_id == current_user.id
-    ).first()
+    # 사용자 선호도 + 브랜드 분석 결과를 한 번에 조회
+    user_preference, brand_analysis = _load_preference_and_brand_analysis(db, current_user)
 
     # 콘텐츠 생성용 컨텍스트 빌드
     context = build_user_context(current_user, user_preference, brand_analysis)
@@ -125,7 +126,9 @@ async def update_user_profile(
     User 테이블 필드는 Fallback용으로 유지됩니다.
     """
     # 브랜드 분석 조회 또는 생성
-    brand_analysis = db.query(models.BrandAnalysis).filter(
+    brand_analysis = db.query(models.BrandAnalysis).options(
+        undefer_group("brand_profile")
+    ).filter(
         models.BrandAnalysis.user_id == current_user.id
     ).first()
 
@@ -202,14 +205,9 @@ async def update_user_profile(
             db.add(user_preference)
 
     db.commit()
-    db.refresh(current_user)
-    if brand_analysis:
-        db.refresh(brand_analysis)
 
-    # 업데이트된 프로필 반환
-    user_preference = db.query(models.UserPreference).filter(
-        models.UserPreference.user_id == current_user.id
-    ).first()
+    # 업데이트된 프로필 반환 (선호도 + 브랜드 분석 결과를 한 번에 다시 조회)
+    user_preference, brand_analysis = _load_preference_and_brand_analysis(db, current_user)
 
     return schemas.UserProfile(
         user=current_user,
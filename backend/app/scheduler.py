@@ -4,15 +4,14 @@
 - 매분 예약된 콘텐츠를 확인하고 발행 시간이 된 콘텐츠를 발행
 """
 
-import asyncio
-from datetime import datetime, timezone
+from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import logging
 
 from .database import SessionLocal
 from .models import PublishedContent, GeneratedImage, XConnection, ThreadsConnection, InstagramConnection, FacebookConnection
-from .services.x_service import XService, XTokenExpiredError, XAPIError
+from .services.x_service import XService
 from .services.threads_service import ThreadsService
 from .services.instagram_service import InstagramService
 from .services.facebook_service import FacebookService
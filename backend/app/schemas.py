@@ -204,23 +204,39 @@ class ContentUpdate(BaseModel):
     status: Optional[str] = None  # draft, published, scheduled
 
 
+class ContentImage(BaseModel):
+    """통합 콘텐츠 생성 이미지 응답 스키마"""
+    position: int
+    url: str
+    prompt: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ContentBody(BaseModel):
+    """통합 콘텐츠 본문 응답 스키마"""
+    blog_content: Optional[str] = None
+    video_prompt: Optional[str] = None
+    instagram_caption: Optional[str] = None
+    facebook_post: Optional[str] = None
+    youtube_description: Optional[str] = None
+    error_message: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
 class Content(ContentBase):
-    """통합 콘텐츠 응답 스키마"""
+    """통합 콘텐츠 응답 스키마 (목록용, 본문 제외)"""
     id: int
     user_id: int
-    blog_content: Optional[str] = None
     blog_seo_keywords: Optional[List[str]] = None
-    image_urls: Optional[List[str]] = None
-    image_prompts: Optional[List[str]] = None
+    images: List[ContentImage] = []
     video_url: Optional[str] = None
-    video_prompt: Optional[str] = None
     video_thumbnail_url: Optional[str] = None
-    instagram_caption: Optional[str] = None
-    facebook_post: Optional[str] = None
-    youtube_description: Optional[str] = None
     status: str
     generation_status: str
-    error_message: Optional[str] = None
     published_at: Optional[datetime] = None
     scheduled_at: Optional[datetime] = None
     created_at: datetime
@@ -230,6 +246,11 @@ class Content(ContentBase):
         from_attributes = True
 
 
+class ContentDetail(Content):
+    """통합 콘텐츠 상세 응답 스키마 (본문 포함, selectinload(Content.body)로 조회)"""
+    body: Optional[ContentBody] = None
+
+
 class Token(BaseModel):
     """토큰 응답 스키마"""
     access_token: str
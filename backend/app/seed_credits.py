@@ -69,8 +69,7 @@ def seed_credit_packages(db: Session):
         ),
     ]
 
-    for package in packages:
-        db.add(package)
+    db.add_all(packages)
 
     db.commit()
     print(f"✅ {len(packages)}개의 크레딧 패키지가 생성되었습니다.")
@@ -17,11 +17,10 @@ import asyncio
 import random
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import anthropic
 import google.generativeai as genai
 import vertexai
 from vertexai.generative_models import GenerativeModel as VertexGenerativeModel, Part
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 import fal_client
 
 from ..models import VideoGenerationJob, User, BrandAnalysis
@@ -2559,7 +2558,9 @@ async def run_video_generation_pipeline(job_id: int, db: Session):
             return
 
         # BrandAnalysis 조회 (있는 경우)
-        brand_analysis = db.query(BrandAnalysis).filter(
+        brand_analysis = db.query(BrandAnalysis).options(
+            undefer_group("brand_profile")
+        ).filter(
             BrandAnalysis.user_id == user.id
         ).first()
 
@@ -5,7 +5,7 @@ Instagram Graph API Service
 - 인사이트 조회
 """
 import httpx
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, List
 from datetime import datetime
 
 from ..logger import get_logger
@@ -13,7 +13,7 @@ from bs4 import BeautifulSoup
 import time
 import re
 from typing import List, Dict, Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
@@ -5,8 +5,8 @@ Threads API Service
 """
 import os
 import httpx
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, Dict
 from sqlalchemy.orm import Session
 
 from ..models import ThreadsConnection, ThreadsPost
@@ -6,11 +6,12 @@ YouTube API Service
 import os
 import re
 import httpx
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from ..models import YouTubeConnection, YouTubeVideo, YouTubeAnalytics
+from ..models import YouTubeConnection, YouTubeVideo
 from ..logger import get_logger
 
 logger = get_logger(__name__)
@@ -468,6 +469,14 @@ async def sync_youtube_videos(
         if not video_details:
             break
 
+        # 기존 데이터 확인 (페이지 단위로 한 번에 조회)
+        existing_ids = dict(
+            db.query(YouTubeVideo.video_id, YouTubeVideo.id).filter(
+                YouTubeVideo.video_id.in_([video["id"] for video in video_details])
+            ).all()
+        )
+        updates = []
+
         for video in video_details:
             video_id = video["id"]
             snippet = video["snippet"]
@@ -475,24 +484,22 @@ async def sync_youtube_videos(
             content_details = video.get("contentDetails", {})
             status = video.get("status", {})
 
-            # 기존 데이터 확인
-            existing = db.query(YouTubeVideo).filter(
-                YouTubeVideo.video_id == video_id
-            ).first()
-
             duration = content_details.get("duration", "")
 
-            if existing:
-                # 업데이트
-                existing.title = snippet["title"]
-                existing.description = snippet.get("description", "")
-                existing.thumbnail_url = snippet.get("thumbnails", {}).get("high", {}).get("url")
-                existing.view_count = int(statistics.get("viewCount", 0))
-                existing.like_count = int(statistics.get("likeCount", 0))
-                existing.comment_count = int(statistics.get("commentCount", 0))
-                existing.privacy_status = status.get("privacyStatus")
-                existing.tags = snippet.get("tags", [])
-                existing.last_stats_updated_at = datetime.utcnow()
+            if video_id in existing_ids:
+                # 업데이트 (페이지 끝에서 executemany로 일괄 반영)
+                updates.append({
+                    "id": existing_ids[video_id],
+                    "title": snippet["title"],
+                    "description": snippet.get("description", ""),
+                    "thumbnail_url": snippet.get("thumbnails", {}).get("high", {}).get("url"),
+                    "view_count": int(statistics.get("viewCount", 0)),
+                    "like_count": int(statistics.get("likeCount", 0)),
+                    "comment_count": int(statistics.get("commentCount", 0)),
+                    "privacy_status": status.get("privacyStatus"),
+                    "tags": snippet.get("tags", []),
+                    "last_stats_updated_at": datetime.utcnow(),
+                })
             else:
                 # 새로 추가
                 new_video = YouTubeVideo(
@@ -517,6 +524,10 @@ async def sync_youtube_videos(
                 db.add(new_video)
                 synced_count += 1
 
+        if updates:
+            # 기본 키 기준 ORM bulk UPDATE (행마다 UPDATE를 보내지 않음)
+            db.execute(update(YouTubeVideo), updates)
+
         db.commit()
 
         # 다음 페이지
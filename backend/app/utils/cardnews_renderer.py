@@ -4,8 +4,8 @@
 개선된 템플릿 시스템을 실제 이미지로 렌더링
 """
 
-from PIL import Image, ImageDraw, ImageFilter, ImageEnhance
-from typing import Tuple, List, Optional
+from PIL import Image, ImageDraw, ImageFilter
+from typing import Tuple, List
 import math
 
 # 기본 상수
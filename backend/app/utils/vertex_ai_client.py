@@ -18,6 +18,25 @@ logger = logging.getLogger(__name__)
 # 기본 타임아웃 설정 (초)
 DEFAULT_TIMEOUT = 120
 
+# 이미지 다운로드용 HTTP 연결 풀 설정 (keep-alive 연결 재사용)
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+def _parse_json_response(response_text: str) -> Dict[str, Any]:
+    """
+    Gemini 응답 텍스트를 JSON으로 파싱
+
+    JSON 모드 응답은 바로 파싱하고, 코드 펜스(```json)로 감싼 응답도 허용한다.
+    """
+    cleaned_text = response_text.strip()
+
+    if cleaned_text.startswith('```json'):
+        cleaned_text = cleaned_text.replace('```json', '').replace('```', '').strip()
+    elif cleaned_text.startswith('```'):
+        cleaned_text = cleaned_text.replace('```', '').strip()
+
+    return json.loads(cleaned_text)
+
 
 class VertexAIClient:
     """Vertex AI Gemini 2.5 Flash 클라이언트"""
@@ -45,6 +64,20 @@ class VertexAIClient:
             logger.error(f"❌ Vertex AI 초기화 실패: {e}")
             raise
 
+        # 이미지 다운로드용 공유 HTTP 클라이언트 (첫 사용 시 생성)
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        HTTP/2 + keep-alive 연결 풀을 가진 공유 httpx 클라이언트 반환
+
+        요청마다 AsyncClient를 새로 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로
+        클라이언트 인스턴스 하나를 재사용한다.
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS)
+        return self._http_client
+
     def _sync_generate_content(
         self,
         prompt: str,
@@ -66,7 +99,8 @@ class VertexAIClient:
         max_output_tokens: int = 8192,
         top_p: float = 0.95,
         top_k: int = 40,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        response_mime_type: Optional[str] = None
     ) -> str:
         """
         Gemini 2.5 Flash로 텍스트 생성 (비동기 + 타임아웃)
@@ -78,6 +112,7 @@ class VertexAIClient:
             top_p: 누적 확률 임계값
             top_k: Top-K 샘플링
             timeout: 타임아웃 (초, 기본 120초)
+            response_mime_type: 응답 MIME 타입 (예: "application/json")
 
         Returns:
             생성된 텍스트
@@ -87,7 +122,8 @@ class VertexAIClient:
                 temperature=temperature,
                 max_output_tokens=max_output_tokens,
                 top_p=top_p,
-                top_k=top_k
+                top_k=top_k,
+                response_mime_type=response_mime_type
             )
 
             # 동기 호출을 별도 스레드에서 실행 + 타임아웃 적용
@@ -127,23 +163,15 @@ class VertexAIClient:
             파싱된 JSON 딕셔너리
         """
         try:
+            # JSON 모드: 모델이 코드 펜스/설명 없이 JSON만 생성
             response_text = await self.generate_content(
                 prompt=prompt,
                 temperature=temperature,
-                max_output_tokens=max_output_tokens
+                max_output_tokens=max_output_tokens,
+                response_mime_type="application/json"
             )
 
-            # JSON 추출 (```json 태그 제거)
-            cleaned_text = response_text.strip()
-
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text.replace('```json', '').replace('```', '').strip()
-            elif cleaned_text.startswith('```'):
-                cleaned_text = cleaned_text.replace('```', '').strip()
-
-            # JSON 파싱
-            parsed_json = json.loads(cleaned_text)
-            return parsed_json
+            return _parse_json_response(response_text)
 
         except json.JSONDecodeError as e:
             logger.error(f"❌ JSON 파싱 실패: {e}")
@@ -164,10 +192,10 @@ class VertexAIClient:
         Returns:
             이미지 바이트 데이터
         """
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.content
+        client = self._get_http_client()
+        response = await client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
 
     def _get_mime_type(self, url: str) -> str:
         """URL에서 MIME 타입 추론"""
@@ -246,7 +274,8 @@ class VertexAIClient:
                 temperature=temperature,
                 max_output_tokens=max_output_tokens,
                 top_p=0.95,
-                top_k=40
+                top_k=40,
+                response_mime_type="application/json"
             )
 
             # 멀티모달 분석 실행
@@ -261,13 +290,7 @@ class VertexAIClient:
             )
 
             # JSON 파싱
-            cleaned_text = response_text.strip()
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text.replace('```json', '').replace('```', '').strip()
-            elif cleaned_text.startswith('```'):
-                cleaned_text = cleaned_text.replace('```', '').strip()
-
-            parsed_json = json.loads(cleaned_text)
+            parsed_json = _parse_json_response(response_text)
             logger.info("✅ 이미지 분석 완료")
             return parsed_json
 
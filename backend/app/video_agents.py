@@ -13,7 +13,6 @@ Context Engineering 기반 4단계 Agent 파이프라인:
 - low: 제품 이미지 분석 우선, 브랜드는 힌트만
 """
 
-import os
 import json
 import base64
 import httpx
@@ -22,7 +21,6 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-import vertexai
 from vertexai.generative_models import GenerativeModel as VertexGenerativeModel, Part
 from sqlalchemy.orm import Session
 
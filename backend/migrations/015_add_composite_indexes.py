@@ -0,0 +1,53 @@
+"""
+users, published_contents 테이블에 복합 인덱스 추가
+- OAuth 로그인 조회 (oauth_provider + oauth_id)
+- 사용자별 상태 조회 (user_id + status)
+- 예약 발행 스케줄러 조회 (status + scheduled_at)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """복합 인덱스 추가 및 중복 단일 인덱스 삭제"""
+
+    with engine.connect() as conn:
+        # OAuth 로그인 조회용 복합 유니크 인덱스
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_users_oauth
+            ON users (oauth_provider, oauth_id)
+        """))
+        print("ix_users_oauth 인덱스 추가 완료")
+
+        # 복합 인덱스로 대체된 oauth_id 단일 인덱스 삭제
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_users_oauth_id
+        """))
+        print("ix_users_oauth_id 인덱스 삭제 완료")
+
+        # 사용자별 상태 조회용 인덱스
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_published_contents_user_status
+            ON published_contents (user_id, status)
+        """))
+        print("ix_published_contents_user_status 인덱스 추가 완료")
+
+        # 예약 발행 스케줄러 조회용 인덱스
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_published_contents_status_scheduled
+            ON published_contents (status, scheduled_at)
+        """))
+        print("ix_published_contents_status_scheduled 인덱스 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
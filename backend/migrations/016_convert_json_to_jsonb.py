@@ -0,0 +1,50 @@
+"""
+users, user_preferences, contents 테이블의 JSON 컬럼을 JSONB로 변환
+- JSONB는 파싱된 바이너리 형태로 저장되어 읽기가 빠르고 GIN 인덱스를 지원
+- contents.platforms에 GIN 인덱스 추가 (platforms @> '["instagram"]' 조회)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 컬럼) 목록
+JSONB_COLUMNS = [
+    ("users", "target_audience"),
+    ("user_preferences", "image_color_palette"),
+    ("contents", "keywords"),
+    ("contents", "platforms"),
+    ("contents", "blog_seo_keywords"),
+    ("contents", "image_urls"),
+    ("contents", "image_prompts"),
+]
+
+
+def run_migration():
+    """JSON 컬럼을 JSONB로 변환하고 GIN 인덱스 추가"""
+
+    with engine.connect() as conn:
+        for table, column in JSONB_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb
+            """))
+            print(f"{table}.{column} JSONB 변환 완료")
+
+        # 플랫폼 필터용 GIN 인덱스
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_contents_platforms_gin
+            ON contents USING gin (platforms)
+        """))
+        print("ix_contents_platforms_gin 인덱스 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
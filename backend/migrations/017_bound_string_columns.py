@@ -0,0 +1,48 @@
+"""
+식별자/상태 컬럼에 길이 제한 추가 (VARCHAR → VARCHAR(n))
+- users: email, username, oauth_provider, oauth_id
+- contents, brand_analysis, video_generation_jobs, content_generation_sessions: 상태 컬럼
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 컬럼, 길이) 목록
+BOUNDED_COLUMNS = [
+    ("users", "email", 254),
+    ("users", "username", 100),
+    ("users", "oauth_provider", 20),
+    ("users", "oauth_id", 128),
+    ("contents", "status", 20),
+    ("contents", "generation_status", 20),
+    ("brand_analysis", "blog_analysis_status", 20),
+    ("brand_analysis", "instagram_analysis_status", 20),
+    ("brand_analysis", "youtube_analysis_status", 20),
+    ("brand_analysis", "analysis_status", 20),
+    ("video_generation_jobs", "status", 30),
+    ("content_generation_sessions", "status", 20),
+]
+
+
+def run_migration():
+    """문자열 컬럼 길이 제한 추가"""
+
+    with engine.connect() as conn:
+        for table, column, length in BOUNDED_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE VARCHAR({length})
+            """))
+            print(f"{table}.{column} VARCHAR({length}) 변경 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
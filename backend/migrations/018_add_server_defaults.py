@@ -0,0 +1,49 @@
+"""
+updated_at, is_active 컬럼에 DB 기본값(server_default) 추가
+- updated_at: 생성 시 NULL 대신 now() 저장 (기존 NULL 행은 created_at으로 채움)
+- is_active: 직접 INSERT/대량 INSERT 시에도 true 기본값 적용
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine, Base
+from app import models  # noqa: F401 - 테이블 메타데이터 등록
+
+
+def run_migration():
+    """updated_at, is_active 기본값 추가"""
+
+    with engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            if "updated_at" in table.c:
+                conn.execute(text(f"""
+                    ALTER TABLE {table.name}
+                    ALTER COLUMN updated_at SET DEFAULT now()
+                """))
+
+                # 기존 NULL 값 채우기
+                backfill = "created_at" if "created_at" in table.c else "now()"
+                conn.execute(text(f"""
+                    UPDATE {table.name}
+                    SET updated_at = {backfill}
+                    WHERE updated_at IS NULL
+                """))
+                print(f"{table.name}.updated_at 기본값 추가 완료")
+
+            if "is_active" in table.c:
+                conn.execute(text(f"""
+                    ALTER TABLE {table.name}
+                    ALTER COLUMN is_active SET DEFAULT true
+                """))
+                print(f"{table.name}.is_active 기본값 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,57 @@
+"""
+brand_analysis 테이블의 JSON 컬럼을 JSONB로 변환하고
+contents GIN 인덱스를 jsonb_path_ops로 재생성
+- jsonb_path_ops: @> 포함 검색 전용, 기본 jsonb_ops보다 인덱스 크기가 작음
+- contents.keywords GIN 인덱스 추가
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# brand_analysis JSONB 변환 대상 컬럼
+JSONB_COLUMNS = [
+    "brand_values",
+    "key_themes",
+    "blog_keyword_usage",
+    "instagram_color_palette",
+]
+
+
+def run_migration():
+    """brand_analysis JSONB 변환 및 contents GIN 인덱스 재생성"""
+
+    with engine.connect() as conn:
+        for column in JSONB_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE brand_analysis
+                ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb
+            """))
+            print(f"brand_analysis.{column} JSONB 변환 완료")
+
+        # 기본 jsonb_ops로 생성된 인덱스를 jsonb_path_ops로 재생성
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_contents_platforms_gin
+        """))
+        conn.execute(text("""
+            CREATE INDEX ix_contents_platforms_gin
+            ON contents USING gin (platforms jsonb_path_ops)
+        """))
+        print("ix_contents_platforms_gin 인덱스 재생성 완료")
+
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_contents_keywords_gin
+            ON contents USING gin (keywords jsonb_path_ops)
+        """))
+        print("ix_contents_keywords_gin 인덱스 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,48 @@
+"""
+users 테이블에 target_audience JSON 키 생성 컬럼 추가
+- target_age_range: target_audience->>'age_range'
+- target_gender: target_audience->>'gender'
+- STORED 생성 컬럼이므로 기존 행도 자동으로 채워짐 (PostgreSQL 12+)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """target_age_range, target_gender 생성 컬럼 및 인덱스 추가"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS target_age_range VARCHAR
+            GENERATED ALWAYS AS (target_audience->>'age_range') STORED
+        """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_users_target_age_range
+            ON users (target_age_range)
+        """))
+        print("target_age_range 컬럼 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS target_gender VARCHAR
+            GENERATED ALWAYS AS (target_audience->>'gender') STORED
+        """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_users_target_gender
+            ON users (target_gender)
+        """))
+        print("target_gender 컬럼 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
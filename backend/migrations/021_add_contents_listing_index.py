@@ -0,0 +1,30 @@
+"""
+contents 테이블에 목록 조회용 복합 인덱스 추가
+- WHERE user_id = ? AND status = ? ORDER BY created_at DESC
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """ix_contents_user_status_created 인덱스 추가"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_contents_user_status_created
+            ON contents (user_id, status, created_at DESC)
+        """))
+        print("ix_contents_user_status_created 인덱스 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,61 @@
+"""
+contents.image_urls / image_prompts 배열을 content_images 테이블로 분리
+- content_images (content_id, position) 기본 키
+- 기존 JSONB 배열 데이터를 순서대로 옮긴 뒤 컬럼 삭제
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """content_images 테이블 생성 및 기존 이미지 데이터 이전"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS content_images (
+                content_id INTEGER NOT NULL REFERENCES contents(id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                url VARCHAR NOT NULL,
+                prompt TEXT,
+                PRIMARY KEY (content_id, position)
+            )
+        """))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_content_images_content_id
+            ON content_images (content_id)
+        """))
+        print("content_images 테이블 생성 완료")
+
+        # image_urls 컬럼이 남아 있는 경우에만 데이터 이전 후 컬럼 삭제
+        has_image_urls = conn.execute(text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'contents' AND column_name = 'image_urls'
+        """)).first()
+
+        if has_image_urls:
+            conn.execute(text("""
+                INSERT INTO content_images (content_id, position, url, prompt)
+                SELECT c.id, u.ord - 1, u.url, c.image_prompts ->> (u.ord - 1)::int
+                FROM contents c
+                CROSS JOIN LATERAL jsonb_array_elements_text(c.image_urls) WITH ORDINALITY AS u(url, ord)
+                WHERE jsonb_typeof(c.image_urls) = 'array'
+                ON CONFLICT (content_id, position) DO NOTHING
+            """))
+            print("기존 이미지 데이터 이전 완료")
+
+            conn.execute(text("ALTER TABLE contents DROP COLUMN IF EXISTS image_urls"))
+            conn.execute(text("ALTER TABLE contents DROP COLUMN IF EXISTS image_prompts"))
+            print("contents.image_urls, image_prompts 컬럼 삭제 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,62 @@
+"""
+값이 고정된 상태 컬럼을 PostgreSQL ENUM 타입으로 변환
+- contents.status → content_status
+- contents.generation_status → generation_status
+- brand_analysis.*analysis_status → analysis_status
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (타입 이름, 허용 값)
+ENUM_TYPES = [
+    ("content_status", ("draft", "published", "scheduled")),
+    ("generation_status", ("pending", "generating", "completed", "failed")),
+    ("analysis_status", ("pending", "analyzing", "completed", "failed")),
+]
+
+# (테이블, 컬럼, 타입 이름)
+ENUM_COLUMNS = [
+    ("contents", "status", "content_status"),
+    ("contents", "generation_status", "generation_status"),
+    ("brand_analysis", "blog_analysis_status", "analysis_status"),
+    ("brand_analysis", "instagram_analysis_status", "analysis_status"),
+    ("brand_analysis", "youtube_analysis_status", "analysis_status"),
+    ("brand_analysis", "analysis_status", "analysis_status"),
+]
+
+
+def run_migration():
+    """상태 컬럼 ENUM 타입 생성 및 컬럼 타입 변경"""
+
+    with engine.connect() as conn:
+        for type_name, values in ENUM_TYPES:
+            labels = ", ".join(f"'{value}'" for value in values)
+            conn.execute(text(f"""
+                DO $$
+                BEGIN
+                    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = '{type_name}') THEN
+                        CREATE TYPE {type_name} AS ENUM ({labels});
+                    END IF;
+                END $$
+            """))
+            print(f"{type_name} 타입 생성 완료")
+
+        for table, column, type_name in ENUM_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}
+            """))
+            print(f"{table}.{column} → {type_name} 변환 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
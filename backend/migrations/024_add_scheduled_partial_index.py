@@ -0,0 +1,38 @@
+"""
+published_contents 예약 발행 조회용 인덱스를 부분 인덱스로 교체
+- WHERE status = 'scheduled' AND scheduled_at <= now
+- 발행 완료/임시저장 행은 인덱스에서 제외
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """ix_published_contents_scheduled_pending 부분 인덱스 추가 및 기존 인덱스 삭제"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_published_contents_scheduled_pending
+            ON published_contents (scheduled_at)
+            WHERE status = 'scheduled'
+        """))
+        print("ix_published_contents_scheduled_pending 인덱스 추가 완료")
+
+        # 부분 인덱스로 대체된 (status, scheduled_at) 인덱스 삭제
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_published_contents_status_scheduled
+        """))
+        print("ix_published_contents_status_scheduled 인덱스 삭제 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
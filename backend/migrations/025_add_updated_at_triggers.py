@@ -0,0 +1,35 @@
+"""
+updated_at 갱신을 애플리케이션(onupdate)에서 DB 트리거로 이전
+- set_updated_at() 트리거 함수 생성
+- updated_at 컬럼이 있는 모든 테이블에 BEFORE UPDATE 트리거 추가
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine, Base
+from app.models import SET_UPDATED_AT_FUNCTION_SQL, updated_at_trigger_sql
+
+
+def run_migration():
+    """updated_at 트리거 함수 및 테이블별 트리거 추가"""
+
+    with engine.connect() as conn:
+        conn.execute(text(SET_UPDATED_AT_FUNCTION_SQL))
+        print("set_updated_at() 함수 생성 완료")
+
+        for table in Base.metadata.sorted_tables:
+            if "updated_at" in table.c:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table.name}_updated_at ON {table.name}"))
+                conn.execute(text(updated_at_trigger_sql(table.name)))
+                print(f"{table.name} updated_at 트리거 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,67 @@
+"""
+contents의 긴 텍스트 컬럼을 content_bodies 테이블(1:1)로 분리
+- blog_content, video_prompt, instagram_caption, facebook_post,
+  youtube_description, error_message
+- 기존 데이터를 옮긴 뒤 contents에서 컬럼 삭제
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+BODY_COLUMNS = [
+    "blog_content",
+    "video_prompt",
+    "instagram_caption",
+    "facebook_post",
+    "youtube_description",
+    "error_message",
+]
+
+
+def run_migration():
+    """content_bodies 테이블 생성 및 본문 데이터 이전"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS content_bodies (
+                content_id INTEGER PRIMARY KEY REFERENCES contents(id) ON DELETE CASCADE,
+                blog_content TEXT,
+                video_prompt TEXT,
+                instagram_caption TEXT,
+                facebook_post TEXT,
+                youtube_description TEXT,
+                error_message TEXT
+            )
+        """))
+        print("content_bodies 테이블 생성 완료")
+
+        # 본문 컬럼이 남아 있는 경우에만 데이터 이전 후 컬럼 삭제
+        has_body_columns = conn.execute(text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'contents' AND column_name = 'blog_content'
+        """)).first()
+
+        if has_body_columns:
+            columns = ", ".join(BODY_COLUMNS)
+            conn.execute(text(f"""
+                INSERT INTO content_bodies (content_id, {columns})
+                SELECT id, {columns} FROM contents
+                ON CONFLICT (content_id) DO NOTHING
+            """))
+            print("기존 본문 데이터 이전 완료")
+
+            for column in BODY_COLUMNS:
+                conn.execute(text(f"ALTER TABLE contents DROP COLUMN IF EXISTS {column}"))
+            print("contents 본문 컬럼 삭제 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
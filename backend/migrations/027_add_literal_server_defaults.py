@@ -0,0 +1,246 @@
+"""
+고정 기본값(default=)이 있는 컬럼에 DB 기본값(server_default) 추가
+- 상태 문자열, 카운터(0), 플래그(true/false) 등
+- 대량 INSERT/직접 SQL에서 컬럼을 생략해도 같은 값이 저장되도록 함
+- updated_at/created_at(now())은 018에서 처리
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """고정 기본값을 기존 테이블에 반영"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            ALTER TABLE credit_packages
+                ALTER COLUMN bonus_credits SET DEFAULT 0,
+                ALTER COLUMN is_popular SET DEFAULT false,
+                ALTER COLUMN is_active SET DEFAULT true,
+                ALTER COLUMN sort_order SET DEFAULT 0
+        """))
+        print("credit_packages 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE users
+                ALTER COLUMN is_active SET DEFAULT true,
+                ALTER COLUMN is_superuser SET DEFAULT false,
+                ALTER COLUMN onboarding_completed SET DEFAULT false
+        """))
+        print("users 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE brand_analysis
+                ALTER COLUMN blog_analyzed_posts SET DEFAULT 0,
+                ALTER COLUMN blog_analysis_status SET DEFAULT 'pending',
+                ALTER COLUMN instagram_analyzed_posts SET DEFAULT 0,
+                ALTER COLUMN instagram_analysis_status SET DEFAULT 'pending',
+                ALTER COLUMN youtube_analyzed_videos SET DEFAULT 0,
+                ALTER COLUMN youtube_analysis_status SET DEFAULT 'pending',
+                ALTER COLUMN analysis_status SET DEFAULT 'pending',
+                ALTER COLUMN analysis_progress SET DEFAULT 0
+        """))
+        print("brand_analysis 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE content_generation_sessions
+                ALTER COLUMN requested_image_count SET DEFAULT 0,
+                ALTER COLUMN generation_attempts SET DEFAULT 1,
+                ALTER COLUMN status SET DEFAULT 'generated'
+        """))
+        print("content_generation_sessions 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE contents
+                ALTER COLUMN status SET DEFAULT 'draft',
+                ALTER COLUMN generation_status SET DEFAULT 'pending'
+        """))
+        print("contents 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE facebook_connections
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("facebook_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE instagram_connections
+                ALTER COLUMN followers_count SET DEFAULT 0,
+                ALTER COLUMN follows_count SET DEFAULT 0,
+                ALTER COLUMN media_count SET DEFAULT 0,
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("instagram_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE template_tabs
+                ALTER COLUMN icon SET DEFAULT '📁',
+                ALTER COLUMN sort_order SET DEFAULT 0
+        """))
+        print("template_tabs 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE threads_connections
+                ALTER COLUMN followers_count SET DEFAULT 0,
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("threads_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE tiktok_connections
+                ALTER COLUMN follower_count SET DEFAULT 0,
+                ALTER COLUMN following_count SET DEFAULT 0,
+                ALTER COLUMN likes_count SET DEFAULT 0,
+                ALTER COLUMN video_count SET DEFAULT 0,
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("tiktok_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE user_credits
+                ALTER COLUMN balance SET DEFAULT 0
+        """))
+        print("user_credits 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE video_generation_jobs
+                ALTER COLUMN generation_attempts SET DEFAULT 1,
+                ALTER COLUMN status SET DEFAULT 'pending'
+        """))
+        print("video_generation_jobs 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE wordpress_connections
+                ALTER COLUMN post_count SET DEFAULT 0,
+                ALTER COLUMN page_count SET DEFAULT 0,
+                ALTER COLUMN category_count SET DEFAULT 0,
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("wordpress_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE x_connections
+                ALTER COLUMN verified SET DEFAULT false,
+                ALTER COLUMN followers_count SET DEFAULT 0,
+                ALTER COLUMN following_count SET DEFAULT 0,
+                ALTER COLUMN post_count SET DEFAULT 0,
+                ALTER COLUMN listed_count SET DEFAULT 0,
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("x_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE youtube_connections
+                ALTER COLUMN is_active SET DEFAULT true
+        """))
+        print("youtube_connections 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE facebook_posts
+                ALTER COLUMN is_published SET DEFAULT true,
+                ALTER COLUMN is_hidden SET DEFAULT false,
+                ALTER COLUMN likes_count SET DEFAULT 0,
+                ALTER COLUMN comments_count SET DEFAULT 0,
+                ALTER COLUMN shares_count SET DEFAULT 0,
+                ALTER COLUMN reactions_count SET DEFAULT 0
+        """))
+        print("facebook_posts 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE instagram_posts
+                ALTER COLUMN like_count SET DEFAULT 0,
+                ALTER COLUMN comments_count SET DEFAULT 0,
+                ALTER COLUMN saved_count SET DEFAULT 0,
+                ALTER COLUMN reach_count SET DEFAULT 0,
+                ALTER COLUMN impressions_count SET DEFAULT 0,
+                ALTER COLUMN engagement_count SET DEFAULT 0
+        """))
+        print("instagram_posts 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE published_contents
+                ALTER COLUMN status SET DEFAULT 'draft',
+                ALTER COLUMN views SET DEFAULT 0
+        """))
+        print("published_contents 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE templates
+                ALTER COLUMN icon SET DEFAULT '📝',
+                ALTER COLUMN uses SET DEFAULT 0
+        """))
+        print("templates 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE threads_posts
+                ALTER COLUMN is_quote_post SET DEFAULT false,
+                ALTER COLUMN like_count SET DEFAULT 0,
+                ALTER COLUMN reply_count SET DEFAULT 0,
+                ALTER COLUMN repost_count SET DEFAULT 0,
+                ALTER COLUMN quote_count SET DEFAULT 0,
+                ALTER COLUMN views_count SET DEFAULT 0
+        """))
+        print("threads_posts 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE tiktok_videos
+                ALTER COLUMN view_count SET DEFAULT 0,
+                ALTER COLUMN like_count SET DEFAULT 0,
+                ALTER COLUMN comment_count SET DEFAULT 0,
+                ALTER COLUMN share_count SET DEFAULT 0
+        """))
+        print("tiktok_videos 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE wordpress_posts
+                ALTER COLUMN post_type SET DEFAULT 'post',
+                ALTER COLUMN comment_count SET DEFAULT 0
+        """))
+        print("wordpress_posts 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE x_posts
+                ALTER COLUMN repost_count SET DEFAULT 0,
+                ALTER COLUMN reply_count SET DEFAULT 0,
+                ALTER COLUMN like_count SET DEFAULT 0,
+                ALTER COLUMN quote_count SET DEFAULT 0,
+                ALTER COLUMN bookmark_count SET DEFAULT 0,
+                ALTER COLUMN impression_count SET DEFAULT 0
+        """))
+        print("x_posts 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE youtube_videos
+                ALTER COLUMN view_count SET DEFAULT 0,
+                ALTER COLUMN like_count SET DEFAULT 0,
+                ALTER COLUMN comment_count SET DEFAULT 0
+        """))
+        print("youtube_videos 기본값 추가 완료")
+
+        conn.execute(text("""
+            ALTER TABLE youtube_analytics
+                ALTER COLUMN views SET DEFAULT 0,
+                ALTER COLUMN watch_time_minutes SET DEFAULT 0,
+                ALTER COLUMN average_view_duration SET DEFAULT 0,
+                ALTER COLUMN average_view_percentage SET DEFAULT 0,
+                ALTER COLUMN likes SET DEFAULT 0,
+                ALTER COLUMN dislikes SET DEFAULT 0,
+                ALTER COLUMN comments SET DEFAULT 0,
+                ALTER COLUMN shares SET DEFAULT 0,
+                ALTER COLUMN subscribers_gained SET DEFAULT 0,
+                ALTER COLUMN subscribers_lost SET DEFAULT 0
+        """))
+        print("youtube_analytics 기본값 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
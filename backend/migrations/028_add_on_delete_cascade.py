@@ -0,0 +1,56 @@
+"""
+부모 삭제 시 자식 행을 DB에서 함께 삭제하도록 외래 키에 ON DELETE CASCADE 추가
+- 모델에서 ondelete="CASCADE"로 선언된 외래 키만 대상
+- 관계(relationship)는 passive_deletes=True로 자식 행을 로드하지 않고 DB에 위임
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine, Base
+from app import models  # noqa: F401 - 테이블 메타데이터 등록
+
+
+def run_migration():
+    """기존 외래 키 제약조건을 ON DELETE CASCADE로 재생성"""
+
+    with engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            for fk in table.foreign_keys:
+                if fk.ondelete != "CASCADE":
+                    continue
+
+                column = fk.parent.name
+                ref_table = fk.column.table.name
+                ref_column = fk.column.name
+
+                # CASCADE가 아닌 기존 제약조건 이름 조회
+                rows = conn.execute(text("""
+                    SELECT con.conname
+                    FROM pg_constraint con
+                    JOIN pg_class rel ON rel.oid = con.conrelid
+                    JOIN pg_attribute att ON att.attrelid = con.conrelid AND att.attnum = ANY(con.conkey)
+                    WHERE con.contype = 'f'
+                      AND con.confdeltype <> 'c'
+                      AND rel.relname = :table
+                      AND att.attname = :column
+                """), {"table": table.name, "column": column}).fetchall()
+
+                for (constraint_name,) in rows:
+                    conn.execute(text(f"""
+                        ALTER TABLE {table.name}
+                        DROP CONSTRAINT {constraint_name},
+                        ADD CONSTRAINT {constraint_name}
+                            FOREIGN KEY ({column}) REFERENCES {ref_table} ({ref_column}) ON DELETE CASCADE
+                    """))
+                    print(f"{table.name}.{column} → {ref_table}.{ref_column} ON DELETE CASCADE 적용 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
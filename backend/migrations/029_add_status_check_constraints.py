@@ -0,0 +1,50 @@
+"""
+ENUM으로 바꾸지 않은 상태 컬럼에 허용 값 CHECK 제약조건 추가
+- video_generation_jobs.status
+- content_generation_sessions.status
+- published_contents.status
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.schema import CheckConstraint
+from app.database import engine, Base
+from app import models  # noqa: F401 - 테이블 메타데이터 등록
+
+
+def run_migration():
+    """모델에 선언된 CHECK 제약조건을 기존 테이블에 추가"""
+
+    with engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            for constraint in table.constraints:
+                if not isinstance(constraint, CheckConstraint):
+                    continue
+
+                exists = conn.execute(text("""
+                    SELECT 1 FROM pg_constraint WHERE conname = :name
+                """), {"name": constraint.name}).first()
+                if exists:
+                    continue
+
+                # NOT VALID로 먼저 추가해 테이블 잠금 시간을 줄이고, 기존 행은 별도로 검증
+                conn.execute(text(f"""
+                    ALTER TABLE {table.name}
+                    ADD CONSTRAINT {constraint.name} CHECK ({constraint.sqltext}) NOT VALID
+                """))
+                conn.execute(text(f"""
+                    ALTER TABLE {table.name}
+                    VALIDATE CONSTRAINT {constraint.name}
+                """))
+                print(f"{constraint.name} 제약조건 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,67 @@
+"""
+색상 팔레트 컬럼을 JSONB(HEX 문자열 배열)에서 integer[](RGB 정수 배열)로 변환
+- user_preferences.image_color_palette
+- brand_analysis.instagram_color_palette
+- "#RGB" 축약형은 6자리로 확장, HEX가 아닌 값은 제외
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+PALETTE_COLUMNS = [
+    ("user_preferences", "image_color_palette"),
+    ("brand_analysis", "instagram_color_palette"),
+]
+
+
+def run_migration():
+    """색상 팔레트 컬럼 타입 변경"""
+
+    with engine.connect() as conn:
+        # ALTER COLUMN ... USING에는 서브쿼리를 쓸 수 없으므로 임시 함수로 변환
+        conn.execute(text(r"""
+            CREATE OR REPLACE FUNCTION pg_temp.hex_palette_to_ints(palette jsonb) RETURNS integer[] AS $$
+                SELECT COALESCE(
+                    array_agg(
+                        ('x' || lpad(CASE WHEN length(hex) = 3 THEN regexp_replace(hex, '(.)', '\1\1', 'g') ELSE hex END, 8, '0'))::bit(32)::integer
+                        ORDER BY ord
+                    ),
+                    '{}'
+                )
+                FROM (
+                    SELECT ord, ltrim(trim(elem), '#') AS hex
+                    FROM jsonb_array_elements_text(
+                        CASE WHEN jsonb_typeof(palette) = 'array' THEN palette ELSE '[]'::jsonb END
+                    ) WITH ORDINALITY AS t(elem, ord)
+                ) colors
+                WHERE hex ~* '^([0-9a-f]{3}|[0-9a-f]{6})$'
+            $$ LANGUAGE sql IMMUTABLE STRICT
+        """))
+
+        for table, column in PALETTE_COLUMNS:
+            column_type = conn.execute(text("""
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = :table AND column_name = :column
+            """), {"table": table, "column": column}).scalar()
+
+            if column_type == "ARRAY":
+                print(f"{table}.{column} 이미 integer[] - 건너뜀")
+                continue
+
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE integer[] USING pg_temp.hex_palette_to_ints({column}::jsonb)
+            """))
+            print(f"{table}.{column} → integer[] 변환 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,31 @@
+"""
+contents 테이블에 created_at BRIN 인덱스 추가
+- 기간별 조회 (created_at >= ?)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """ix_contents_created_brin 인덱스 추가"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_contents_created_brin
+            ON contents USING brin (created_at)
+            WITH (pages_per_range = 32)
+        """))
+        print("ix_contents_created_brin 인덱스 추가 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,37 @@
+"""
+기본 키 컬럼에 중복으로 생성된 인덱스 삭제
+- primary_key=True, index=True로 만들어진 ix_<table>_id 등
+- 기본 키 제약조건이 이미 같은 컬럼의 유니크 인덱스를 가지고 있음
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine, Base
+from app import models  # noqa: F401 - 테이블 메타데이터 등록
+
+
+def run_migration():
+    """기본 키 중복 인덱스 삭제"""
+
+    with engine.connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            declared = {index.name for index in table.indexes}
+
+            for column in table.primary_key.columns:
+                index_name = f"ix_{table.name}_{column.name}"
+                if index_name in declared:
+                    continue
+
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+                print(f"{index_name} 인덱스 삭제 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
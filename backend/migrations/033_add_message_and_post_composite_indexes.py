@@ -0,0 +1,55 @@
+"""
+채팅 메시지, SNS 게시물/동영상, 유튜브 통계 테이블에 복합 인덱스 추가
+- 세션별 메시지 조회 (session_id + created_at)
+- 영상별 기간 통계 조회 (video_id + date)
+- 연동 계정별 게시물 목록 (connection_id + 게시 시간)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (인덱스 이름, 테이블, 컬럼)
+COMPOSITE_INDEXES = [
+    ("ix_chat_messages_session_created", "chat_messages", "session_id, created_at"),
+    ("ix_youtube_analytics_video_date", "youtube_analytics", "video_id, date"),
+    ("ix_facebook_posts_connection_created", "facebook_posts", "connection_id, created_time"),
+    ("ix_instagram_posts_connection_timestamp", "instagram_posts", "connection_id, timestamp"),
+    ("ix_youtube_videos_connection_published", "youtube_videos", "connection_id, published_at"),
+]
+
+# 복합 인덱스로 대체된 단일 컬럼 인덱스
+REPLACED_INDEXES = [
+    "ix_chat_messages_session_id",
+    "ix_chat_messages_created_at",
+    "ix_youtube_analytics_video_id",
+]
+
+
+def run_migration():
+    """복합 인덱스 추가 및 대체된 단일 인덱스 삭제"""
+
+    with engine.connect() as conn:
+        for index_name, table, columns in COMPOSITE_INDEXES:
+            conn.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {table} ({columns})
+            """))
+            print(f"{index_name} 인덱스 추가 완료")
+
+        for index_name in REPLACED_INDEXES:
+            conn.execute(text(f"""
+                DROP INDEX IF EXISTS {index_name}
+            """))
+            print(f"{index_name} 인덱스 삭제 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,66 @@
+"""
+남아 있는 JSON 컬럼을 모두 JSONB로 변환
+- 브랜드 프로필, SNS 게시물/동영상, 영상 생성 작업, AI 생성 콘텐츠, 발행 콘텐츠 등
+- JSONB는 파싱된 바이너리 형태로 저장되어 읽을 때 다시 파싱하지 않음
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 컬럼) 목록
+JSONB_COLUMNS = [
+    ("brand_analysis", "brand_profile_json"),
+    ("youtube_videos", "tags"),
+    ("youtube_analytics", "traffic_sources"),
+    ("youtube_analytics", "demographics"),
+    ("facebook_connections", "available_pages"),
+    ("video_generation_jobs", "product_analysis"),
+    ("video_generation_jobs", "story_plan"),
+    ("video_generation_jobs", "storyboard"),
+    ("video_generation_jobs", "quality_evaluation"),
+    ("video_generation_jobs", "generated_image_urls"),
+    ("video_generation_jobs", "generated_video_urls"),
+    ("x_posts", "media_urls"),
+    ("x_posts", "referenced_posts"),
+    ("content_generation_sessions", "selected_platforms"),
+    ("content_generation_sessions", "analysis_data"),
+    ("content_generation_sessions", "critique_data"),
+    ("generated_blog_contents", "tags"),
+    ("generated_sns_contents", "hashtags"),
+    ("generated_x_contents", "hashtags"),
+    ("generated_threads_contents", "hashtags"),
+    ("generated_cardnews_contents", "card_image_urls"),
+    ("generated_cardnews_contents", "analysis_data"),
+    ("generated_cardnews_contents", "pages_data"),
+    ("generated_cardnews_contents", "design_settings"),
+    ("published_contents", "tags"),
+    ("published_contents", "image_ids"),
+    ("published_contents", "card_image_urls"),
+    ("wordpress_connections", "categories"),
+    ("wordpress_posts", "categories"),
+    ("wordpress_posts", "tags"),
+]
+
+
+def run_migration():
+    """JSON 컬럼을 JSONB로 변환"""
+
+    with engine.connect() as conn:
+        for table, column in JSONB_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb
+            """))
+            print(f"{table}.{column} JSONB 변환 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
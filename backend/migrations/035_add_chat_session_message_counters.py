@@ -0,0 +1,49 @@
+"""
+chat_sessions 테이블에 메시지 수 캐시 컬럼 추가
+- message_count: 세션별 메시지 수 (목록 조회 시 chat_messages 집계 제거)
+- last_message_at: 마지막 메시지 시각
+- 이후 값은 ChatMessage insert/delete 이벤트 리스너가 갱신
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """message_count, last_message_at 컬럼 추가 및 기존 데이터 채우기"""
+
+    with engine.connect() as conn:
+        conn.execute(text("""
+            ALTER TABLE chat_sessions
+            ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS last_message_at TIMESTAMP WITH TIME ZONE
+        """))
+        print("chat_sessions 컬럼 추가 완료")
+
+        # 채우기 UPDATE로 updated_at(목록 정렬 기준)이 바뀌지 않도록 트리거 잠시 비활성화
+        conn.execute(text("ALTER TABLE chat_sessions DISABLE TRIGGER USER"))
+        conn.execute(text("""
+            UPDATE chat_sessions s
+            SET message_count = m.message_count,
+                last_message_at = m.last_message_at
+            FROM (
+                SELECT session_id, COUNT(*) AS message_count, MAX(created_at) AS last_message_at
+                FROM chat_messages
+                GROUP BY session_id
+            ) m
+            WHERE s.id = m.session_id
+        """))
+        conn.execute(text("ALTER TABLE chat_sessions ENABLE TRIGGER USER"))
+        print("기존 세션 메시지 수 채우기 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,77 @@
+"""
+외래키 컬럼 인덱스 추가 및 대용량 테이블 PK를 BIGINT IDENTITY로 전환
+- 인덱스가 없던 외래키 컬럼에 B-tree 인덱스 추가 (JOIN, CASCADE 삭제 시 순차 스캔 방지)
+- chat_messages, youtube_analytics: id를 BIGINT로 변경하고
+  serial 시퀀스를 IDENTITY (CACHE 1000)로 교체
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 외래키 컬럼)
+FK_COLUMNS = [
+    ("chat_sessions", "user_id"),
+    ("video_generation_jobs", "user_id"),
+    ("credit_transactions", "package_id"),
+    ("facebook_posts", "user_id"),
+    ("instagram_posts", "user_id"),
+    ("threads_posts", "connection_id"),
+    ("threads_posts", "user_id"),
+    ("tiktok_videos", "connection_id"),
+    ("tiktok_videos", "user_id"),
+    ("wordpress_posts", "connection_id"),
+    ("wordpress_posts", "user_id"),
+    ("x_posts", "connection_id"),
+    ("x_posts", "user_id"),
+    ("youtube_videos", "user_id"),
+    ("youtube_analytics", "user_id"),
+]
+
+IDENTITY_TABLES = ["chat_messages", "youtube_analytics"]
+
+
+def run_migration():
+    """외래키 인덱스 추가 및 id 컬럼 BIGINT IDENTITY 전환"""
+
+    with engine.connect() as conn:
+        for table, column in FK_COLUMNS:
+            conn.execute(text(f"""
+                CREATE INDEX IF NOT EXISTS ix_{table}_{column}
+                ON {table} ({column})
+            """))
+            print(f"ix_{table}_{column} 인덱스 추가 완료")
+
+        for table in IDENTITY_TABLES:
+            is_identity = conn.execute(text("""
+                SELECT is_identity FROM information_schema.columns
+                WHERE table_name = :table AND column_name = 'id'
+            """), {"table": table}).scalar()
+
+            if is_identity == "YES":
+                print(f"{table}.id 이미 IDENTITY 컬럼 (건너뜀)")
+                continue
+
+            # serial 기본값/시퀀스 제거 후 타입 변경 (테이블 재작성)
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT"))
+            conn.execute(text(f"DROP SEQUENCE IF EXISTS {table}_id_seq"))
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT"))
+
+            # 기존 최대 id 다음 값부터 발급
+            next_id = conn.execute(text(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")).scalar()
+            conn.execute(text(f"""
+                ALTER TABLE {table} ALTER COLUMN id
+                ADD GENERATED BY DEFAULT AS IDENTITY (START WITH {next_id} CACHE 1000)
+            """))
+            print(f"{table}.id BIGINT IDENTITY 전환 완료 (START WITH {next_id})")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,69 @@
+"""
+SNS 연동 테이블의 OAuth 토큰 컬럼을 AES-GCM 암호화 bytea로 변환
+- text → bytea 타입 변경 후 기존 평문 토큰을 암호화해 다시 저장
+- 실행 전 TOKEN_ENCRYPTION_KEY 환경 변수 설정 필요 (앱과 같은 키 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+from app.models import encrypt_token
+
+# (테이블, 토큰 컬럼)
+TOKEN_COLUMNS = [
+    ("youtube_connections", "access_token"),
+    ("youtube_connections", "refresh_token"),
+    ("facebook_connections", "user_access_token"),
+    ("facebook_connections", "page_access_token"),
+    ("instagram_connections", "user_access_token"),
+    ("instagram_connections", "page_access_token"),
+    ("x_connections", "access_token"),
+    ("x_connections", "refresh_token"),
+    ("threads_connections", "access_token"),
+    ("threads_connections", "refresh_token"),
+    ("tiktok_connections", "access_token"),
+    ("tiktok_connections", "refresh_token"),
+]
+
+
+def run_migration():
+    """토큰 컬럼 bytea 변환 및 기존 토큰 암호화"""
+
+    with engine.connect() as conn:
+        for table, column in TOKEN_COLUMNS:
+            data_type = conn.execute(text("""
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = :table AND column_name = :column
+            """), {"table": table, "column": column}).scalar()
+
+            if data_type != "text":
+                print(f"{table}.{column} 이미 변환됨 (건너뜀)")
+                continue
+
+            # 평문 토큰을 먼저 읽어 둔 뒤 타입 변경
+            rows = conn.execute(text(f"""
+                SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL
+            """)).all()
+
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE BYTEA USING convert_to({column}, 'UTF8')
+            """))
+
+            if rows:
+                conn.execute(
+                    text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+                    [{"id": row_id, "value": encrypt_token(token)} for row_id, token in rows]
+                )
+            print(f"{table}.{column} 암호화 완료 ({len(rows)}건)")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,61 @@
+"""
+같은 컬럼에 중복으로 생성된 인덱스 삭제
+- 예: generated_videos.session_id (UNIQUE 제약조건 인덱스 + 008에서 만든 idx_generated_videos_session_id)
+- 컬럼/연산자 클래스가 같은 인덱스가 여럿이면 제약조건/유니크 인덱스를 남기고 나머지 삭제
+- 제약조건(PK, UNIQUE)이 소유하거나 외래키가 참조하는 인덱스는 삭제하지 않음
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """중복 인덱스 조회 및 삭제"""
+
+    with engine.connect() as conn:
+        duplicates = conn.execute(text("""
+            SELECT dup_class.relname AS index_name, keep_class.relname AS kept_index
+            FROM pg_index dup
+            JOIN pg_class dup_class ON dup_class.oid = dup.indexrelid
+            JOIN pg_namespace ns ON ns.oid = dup_class.relnamespace
+            JOIN LATERAL (
+                SELECT keep.indexrelid
+                FROM pg_index keep
+                WHERE keep.indrelid = dup.indrelid
+                  AND keep.indexrelid <> dup.indexrelid
+                  AND keep.indkey = dup.indkey
+                  AND keep.indclass = dup.indclass
+                  AND keep.indcollation = dup.indcollation
+                  AND keep.indexprs IS NULL
+                  AND keep.indpred IS NULL
+                  AND (keep.indisunique OR NOT dup.indisunique)
+                  AND (
+                      EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = keep.indexrelid)
+                      OR (keep.indisunique AND NOT dup.indisunique)
+                      OR keep.indexrelid < dup.indexrelid
+                  )
+                LIMIT 1
+            ) kept ON TRUE
+            JOIN pg_class keep_class ON keep_class.oid = kept.indexrelid
+            WHERE ns.nspname = 'public'
+              AND dup.indexprs IS NULL
+              AND dup.indpred IS NULL
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = dup.indexrelid)
+            ORDER BY dup_class.relname
+        """)).all()
+
+        for index_name, kept_index in duplicates:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+            print(f"{index_name} 인덱스 삭제 완료 ({kept_index} 유지)")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,39 @@
+"""
+영상 설정 컬럼을 SMALLINT로 변환
+- video_generation_jobs.cut_count (4, 6, 8)
+- video_generation_jobs.duration_seconds, generated_videos.duration_seconds (15, 25, 40)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 컬럼)
+SMALLINT_COLUMNS = [
+    ("video_generation_jobs", "cut_count"),
+    ("video_generation_jobs", "duration_seconds"),
+    ("generated_videos", "duration_seconds"),
+]
+
+
+def run_migration():
+    """INTEGER → SMALLINT 타입 변경"""
+
+    with engine.connect() as conn:
+        for table, column in SMALLINT_COLUMNS:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE SMALLINT
+            """))
+            print(f"{table}.{column} → SMALLINT 변환 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
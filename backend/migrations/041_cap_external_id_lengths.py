@@ -0,0 +1,60 @@
+"""
+인덱스가 걸린 외부 플랫폼 ID 컬럼에 길이 제한 추가 (VARCHAR → VARCHAR(n))
+- 채널/사용자/게시물/미디어 ID, 영상 생성 세션 ID (UUID)
+- 기존 값이 제한보다 길면 변환하지 않고 건너뜀
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+# (테이블, 컬럼, 최대 길이)
+CAPPED_COLUMNS = [
+    ("youtube_connections", "channel_id", 64),
+    ("youtube_videos", "video_id", 32),
+    ("facebook_connections", "facebook_user_id", 64),
+    ("facebook_connections", "page_id", 64),
+    ("facebook_posts", "post_id", 128),
+    ("instagram_connections", "page_id", 64),
+    ("instagram_connections", "instagram_account_id", 64),
+    ("instagram_posts", "media_id", 64),
+    ("video_generation_jobs", "session_id", 64),
+    ("generated_videos", "session_id", 64),
+    ("x_connections", "x_user_id", 64),
+    ("x_posts", "post_id", 64),
+    ("threads_connections", "threads_user_id", 64),
+    ("threads_posts", "threads_post_id", 64),
+    ("tiktok_connections", "tiktok_user_id", 128),
+    ("tiktok_videos", "video_id", 64),
+]
+
+
+def run_migration():
+    """외부 ID 컬럼 길이 제한 추가"""
+
+    with engine.connect() as conn:
+        for table, column, length in CAPPED_COLUMNS:
+            max_length = conn.execute(text(f"""
+                SELECT COALESCE(MAX(length({column})), 0) FROM {table}
+            """)).scalar()
+
+            if max_length > length:
+                print(f"⚠️ {table}.{column} 최대 길이 {max_length} > {length} (건너뜀)")
+                continue
+
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN {column} TYPE VARCHAR({length})
+            """))
+            print(f"{table}.{column} → VARCHAR({length}) 변환 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
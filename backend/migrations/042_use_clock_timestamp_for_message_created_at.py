@@ -0,0 +1,34 @@
+"""
+INSERT가 많은 테이블의 created_at 기본값을 clock_timestamp()로 변경
+- now()는 트랜잭션 시작 시각이라 한 트랜잭션에서 넣은 행들이 같은 시각을 가짐
+- chat_messages, youtube_analytics
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+TABLES = ["chat_messages", "youtube_analytics"]
+
+
+def run_migration():
+    """created_at 기본값 변경"""
+
+    with engine.connect() as conn:
+        for table in TABLES:
+            conn.execute(text(f"""
+                ALTER TABLE {table}
+                ALTER COLUMN created_at SET DEFAULT clock_timestamp()
+            """))
+            print(f"{table}.created_at 기본값 변경 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,37 @@
+"""
+chat_sessions.title을 NOT NULL DEFAULT ''로 변경
+- 제목 없음은 NULL 대신 빈 문자열로 저장 (목록 응답에서는 둘 다 "새 채팅"으로 표시)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.database import engine
+
+
+def run_migration():
+    """NULL 제목을 빈 문자열로 채우고 NOT NULL 제약 추가"""
+
+    with engine.connect() as conn:
+        # 채우기 UPDATE로 updated_at(목록 정렬 기준)이 바뀌지 않도록 트리거 잠시 비활성화
+        conn.execute(text("ALTER TABLE chat_sessions DISABLE TRIGGER USER"))
+        conn.execute(text("UPDATE chat_sessions SET title = '' WHERE title IS NULL"))
+        conn.execute(text("ALTER TABLE chat_sessions ENABLE TRIGGER USER"))
+        print("NULL 제목 채우기 완료")
+
+        conn.execute(text("""
+            ALTER TABLE chat_sessions
+            ALTER COLUMN title SET DEFAULT '',
+            ALTER COLUMN title SET NOT NULL
+        """))
+        print("chat_sessions.title NOT NULL 변경 완료")
+
+        conn.commit()
+
+    print("\n마이그레이션 완료!")
+
+
+if __name__ == "__main__":
+    run_migration()
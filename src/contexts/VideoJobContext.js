@@ -43,7 +43,7 @@ export const VideoJobProvider = ({ children }) => {
   // 작업 상태 조회
   const fetchJobStatus = useCallback(async (jobId) => {
     try {
-      const response = await api.get(`/api/ai-video/jobs/${jobId}`);
+      const response = await api.get(`/api/ai-video/jobs/${jobId}/status`);
       return response.data;
     } catch (error) {
       console.error(`Failed to fetch job ${jobId}:`, error);
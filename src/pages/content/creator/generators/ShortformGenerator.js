@@ -48,7 +48,7 @@ export const startShortformGeneration = async ({
  * @returns {Object} - 작업 상태 정보
  */
 export const checkShortformStatus = async (jobId) => {
-  const statusResponse = await api.get(`/api/ai-video/jobs/${jobId}`);
+  const statusResponse = await api.get(`/api/ai-video/jobs/${jobId}/status`);
   return statusResponse.data;
 };
 